@@ -15,8 +15,7 @@ class DataSubsetterAnalyzer(IAnalyzer):
         self._output_path = output_path
 
     def analyze(self) -> None:
-        data = read_merged_data()
-        subset = data[self._columns]
+        subset = read_merged_data(columns=self._columns)
 
         to_csv(data=subset, output_path=self._output_path)
 
@@ -7,18 +7,20 @@ from pandas import DataFrame
 from tqdm import tqdm
 
 from analysis.analyzer_interface import IAnalyzer
+from component_factory import ComponentFactory
 from consts.data_consts import NAME, ARTIST_NAME, GENRES, GENRE, COUNT
 from consts.miscellaneous_consts import UTF_8_ENCODING
-from consts.path_consts import MERGED_DATA_PATH, GENRES_MAPPING_PATH, GENRES_LABELS_PATH
+from consts.path_consts import GENRES_MAPPING_PATH
+from consts.side_tables_consts import MERGED_DATA_TABLE, GENRES_LABELS_TABLE
 
 
 class GenreAnalyzer(IAnalyzer):
-    def __init__(self, data_path: str = MERGED_DATA_PATH, output_path: Optional[str] = GENRES_MAPPING_PATH):
-        self._data_path = data_path
+    def __init__(self, data_table: str = MERGED_DATA_TABLE, output_path: Optional[str] = GENRES_MAPPING_PATH):
+        self._data_table = data_table
         self._output_path = output_path
 
     def analyze(self) -> None:
-        data = pd.read_csv(self._data_path)
+        data = ComponentFactory.get_side_tables_registry().get(self._data_table, columns=[NAME, ARTIST_NAME, GENRES])
         non_duplicated_data = data.drop_duplicates(subset=[NAME, ARTIST_NAME])
         genres_count = self._get_genres_count(non_duplicated_data)
         genres_count_with_labels = self._merge_genres_labels(genres_count)
@@ -54,7 +56,7 @@ class GenreAnalyzer(IAnalyzer):
 
     @staticmethod
     def _merge_genres_labels(genres_count: DataFrame) -> DataFrame:
-        genres_labels = pd.read_csv(GENRES_LABELS_PATH)
+        genres_labels = ComponentFactory.get_side_tables_registry().get(GENRES_LABELS_TABLE)
         return genres_count.merge(
             right=genres_labels,
             how='left',
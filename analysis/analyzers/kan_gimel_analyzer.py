@@ -5,10 +5,11 @@ import pandas as pd
 from pandas import DataFrame
 
 from analysis.analyzer_interface import IAnalyzer
-from consts.data_consts import NAME, ARTIST_NAME, MAIN_ALBUM, STATION, COUNT, TRACKS, ARTISTS, ALBUMS
-from consts.path_consts import KAN_GIMEL_ANALYZER_OUTPUT_PATH, MERGED_DATA_PATH
+from consts.data_consts import NAME, ARTIST_NAME, MAIN_ALBUM, COUNT, TRACKS, ARTISTS, ALBUMS
+from consts.path_consts import KAN_GIMEL_ANALYZER_OUTPUT_PATH
 from consts.playlists_consts import KAN_GIMEL
 from utils.analysis_utils import aggregate_play_count
+from utils.data_utils import read_merged_data
 
 COUNT_THRESHOLD = 8
 EXCLUDED_ARTISTS = [
@@ -18,13 +19,11 @@ EXCLUDED_ARTISTS = [
 
 
 class KanGimelAnalyzer(IAnalyzer):
-    def __init__(self, data_path: str = MERGED_DATA_PATH, output_path: Optional[str] = KAN_GIMEL_ANALYZER_OUTPUT_PATH):
-        self._data_path = data_path
+    def __init__(self, output_path: Optional[str] = KAN_GIMEL_ANALYZER_OUTPUT_PATH):
         self._output_path = output_path
 
     def analyze(self) -> None:
-        data = pd.read_csv(self._data_path)
-        kan_gimel_data = data[data[STATION] == KAN_GIMEL]
+        kan_gimel_data = read_merged_data(columns=[NAME, ARTIST_NAME, MAIN_ALBUM], stations=[KAN_GIMEL])
         valid_artists_names = self._extract_valid_artists_names(kan_gimel_data)
         valid_kan_gimel_data = kan_gimel_data[kan_gimel_data[ARTIST_NAME].isin(valid_artists_names)]
 
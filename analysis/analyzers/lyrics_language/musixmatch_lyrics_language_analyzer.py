@@ -4,15 +4,14 @@ from typing import Dict, Union, List, Optional
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from analysis.analyzer_interface import IAnalyzer
+from component_factory import ComponentFactory
 from consts.data_consts import ID
 from consts.language_consts import SCORE, LANGUAGE
 from consts.musixmatch_consts import LYRICS_BODY
 from consts.path_consts import MUSIXMATCH_TRACKS_LYRICS_PATH, MUSIXMATCH_TRACKS_LANGUAGES_PATH
 from tools.data_chunks_generator import DataChunksGenerator
-from tools.language_detector import LanguageDetector
 from utils.file_utils import read_json, append_to_csv
 
 
@@ -21,7 +20,7 @@ class MusixmatchLyricsLanguageAnalyzer(IAnalyzer):
         self._chunk_size = chunk_size
         self._chunks_limit = chunks_limit
         self._tracks_lyrics = read_json(MUSIXMATCH_TRACKS_LYRICS_PATH)
-        self._language_detector = LanguageDetector()
+        self._language_detector = ComponentFactory.get_language_detector()
         self._data_chunks_generator = DataChunksGenerator(self._chunk_size, self._chunks_limit)
 
     def analyze(self) -> None:
@@ -44,33 +43,19 @@ class MusixmatchLyricsLanguageAnalyzer(IAnalyzer):
         append_to_csv(data=language_data, output_path=MUSIXMATCH_TRACKS_LANGUAGES_PATH)
 
     def _get_tracks_language_records(self, chunk: List[str]) -> List[Dict[str, Union[str, float]]]:
+        tracks_lyrics = {spotify_id: self._extract_track_lyrics(spotify_id) for spotify_id in chunk}
+        lyrics_ids = [spotify_id for spotify_id, track_lyrics in tracks_lyrics.items() if track_lyrics != ""]
+        detected_records = self._language_detector.detect_many([tracks_lyrics[spotify_id] for spotify_id in lyrics_ids])
+        ids_detected_records = dict(zip(lyrics_ids, detected_records))
         records = []
 
-        with tqdm(total=len(chunk)) as progress_bar:
-            for spotify_id in chunk:
-                progress_bar.update(1)
-                record = self._create_track_language_record(spotify_id)
-
-                if record is not None:
-                    records.append(record)
+        for spotify_id in chunk:
+            language_and_confidence = ids_detected_records.get(spotify_id, {LANGUAGE: np.nan, SCORE: np.nan})
+            language_and_confidence[ID] = spotify_id
+            records.append(language_and_confidence)
 
         return records
 
-    def _create_track_language_record(self, spotify_id: str) -> Dict[str, Union[str, float]]:
-        track_lyrics = self._extract_track_lyrics(spotify_id)
-
-        if track_lyrics == "":
-            return {
-                LANGUAGE: np.nan,
-                SCORE: np.nan,
-                ID: spotify_id
-            }
-
-        language_and_confidence = self._language_detector.detect_language(track_lyrics)
-        language_and_confidence[ID] = spotify_id
-
-        return language_and_confidence
-
     def _extract_track_lyrics(self, spotify_id: str) -> Optional[str]:
         return self._tracks_lyrics.get(spotify_id, {}).get(LYRICS_BODY, "")
 
@@ -4,25 +4,27 @@ from typing import List, Dict, Optional
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from analysis.analyzer_interface import IAnalyzer
+from component_factory import ComponentFactory
 from consts.language_consts import LANGUAGE, SCORE
-from consts.path_consts import SHAZAM_TRACKS_LYRICS_PATH, SHAZAM_TRACKS_LANGUAGES_PATH
+from consts.path_consts import SHAZAM_TRACKS_LANGUAGES_PATH
 from consts.shazam_consts import SHAZAM_TRACK_KEY
+from consts.side_tables_consts import SHAZAM_TRACKS_LYRICS_TABLE
 from tools.data_chunks_generator import DataChunksGenerator
-from tools.language_detector import LanguageDetector
 from utils.data_utils import extract_column_existing_values
-from utils.file_utils import read_json, append_to_csv
+from utils.file_utils import append_to_csv
 
 
 class ShazamLyricsLanguageAnalyzer(IAnalyzer):
     def __init__(self, chunk_size: int = 50, chunks_limit: int = math.inf):
         self._chunk_size = chunk_size
         self._chunks_limit = chunks_limit
-        self._language_detector = LanguageDetector()
+        self._language_detector = ComponentFactory.get_language_detector()
         self._data_chunks_generator = DataChunksGenerator(self._chunk_size, self._chunks_limit)
-        self._shazam_tracks_lyrics: Dict[str, List[str]] = read_json(SHAZAM_TRACKS_LYRICS_PATH)
+        self._shazam_tracks_lyrics: Dict[str, List[str]] = ComponentFactory.get_side_tables_registry().get(
+            SHAZAM_TRACKS_LYRICS_TABLE
+        )
 
     def analyze(self) -> None:
         chunks = self._data_chunks_generator.generate_data_chunks(
@@ -48,32 +50,18 @@ class ShazamLyricsLanguageAnalyzer(IAnalyzer):
         append_to_csv(data=language_data, output_path=SHAZAM_TRACKS_LANGUAGES_PATH)
 
     def _get_tracks_language_records(self, chunk: List[str]) -> List[dict]:
+        lyrics_tracks_ids = [track_id for track_id in chunk if self._shazam_tracks_lyrics[track_id]]
+        concatenated_lyrics = ['\n'.join(self._shazam_tracks_lyrics[track_id]) for track_id in lyrics_tracks_ids]
+        detected_records = dict(zip(lyrics_tracks_ids, self._language_detector.detect_many(concatenated_lyrics)))
         language_records = []
 
-        with tqdm(total=len(chunk)) as progress_bar:
-            for track_id in chunk:
-                track_language_record = self._create_single_track_language_record(track_id)
-                language_records.append(track_language_record)
-                progress_bar.update(1)
+        for track_id in chunk:
+            language_record = detected_records.get(track_id, {LANGUAGE: np.nan, SCORE: np.nan})
+            language_record[SHAZAM_TRACK_KEY] = track_id
+            language_records.append(language_record)
 
         return language_records
 
-    def _create_single_track_language_record(self, track_id: str) -> dict:
-        track_lyrics = self._shazam_tracks_lyrics[track_id]
-
-        if not track_lyrics:
-            return {
-                LANGUAGE: np.nan,
-                SCORE: np.nan,
-                SHAZAM_TRACK_KEY: track_id
-            }
-
-        track_concatenated_lyrics = '\n'.join(track_lyrics)
-        language_record = self._language_detector.detect_language(track_concatenated_lyrics)
-        language_record[SHAZAM_TRACK_KEY] = track_id
-
-        return language_record
-
     @property
     def name(self) -> str:
         return 'shazam lyrics language analyzer'
@@ -6,11 +6,12 @@ import spacy
 from tqdm import tqdm
 
 from analysis.analyzer_interface import IAnalyzer
-from consts.path_consts import SHAZAM_TRACKS_LYRICS_PATH, LYRICS_NERS_PATH
+from component_factory import ComponentFactory
+from consts.path_consts import LYRICS_NERS_PATH, SHAZAM_TRACKS_LYRICS_PATH
 from consts.shazam_consts import SHAZAM_TRACK_KEY
 from tools.data_chunks_generator import DataChunksGenerator
 from utils.data_utils import extract_column_existing_values
-from utils.file_utils import read_json, append_to_csv
+from utils.file_utils import append_to_csv
 
 NER_TEXTS = 'ner_texts'
 NER_LABELS = 'ner_labels'
@@ -21,11 +22,11 @@ class NERAnalyzer(IAnalyzer):
         self._max_chunks_number = max_chunks_number
         self._nlp = spacy.load('en_core_web_lg')  # TODO: Add support for different languages
         self._chunks_generator = DataChunksGenerator()
-        self._data = self._load_lyrics_data()
+        self._lyrics_store = ComponentFactory.get_lyrics_store(SHAZAM_TRACKS_LYRICS_PATH)
 
     def analyze(self) -> None:
         chunks = self._chunks_generator.generate_data_chunks(
-            lst=list(self._data.keys()),
+            lst=self._lyrics_store.ids.tolist(),
             filtering_list=extract_column_existing_values(LYRICS_NERS_PATH, SHAZAM_TRACK_KEY)
         )
 
@@ -36,7 +37,7 @@ class NERAnalyzer(IAnalyzer):
                 break
 
     def _analyze_single_chunk(self, tracks_ids: List[str]) -> None:
-        chunk_lyrics = {track_id: self._data[track_id] for track_id in tracks_ids}
+        chunk_lyrics = self._lyrics_store.get_many(tracks_ids)
         records = self._get_ners_records(chunk_lyrics)
         data = pd.DataFrame.from_records(records)
 
@@ -81,10 +82,6 @@ class NERAnalyzer(IAnalyzer):
 
         return record
 
-    @staticmethod
-    def _load_lyrics_data() -> Dict[str, List[str]]:
-        return read_json(SHAZAM_TRACKS_LYRICS_PATH)
-
     @property
     def name(self) -> str:
         return 'Named entity recognition analyzer'
@@ -1,6 +1,5 @@
 from typing import Dict
 
-import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -10,11 +9,14 @@ from consts.data_consts import SCRAPED_AT, NAME, ARTIST_NAME, SONG
 from consts.media_forest_consts import RANK
 from consts.path_consts import SHAZAM_ISRAEL_DIR_PATH, SHAZAM_ISRAEL_MERGED_DATA, SHAZAM_WORLD_DIR_PATH, \
     SHAZAM_CITIES_DIR_PATH, SHAZAM_APPLE_TRACKS_IDS_MAPPING_OUTPUT_PATH
-from consts.shazam_consts import SHAZAM_RANK, TITLE, SUBTITLE, ISRAEL, WORLD, CITIES, APPLE_MUSIC_TRACK_ID
+from consts.shazam_consts import SHAZAM_RANK, TITLE, SUBTITLE, ISRAEL, WORLD, CITIES, APPLE_MUSIC_TRACK_ID, \
+    SHAZAM_PARTITION_COLUMNS
 from data_processing.data_merger import DataMerger
 from data_processing.pre_processors.language.language_pre_processor import SHAZAM_KEY
+from utils.data_utils import to_snapshots_parquet
 from utils.file_utils import to_csv
 from utils.general_utils import stringify_float
+from utils.song_utils import build_songs
 
 SHAZAM_COLUMNS_MAPPING = {
     KEY: SHAZAM_KEY,
@@ -46,13 +48,9 @@ class ShazamAnalyzer(IAnalyzer):
         print('Saving shazam israeli formatted data')
         data = merged_data_mapping[ISRAEL].copy()
         data.rename(columns=SHAZAM_COLUMNS_MAPPING, inplace=True)
-        data[SONG] = data[[ARTIST_NAME, NAME]].apply(lambda x: self._to_song(*x), axis=1)
+        data[SONG] = build_songs(data[ARTIST_NAME], data[NAME])
 
-        to_csv(data, SHAZAM_ISRAEL_MERGED_DATA)
-
-    @staticmethod
-    def _to_song(artist_name: str, name: str) -> str:
-        return f'{artist_name} - {name}'
+        to_snapshots_parquet(data, SHAZAM_ISRAEL_MERGED_DATA, SHAZAM_PARTITION_COLUMNS)
 
     @staticmethod
     def _output_shazam_key_to_apple_id_mapping(merged_data_mapping: Dict[str, DataFrame]) -> None:
@@ -1,11 +1,21 @@
 import os
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from wikipediaapi import Wikipedia
 
 from consts.env_consts import DATABASE_URL
+from consts.path_consts import LYRICS_STORES_DIR, LANGUAGE_DETECTION_CACHE_PATH
+from consts.side_tables_consts import SIDE_TABLES
 from database.db_client import DBClient
+from tools.datetimes_parser.datetimes_parser import DatetimesParser
+from tools.lyrics_store.lyrics_store import LyricsStore
+from tools.memo_cache.persistent_memo_cache import PersistentMemoCache
+from tools.side_tables.side_tables_registry import SideTablesRegistry
+
+if TYPE_CHECKING:
+    from tools.language_detector import LanguageDetector
 
 
 class ComponentFactory:
@@ -25,3 +35,26 @@ class ComponentFactory:
     def get_database_engine() -> AsyncEngine:
         url = os.environ[DATABASE_URL]
         return create_async_engine(url=url, connect_args={})
+
+    @staticmethod
+    @lru_cache
+    def get_side_tables_registry() -> SideTablesRegistry:
+        return SideTablesRegistry(SIDE_TABLES)
+
+    @staticmethod
+    @lru_cache
+    def get_lyrics_store(source_path: str) -> LyricsStore:
+        return LyricsStore(source_path=source_path, store_dir=LYRICS_STORES_DIR)
+
+    @staticmethod
+    @lru_cache
+    def get_datetimes_parser() -> DatetimesParser:
+        return DatetimesParser()
+
+    @staticmethod
+    @lru_cache
+    def get_language_detector() -> 'LanguageDetector':
+        from tools.language_detector import LanguageDetector  # Loads spacy only for components that detect languages
+
+        cache = PersistentMemoCache(path=LANGUAGE_DETECTION_CACHE_PATH, version=LanguageDetector.get_model_version())
+        return LanguageDetector(cache=cache)
@@ -1,5 +1,11 @@
 from consts.data_consts import MAIN_GENRE, POPULARITY, EXPLICIT, DURATION_MS, IS_ISRAELI, TRACK_NUMBER, RELEASE_DATE, \
-    ID, TYPE, TRACK_HREF, ANALYSIS_URL, ERROR
+    ID, TYPE, TRACK_HREF, ANALYSIS_URL, ERROR, STATION, GENRES, ALBUM_TYPE, ALBUM_GROUP, RELEASE_DATE_PRECISION, \
+    ARTIST_POPULARITY, RELEASE_YEAR, BROADCASTING_YEAR, N_GENRES, AGE, ALBUM_TRACKS_NUMBER, TOTAL_TRACKS, IS_LGBTQ, \
+    IS_REMASTERED, IS_DEAD, DURATION_MINUTES
+from consts.language_consts import LANGUAGE, SCORE
+from consts.lyrics_consts import LYRICS_SOURCE, NUMBER_OF_WORDS
+from consts.openai_consts import ARTIST_GENDER
+from consts.shazam_consts import IS_IN_SHAZAM_200, SHAZAM_RANK
 
 DANCEABILITY = 'danceability'
 ENERGY = 'energy'
@@ -68,3 +74,45 @@ MERGED_DATA_DTYPES = {
     ANALYSIS_URL: str,
     ERROR: str
 }
+MERGED_DATA_COMPACT_DTYPES = {
+    STATION: 'category',
+    GENRES: 'category',
+    MAIN_GENRE: 'category',
+    LANGUAGE: 'category',
+    ALBUM_TYPE: 'category',
+    ALBUM_GROUP: 'category',
+    RELEASE_DATE_PRECISION: 'category',
+    KEY: 'category',
+    LYRICS_SOURCE: 'category',
+    ARTIST_GENDER: 'category',
+    ACOUSTICNESS: 'float32',
+    DANCEABILITY: 'float32',
+    ENERGY: 'float32',
+    INSTRUMENTALNESS: 'float32',
+    LIVENESS: 'float32',
+    LOUDNESS: 'float32',
+    SPEECHINESS: 'float32',
+    TEMPO: 'float32',
+    VALENCE: 'float32',
+    SCORE: 'float32',
+    DURATION_MINUTES: 'float32',
+    MODE: 'Int8',
+    POPULARITY: 'Int8',
+    ARTIST_POPULARITY: 'Int8',
+    N_GENRES: 'Int16',
+    TRACK_NUMBER: 'Int16',
+    TOTAL_TRACKS: 'Int16',
+    ALBUM_TRACKS_NUMBER: 'Int16',
+    RELEASE_YEAR: 'Int16',
+    BROADCASTING_YEAR: 'Int16',
+    AGE: 'Int16',
+    SHAZAM_RANK: 'Int16',
+    DURATION_MS: 'Int32',
+    NUMBER_OF_WORDS: 'Int32',
+    IS_ISRAELI: 'boolean',
+    IS_LGBTQ: 'boolean',
+    IS_REMASTERED: 'boolean',
+    IS_DEAD: 'boolean',
+    IS_IN_SHAZAM_200: 'boolean',
+    EXPLICIT: 'boolean'
+}
@@ -2,6 +2,7 @@ NAME = 'name'
 ARTIST_NAME = 'artist_name'
 ADDED_AT = 'added_at'
 SCRAPED_AT = 'scraped_at'
+SCRAPED_DATE = 'scraped_date'
 STATION = 'station'
 MAIN_GENRE = 'main_genre'
 GENRE = 'genre'
@@ -4,4 +4,5 @@ LANGUAGE = 'language'
 SCORE = 'score'
 HEBREW_LANGUAGE_ABBREVIATION = 'he'
 ENGLISH_LANGUAGE_ABBREVIATION = 'en'
-HEBREW_CHAR_REGEX = re.compile(r'[\u0590-\u05fe]')
\ No newline at end of file
+HEBREW_CHAR_REGEX = re.compile(r'[\u0590-\u05fe]')
+NON_HEBREW_LETTER_REGEX = re.compile(r'[^\W\d_\u0590-\u05fe]')
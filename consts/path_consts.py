@@ -29,13 +29,14 @@ SHAZAM_TRACKS_ABOUT_PATH = rf'{SHAZAM_DIR_PATH}/tracks_about.csv'
 SHAZAM_TRACKS_LYRICS_PATH = rf'{SHAZAM_DIR_PATH}/tracks_lyrics.json'
 SHAZAM_TRACKS_LANGUAGES_PATH = rf'{SHAZAM_DIR_PATH}/tracks_languages.csv'
 SHAZAM_LYRICS_EMBEDDINGS_PATH = rf'{SHAZAM_DIR_PATH}/lyrics_embeddings.csv'
-SHAZAM_ISRAEL_MERGED_DATA = rf'{SHAZAM_DIR_PATH}/israel_merged_data.csv'
+SHAZAM_ISRAEL_MERGED_DATA = rf'{SHAZAM_DIR_PATH}/israel_merged_data'
 SHAZAM_ARTISTS_IDS_PATH = rf'{SHAZAM_DIR_PATH}/artists_ids.csv'
 
 # Spotify
 ARTISTS_IDS_OUTPUT_PATH = rf'{SPOTIFY_DIR_PATH}/spotify_artists_ids.csv'
 ALBUMS_DETAILS_OUTPUT_PATH = rf'{SPOTIFY_DIR_PATH}/spotify_albums_details.csv'
 TRACKS_ALBUMS_DETAILS_OUTPUT_PATH = rf'{SPOTIFY_DIR_PATH}/spotify_tracks_albums_details.csv'
+RADIO_STATIONS_MERGED_SNAPSHOTS_DIR = rf'{SPOTIFY_DIR_PATH}/radio_stations_merged_snapshots'
 RADIO_STATIONS_PLAYLIST_SNAPSHOT_PATH_FORMAT = rf'{SPOTIFY_DIR_PATH}/radio_stations_snapshots/{{}}.csv'
 SPOTIFY_ISRAELI_PLAYLISTS_OUTPUT_PATH = rf'{SPOTIFY_DIR_PATH}/israeli_playlists_artists.csv'
 SPOTIFY_LGBTQ_PLAYLISTS_OUTPUT_PATH = rf'{SPOTIFY_DIR_PATH}/lgbtq_playlists_artists.csv'
@@ -63,6 +64,13 @@ MUSIXMATCH_TRACKS_LYRICS_PATH = rf'{MUSIXMATCH_DIR_PATH}/tracks_lyrics.json'
 MUSIXMATCH_TRACKS_LANGUAGES_PATH = rf'{MUSIXMATCH_DIR_PATH}/tracks_languages.csv'
 
 MERGED_DATA_PATH = r'data/merged_data.csv'
+MERGED_DATA_PARQUET_DIR = r'data/merged_data'
+PRE_PROCESSING_CHECKPOINTS_DIR = r'data/pre_processing_checkpoints'
+PRE_PROCESSING_MANIFEST_PATH = r'data/pre_processing_manifest.json'
+PRE_PROCESSED_KEYS_PATH = r'data/pre_processed_keys.npy'
+PROFILING_REPORTS_DIR = r'data/profiling_reports'
+LYRICS_STORES_DIR = r'data/lyrics_stores'
+LANGUAGE_DETECTION_CACHE_PATH = r'data/cache/language_detection.sqlite'
 AUDIO_FEATURES_CHUNK_OUTPUT_PATH_FORMAT = r'data/audio_features/audio_features_chunks/{}.csv'
 AUDIO_FEATURES_BASE_DIR = r'data/audio_features/audio_features_chunks'
 AUDIO_FEATURES_DATA_PATH = r'data/audio_features/audio_features_merged_data.csv'
@@ -71,7 +79,7 @@ GENRES_LABELS_PATH = r'data\resources\genres_labels.csv'
 GENRES_MAPPING_PATH = r'data/resources/genres_mapping.csv'
 SHAZAM_CHARTS_METADATA_PATH = r'data_collection/shazam/resources/charts_metadata.json'
 OPENAI_GENDERS_PATH = r'data/genders/openai/artists_genders.csv'
-TRACKS_WORD_COUNT_PATH = r'data/lyrics/tracks_word_count.json'
+TRACKS_TERM_MATRIX_PATH = r'data/lyrics/tracks_term_matrix.npz'
 TRANSLATIONS_PATH = r'data/translations.csv'
 WIKIPEDIA_GENDERS_PATH = r'data/genders/wikipedia/artists_genders.csv'
 WIKIPEDIA_ISRAELI_ARTISTS_GENDER_PATH = r'data/genders/wikipedia/israeli_artists_genders.csv'
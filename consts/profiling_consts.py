@@ -0,0 +1,19 @@
+STAGE = 'stage'
+WALL_TIME_SECONDS = 'wall_time_seconds'
+CPU_TIME_SECONDS = 'cpu_time_seconds'
+PEAK_RSS_DELTA_BYTES = 'peak_rss_delta_bytes'
+BYTES_OUT = 'bytes_out'
+PROFILING_DIFF_COLUMNS = [
+    WALL_TIME_SECONDS,
+    CPU_TIME_SECONDS,
+    PEAK_RSS_DELTA_BYTES,
+    BYTES_OUT
+]
+PREVIOUS_SUFFIX = '_previous'
+DIFF_SUFFIX = '_diff'
+PROFILING_REPORT_JSON_SUFFIX = '.json'
+PROFILING_REPORT_CSV_SUFFIX = '.csv'
+PROFILING_DIFF_SUFFIX = '_diff.csv'
+RSS_SAMPLING_INTERVAL_SECONDS = 0.05
+PRE_SCRIPT_ANALYZERS_STAGE = 'pre script analyzers'
+PRE_PROCESSING_STAGE = 'pre processing'
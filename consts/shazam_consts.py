@@ -1,3 +1,5 @@
+from consts.data_consts import SCRAPED_DATE
+
 SHAZAM_TRACK_KEY = "key"
 TRACKS = "tracks"
 TITLE = "title"
@@ -41,3 +43,4 @@ SHAZAM_RANK = "shazam_rank"
 IS_IN_SHAZAM_200 = "is_in_shazam_200"
 FOOTER = "footer"
 WRITERS = "writers"
+SHAZAM_PARTITION_COLUMNS = [SCRAPED_DATE]
@@ -0,0 +1,35 @@
+from consts.data_consts import NAME, ARTIST_NAME, GENRES, SPOTIFY_ID
+from consts.path_consts import MERGED_DATA_PATH, GENRES_LABELS_PATH, SHAZAM_TRACKS_IDS_PATH, SHAZAM_TRACKS_LYRICS_PATH, \
+    TRACKS_IDS_OUTPUT_PATH, SHAZAM_TRACKS_ABOUT_ANALYZER_OUTPUT_PATH, SHAZAM_APPLE_TRACKS_IDS_MAPPING_OUTPUT_PATH, \
+    GENIUS_TRACKS_IDS_OUTPUT_PATH, MUSIXMATCH_TRACK_IDS_PATH
+from consts.shazam_consts import SHAZAM_TRACK_KEY, APPLE_MUSIC_ADAM_ID
+from tools.side_tables.side_table import SideTable
+
+MERGED_DATA_TABLE = 'merged_data'
+GENRES_LABELS_TABLE = 'genres_labels'
+SHAZAM_TRACKS_IDS_TABLE = 'shazam_tracks_ids'
+SHAZAM_TRACKS_LYRICS_TABLE = 'shazam_tracks_lyrics'
+TRACKS_IDS_TABLE = 'tracks_ids'
+SHAZAM_TRACKS_ABOUT_TABLE = 'shazam_tracks_about'
+SHAZAM_APPLE_TRACKS_IDS_MAPPING_TABLE = 'shazam_apple_tracks_ids_mapping'
+GENIUS_TRACKS_IDS_TABLE = 'genius_tracks_ids'
+MUSIXMATCH_TRACK_IDS_TABLE = 'musixmatch_track_ids'
+SIDE_TABLES = {
+    MERGED_DATA_TABLE: SideTable(
+        path=MERGED_DATA_PATH,
+        columns=[NAME, ARTIST_NAME, GENRES],
+        dtypes={NAME: 'str', ARTIST_NAME: 'str', GENRES: 'str'}
+    ),
+    GENRES_LABELS_TABLE: SideTable(path=GENRES_LABELS_PATH),
+    SHAZAM_TRACKS_IDS_TABLE: SideTable(
+        path=SHAZAM_TRACKS_IDS_PATH,
+        columns=[SHAZAM_TRACK_KEY, APPLE_MUSIC_ADAM_ID, SPOTIFY_ID],
+        dtypes={SPOTIFY_ID: 'str'}
+    ),
+    SHAZAM_TRACKS_LYRICS_TABLE: SideTable(path=SHAZAM_TRACKS_LYRICS_PATH),
+    TRACKS_IDS_TABLE: SideTable(path=TRACKS_IDS_OUTPUT_PATH),
+    SHAZAM_TRACKS_ABOUT_TABLE: SideTable(path=SHAZAM_TRACKS_ABOUT_ANALYZER_OUTPUT_PATH),
+    SHAZAM_APPLE_TRACKS_IDS_MAPPING_TABLE: SideTable(path=SHAZAM_APPLE_TRACKS_IDS_MAPPING_OUTPUT_PATH),
+    GENIUS_TRACKS_IDS_TABLE: SideTable(path=GENIUS_TRACKS_IDS_OUTPUT_PATH),
+    MUSIXMATCH_TRACK_IDS_TABLE: SideTable(path=MUSIXMATCH_TRACK_IDS_PATH)
+}
@@ -37,4 +37,11 @@ ALBUMS_COLUMNS_RENAME_MAPPING = {
     ID: ALBUM_ID,
     RELEASE_DATE: ALBUM_RELEASE_DATE
 }
-RAW_ALBUMS_DETAILS_MERGE_COLUMNS = [ARTIST_ID, MAIN_ALBUM]
\ No newline at end of file
+RAW_ALBUMS_DETAILS_MERGE_COLUMNS = [ARTIST_ID, MAIN_ALBUM]
+ALBUMS_DETAILS_AGGREGATED_COLUMNS = [
+    MEDIAN_MARKETS_NUMBER,
+    FIRST_ALBUM_RELEASE_YEAR,
+    LAST_ALBUM_RELEASE_YEAR,
+    YEARS_ACTIVE,
+    *NAMED_ALBUMS_OPTIONS.keys()
+]
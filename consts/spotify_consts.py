@@ -1,3 +1,4 @@
-from consts.data_consts import NAME, ADDED_AT, STATION
+from consts.data_consts import NAME, ADDED_AT, STATION, SCRAPED_DATE
 
 RADIO_SNAPSHOTS_DUPLICATE_COLUMNS = (NAME, ADDED_AT, STATION)
+RADIO_SNAPSHOTS_PARTITION_COLUMNS = [STATION, SCRAPED_DATE]
@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from typing import List
+
+from data_collection.genius.base_genius_collector import BaseGeniusCollector
+
+
+class BaseChunkedGeniusCollector(BaseGeniusCollector):
+    @abstractmethod
+    async def _collect_single_chunk(self, chunk: List[str]) -> None:
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from typing import Optional, Generator, List
+from typing import Optional, Generator
 
 from aiohttp import ClientSession
 
@@ -19,10 +19,6 @@ class BaseGeniusCollector(ABC):
     async def collect(self) -> None:
         raise NotImplementedError
 
-    @abstractmethod
-    async def _collect_single_chunk(self, chunk: List[str]) -> None:
-        raise NotImplementedError
-
     @staticmethod
     def _is_valid_response(response: dict) -> bool:
         return response.get(META, {}).get(STATUS) == 200
@@ -6,7 +6,6 @@ from typing import List, Optional, Dict, Generator
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
@@ -15,6 +14,7 @@ from consts.data_consts import ID
 from consts.genius_consts import PATH, GENIUS_LYRICS_URL_FORMAT, DATA_LYRICS_CONTAINER
 from consts.path_consts import GENIUS_TRACKS_IDS_OUTPUT_PATH, GENIUS_LYRICS_OUTPUT_PATH
 from data_collection.genius.base_genius_collector import BaseGeniusCollector
+from tools.adaptive_aio_pool import AdaptiveAioPool, raise_for_throttling
 from tools.data_chunks_generator import DataChunksGenerator
 from utils.file_utils import read_json, append_dict_to_json
 from utils.general_utils import chain_dicts
@@ -26,23 +26,26 @@ class GeniusLyricsCollector(BaseGeniusCollector):
         self._session = session
         self._lyrics_class_regex = re.compile("^lyrics$|Lyrics__Root")
         self._chunks_generator = DataChunksGenerator(chunk_size, max_chunks_number)
+        self._lyrics_paths: Dict[str, str] = {}
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def collect(self) -> None:
-        await self._chunks_generator.execute_by_chunk(
-            lst=list(self._genius_ids_to_lyrics_paths.keys()),
-            filtering_list=list(self._existing_songs_lyrics.keys()),
-            func=self._collect_single_chunk
+        self._lyrics_paths = self._genius_ids_to_lyrics_paths  # Read once instead of once per fetched song
+        await self._chunks_generator.execute_by_chunk_pipelined(
+            lst=list(self._lyrics_paths.keys()),
+            filtering_list=self._existing_songs_lyrics.keys(),
+            fetch_func=self._fetch_chunk_lyrics,
+            output_func=self._output_chunk_lyrics
         )
 
-    async def _collect_single_chunk(self, chunk: List[str]) -> None:
-        pool = AioPool(AIO_POOL_SIZE)
-
+    async def _fetch_chunk_lyrics(self, chunk: List[str]) -> List[Dict[str, List[str]]]:
         with tqdm(total=len(chunk)) as progress_bar:
             func = partial(self._fetch_single_song, progress_bar)
-            results = await pool.map(func, chunk)
+            results = await self._pool.map(func, chunk)
 
-        valid_results = [result for result in results if isinstance(result, dict)]
+        return [result for result in results if isinstance(result, dict)]
 
+    def _output_chunk_lyrics(self, valid_results: List[Dict[str, List[str]]]) -> None:
         if valid_results:
             data = chain_dicts(valid_results)
             append_dict_to_json(
@@ -52,11 +55,13 @@ class GeniusLyricsCollector(BaseGeniusCollector):
             )
 
     async def _fetch_single_song(self, progress_bar: tqdm, song_id: str) -> Optional[Dict[str, List[str]]]:
-        progress_bar.update(1)
         lyrics_path = self._map_song_id_to_lyrics_path(song_id)
         url = GENIUS_LYRICS_URL_FORMAT.format(lyrics_path)
 
         async with self._session.get(url=url) as raw_response:
+            raise_for_throttling(raw_response)
+            progress_bar.update(1)
+
             if not raw_response.ok:
                 return
 
@@ -65,7 +70,7 @@ class GeniusLyricsCollector(BaseGeniusCollector):
         return self._serialize_response(song_id, response)
 
     def _map_song_id_to_lyrics_path(self, song_id: str) -> str:
-        raw_lyrics_path = self._genius_ids_to_lyrics_paths[song_id]
+        raw_lyrics_path = self._lyrics_paths[song_id]
         return raw_lyrics_path[1:] if raw_lyrics_path.startswith('/') else raw_lyrics_path
 
     def _serialize_response(self, song_id: str, response: str) -> Dict[str, List[str]]:
@@ -4,7 +4,6 @@ from typing import List, Optional
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
@@ -13,13 +12,15 @@ from consts.data_consts import SONG
 from consts.genius_consts import GENIUS_API_SEARCH_URL, RESPONSE, RESULT
 from consts.path_consts import GENIUS_TRACKS_IDS_OUTPUT_PATH
 from consts.shazam_consts import HITS
-from data_collection.genius.base_genius_collector import BaseGeniusCollector
+from data_collection.genius.base_chunked_genius_collector import BaseChunkedGeniusCollector
+from tools.adaptive_aio_pool import AdaptiveAioPool, raise_for_throttling
 from utils.data_utils import extract_column_existing_values, read_merged_data
 
 
-class GeniusSearchCollector(BaseGeniusCollector):
+class GeniusSearchCollector(BaseChunkedGeniusCollector):
     def __init__(self, chunk_size: int, max_chunks_number: int, session: Optional[ClientSession] = None):
         super().__init__(chunk_size, max_chunks_number, session)
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def collect(self) -> None:
         data = self._load_data()
@@ -38,21 +39,21 @@ class GeniusSearchCollector(BaseGeniusCollector):
         return data.reset_index(drop=True)
 
     async def _collect_single_chunk(self, chunk: List[str]) -> None:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(chunk)) as progress_bar:
             func = partial(self._fetch_single_song, progress_bar)
-            records = await pool.map(func, chunk)
+            records = await self._pool.map(func, chunk)
 
         valid_records = [record for record in records if record is not None]
         data = pd.concat(valid_records).reset_index(drop=True)
         self._append_to_csv(data)
 
     async def _fetch_single_song(self, progress_bar: tqdm, song: str) -> Optional[DataFrame]:
-        progress_bar.update(1)
         params = {'q': song}
 
         async with self._session.get(url=GENIUS_API_SEARCH_URL, params=params) as raw_response:
+            raise_for_throttling(raw_response)
+            progress_bar.update(1)
+
             if not raw_response.ok:
                 return
 
@@ -4,7 +4,6 @@ from typing import List, Optional, Dict
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
@@ -12,14 +11,16 @@ from consts.api_consts import AIO_POOL_SIZE
 from consts.data_consts import SONG, ID
 from consts.genius_consts import RESPONSE, GENIUS_API_SONG_URL_FORMAT, IRRELEVANT_SONG_COLLECTOR_KEYS
 from consts.path_consts import GENIUS_TRACKS_IDS_OUTPUT_PATH, GENIUS_SONGS_OUTPUT_PATH
-from data_collection.genius.base_genius_collector import BaseGeniusCollector
+from data_collection.genius.base_chunked_genius_collector import BaseChunkedGeniusCollector
+from tools.adaptive_aio_pool import AdaptiveAioPool, raise_for_throttling
 from utils.file_utils import read_json, append_dict_to_json
 from utils.general_utils import chain_dicts
 
 
-class GeniusSongsCollector(BaseGeniusCollector):
+class GeniusSongsCollector(BaseChunkedGeniusCollector):
     def __init__(self, chunk_size: int, max_chunks_number: int, session: Optional[ClientSession] = None):
         super().__init__(chunk_size, max_chunks_number, session)
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def collect(self) -> None:
         data = self._load_data()
@@ -38,11 +39,9 @@ class GeniusSongsCollector(BaseGeniusCollector):
         return data
 
     async def _collect_single_chunk(self, chunk: List[str]) -> None:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(chunk)) as progress_bar:
             func = partial(self._collect_single_song, progress_bar)
-            results = await pool.map(func, chunk)
+            results = await self._pool.map(func, chunk)
 
         valid_results = [result for result in results if isinstance(result, dict)]
         data = chain_dicts(valid_results)
@@ -54,10 +53,12 @@ class GeniusSongsCollector(BaseGeniusCollector):
         )
 
     async def _collect_single_song(self, progress_bar: tqdm, song_id: str) -> Optional[Dict[str, dict]]:
-        progress_bar.update(1)
         url = GENIUS_API_SONG_URL_FORMAT.format(song_id)
 
         async with self._session.get(url=url) as raw_response:
+            raise_for_throttling(raw_response)
+            progress_bar.update(1)
+
             if not raw_response.ok:
                 return
 
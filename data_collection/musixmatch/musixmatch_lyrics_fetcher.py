@@ -4,13 +4,13 @@ from functools import partial
 from typing import List, Dict, Optional, Tuple, Iterator
 
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from tqdm import tqdm
 
 from consts.api_consts import AIO_POOL_SIZE
 from consts.musixmatch_consts import MUSIXMATCH_API_KEY, DAILY_REQUESTS_LIMIT, \
     MUSIXMATCH_HEADERS, MUSIXMATCH_LYRICS_URL_FORMAT, MUSIXMATCH_TRACK_ID, LYRICS, BODY, MESSAGE
 from consts.path_consts import MUSIXMATCH_TRACK_IDS_PATH, MUSIXMATCH_TRACKS_LYRICS_PATH
+from tools.adaptive_aio_pool import AdaptiveAioPool, raise_for_throttling
 from utils.file_utils import to_json, read_json, append_dict_to_json
 
 
@@ -18,6 +18,7 @@ class MusixmatchLyricsFetcher:
     def __init__(self, request_limit: int = DAILY_REQUESTS_LIMIT):
         self._api_key = os.environ[MUSIXMATCH_API_KEY]
         self._request_limit = request_limit
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def fetch_tracks_lyrics(self) -> None:
         tracks_ids = list(self._track_ids.keys())
@@ -47,27 +48,27 @@ class MusixmatchLyricsFetcher:
         return self._get_valid_responses(zipped_responses_and_ids)
 
     async def _fetch_raw_responses(self, spotify_track_ids: List[str]) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         async with ClientSession(headers=MUSIXMATCH_HEADERS) as session:
             with tqdm(total=len(spotify_track_ids)) as progress_bar:
                 func = partial(self._get_single_track_lyrics, progress_bar, session)
 
-                return await pool.map(fn=func, iterable=spotify_track_ids)
+                return await self._pool.map(fn=func, iterable=spotify_track_ids)
 
     async def _get_single_track_lyrics(self,
                                        progress_bar: tqdm,
                                        session: ClientSession,
                                        spotify_track_id: str) -> dict:
-        progress_bar.update(1)
         musixmatch_track_id = self._map_spotify_to_musixmatch_track_id(spotify_track_id)
 
         if not musixmatch_track_id:
+            progress_bar.update(1)
             return {}
 
         url = self._build_request_url(musixmatch_track_id)
 
         async with session.get(url=url) as response:
+            raise_for_throttling(response)
+            progress_bar.update(1)
             track_lyrics_response = await response.json(content_type=None)
 
         return track_lyrics_response
@@ -3,7 +3,6 @@ from functools import partial
 from typing import Tuple, List, Dict
 
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
@@ -13,6 +12,7 @@ from consts.musixmatch_consts import MUSIXMATCH_TRACK_SEARCH_URL_FORMAT, MUSIXMA
     MUSIXMATCH_HEADERS, MUSIXMATCH_RELEVANT_COLUMNS
 from consts.path_consts import MUSIXMATCH_TRACK_IDS_PATH
 from data_collection.musixmatch.track_serach_response_reader import TrackSearchResponseReader
+from tools.adaptive_aio_pool import AdaptiveAioPool, raise_for_throttling
 from utils.file_utils import read_json, append_dict_to_json
 
 
@@ -23,6 +23,7 @@ class MusixmatchSearchFetcher:
         self._request_limit = request_limit
         self._api_key = os.environ[MUSIXMATCH_API_KEY]
         self._response_reader = response_reader
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def fetch_tracks_ids(self, data: DataFrame) -> None:
         daily_subset = self._extract_daily_tracks_subset(data)
@@ -63,24 +64,24 @@ class MusixmatchSearchFetcher:
         return valid_responses
 
     async def _fetch_raw_responses(self, data: DataFrame) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
         iterable = [(artist, track) for artist, track in zip(data[ARTIST_NAME], data[NAME])]
 
         async with ClientSession(headers=MUSIXMATCH_HEADERS) as session:
             with tqdm(total=len(data)) as progress_bar:
                 func = partial(self._get_single_track_id, progress_bar, session)
 
-                return await pool.map(fn=func, iterable=iterable)
+                return await self._pool.map(fn=func, iterable=iterable)
 
     async def _get_single_track_id(self,
                                    progress_bar: tqdm,
                                    session: ClientSession,
                                    artist_and_track: Tuple[str, str]) -> dict:
-        progress_bar.update(1)
         artist, track = artist_and_track
         url = self._build_request_url(artist, track)
 
         async with session.get(url=url) as response:
+            raise_for_throttling(response)
+            progress_bar.update(1)
             track_search_response = await response.json(content_type=None)
 
         return track_search_response
@@ -3,11 +3,11 @@ from functools import partial
 from typing import Dict, Optional, Generator, List, Any
 
 import pandas as pd
-from asyncio_pool import AioPool
 from tqdm import tqdm
 
 from consts.api_consts import AIO_POOL_SIZE
 from data_collection.openai.openai_client import OpenAIClient
+from tools.adaptive_aio_pool import AdaptiveAioPool
 from tools.data_chunks_generator import DataChunksGenerator
 from utils.file_utils import append_to_csv
 
@@ -23,6 +23,7 @@ class BaseEmbeddingsCollector(ABC):
         self._chunks_limit = chunks_limit
         self._openai_client = openai_client
         self._data_chunks_generator = DataChunksGenerator(self._chunk_size, self._chunks_limit)
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     @abstractmethod
     async def collect(self) -> None:
@@ -35,11 +36,9 @@ class BaseEmbeddingsCollector(ABC):
         append_to_csv(data=data, output_path=self._output_path)
 
     async def _get_embeddings_records(self, chunk: list) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(chunk)) as progress_bar:
             func = partial(self._extract_single_embeddings, progress_bar)
-            records = await pool.map(func, chunk)
+            records = await self._pool.map(func, chunk)
 
         return [record for record in records if isinstance(record, dict)]
 
@@ -24,7 +24,7 @@ class TrackNamesEmbeddingsCollector(BaseEmbeddingsCollector):
 
     @staticmethod
     def _get_track_names_for_unique_ids() -> List[Tuple[str, str, str]]:
-        data = read_merged_data()
+        data = read_merged_data(columns=[ID, NAME, URI])
         data.drop_duplicates(subset=[ID], inplace=True)
 
         return list(data[[ID, NAME, URI]].itertuples(index=False, name=None))
@@ -4,7 +4,6 @@ from functools import partial
 from typing import List, Optional
 
 import pandas as pd
-from asyncio_pool import AioPool
 from shazamio import Shazam
 from tqdm import tqdm
 
@@ -12,12 +11,15 @@ from consts.api_consts import AIO_POOL_SIZE
 from consts.audio_features_consts import KEY
 from consts.data_consts import TOTAL
 from consts.path_consts import SHAZAM_TRACKS_IDS_PATH, SHAZAM_LISTENING_COUNT_PATH
+from tools.adaptive_aio_pool import AdaptiveAioPool
+from tools.throttling_aware_shazam import ThrottlingAwareShazam
 from utils.file_utils import append_to_csv
 
 
 class ShazamListeningCountFetcher:
-    def __init__(self, shazam: Shazam = Shazam()):
+    def __init__(self, shazam: Shazam = ThrottlingAwareShazam()):
         self._shazam = shazam
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def fetch_tracks_listening_count(self, max_tracks: Optional[int] = 1000):
         tracks_ids = self._get_tracks_ids(max_tracks)
@@ -49,16 +51,16 @@ class ShazamListeningCountFetcher:
     async def _fetch_listening_count_records(self, tracks_ids: List[int]) -> List[dict]:
         number_of_tracks = len(tracks_ids)
         print(f'Starting to fetch {number_of_tracks} tracks listening counts using ShazamListeningCountFetcher')
-        pool = AioPool(AIO_POOL_SIZE)
 
         with tqdm(total=number_of_tracks) as progress_bar:
             func = partial(self._fetch_single_track_listening_count, progress_bar)
+            records = await self._pool.map(func, tracks_ids)
 
-            return await pool.map(func, tracks_ids)
+        return [record for record in records if isinstance(record, dict)]  # Throttled tracks are fetched next run
 
     async def _fetch_single_track_listening_count(self, progress_bar: tqdm, track_id: int) -> dict:
-        progress_bar.update(1)
         response = await self._shazam.listening_counter(track_id=track_id)
+        progress_bar.update(1)
 
         if not isinstance(response, dict):
             return {KEY: track_id}
@@ -2,7 +2,6 @@ from functools import partial
 from typing import Dict, List
 
 import pandas as pd
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from shazamio import Shazam
 from tqdm import tqdm
@@ -11,13 +10,16 @@ from consts.api_consts import AIO_POOL_SIZE
 from consts.data_consts import ID, SONG, SPOTIFY_ID
 from consts.path_consts import SHAZAM_TRACKS_IDS_PATH
 from consts.shazam_consts import SHAZAM_TRACK_KEY, HITS, TRACKS, TITLE, HEADING, SUBTITLE, APPLE_MUSIC_ADAM_ID, ARTISTS
+from tools.adaptive_aio_pool import AdaptiveAioPool
+from tools.throttling_aware_shazam import ThrottlingAwareShazam
 from utils.data_utils import extract_column_existing_values
 from utils.file_utils import append_to_csv
 
 
 class ShazamSearchFetcher:
-    def __init__(self, shazam: Shazam = Shazam()):
+    def __init__(self, shazam: Shazam = ThrottlingAwareShazam()):
         self._shazam = shazam
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def search_tracks(self, data: DataFrame, max_tracks: int = 1000) -> None:
         relevant_data = self._extract_relevant_data(data)
@@ -39,17 +41,16 @@ class ShazamSearchFetcher:
     async def _search(self, data: DataFrame) -> List[Dict[str, str]]:
         number_of_tracks = len(data)
         print(f'Starting to fetch {number_of_tracks} tracks ids using ShazamSearchFetcher')
-        pool = AioPool(AIO_POOL_SIZE)
 
         with tqdm(total=number_of_tracks) as progress_bar:
             func = partial(self._search_single_track, progress_bar)
-            tracks = await pool.map(func, data[SONG].tolist())
+            tracks = await self._pool.map(func, data[SONG].tolist())
 
         return [track for track in tracks if isinstance(track, dict)]
 
     async def _search_single_track(self, progress_bar: tqdm, song: str) -> Dict[str, str]:
-        progress_bar.update(1)
         response = await self._shazam.search_track(query=song, limit=1)
+        progress_bar.update(1)
 
         if not isinstance(response, dict):
             return {SONG: song}
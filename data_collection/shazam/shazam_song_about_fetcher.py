@@ -4,7 +4,6 @@ from functools import partial
 from typing import List, Union, Dict, Iterator
 
 import pandas as pd
-from asyncio_pool import AioPool
 from shazamio import Shazam
 from tqdm import tqdm
 
@@ -14,13 +13,16 @@ from consts.path_consts import SHAZAM_TRACKS_ABOUT_PATH, SHAZAM_TRACKS_IDS_PATH,
 from consts.shazam_consts import SHAZAM_TRACK_KEY, TITLE, SUBTITLE, GENRES, PRIMARY, PRIMARY_GENRE, ALBUM_ADAM_ID, \
     TRACK_ADAM_ID, SHAZAM_RELEASE_DATE, SECTIONS, METADATA, TEXT, ALBUM, LABEL, SHAZAM_LYRICS, BEACON_DATA, LYRICS_ID, \
     LYRICS_PROVIDER_NAME, LYRICS_PROVIDER_TRACK_ID, COMMON_TRACK_ID, LYRICS_TEXT, LYRICS_FOOTER
+from tools.adaptive_aio_pool import AdaptiveAioPool
+from tools.throttling_aware_shazam import ThrottlingAwareShazam
 from utils.data_utils import extract_column_existing_values
 from utils.file_utils import read_json, to_json, append_to_csv, append_dict_to_json
 
 
 class ShazamTrackAboutFetcher:
-    def __init__(self, shazam: Shazam = Shazam()):
+    def __init__(self, shazam: Shazam = ThrottlingAwareShazam()):
         self._shazam = shazam
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
         self._existing_tracks = extract_column_existing_values(SHAZAM_TRACKS_ABOUT_PATH, SHAZAM_TRACK_KEY)
 
     async def fetch_tracks_about(self, max_tracks: int) -> None:
@@ -36,11 +38,10 @@ class ShazamTrackAboutFetcher:
     async def _fetch_records(self, max_tracks: int) -> List[dict]:
         relevant_tracks_ids = self._get_relevant_tracks_ids(max_tracks)
         print('Starting to fetch tracks about records')
-        pool = AioPool(AIO_POOL_SIZE)
 
         with tqdm(total=len(relevant_tracks_ids)) as progress_bar:
             func = partial(self._fetch_single_track_info, progress_bar)
-            raw_records = await pool.map(func, relevant_tracks_ids)
+            raw_records = await self._pool.map(func, relevant_tracks_ids)
 
         return [record for record in raw_records if isinstance(record, dict)]
 
@@ -73,8 +74,8 @@ class ShazamTrackAboutFetcher:
         return track_id not in self._existing_tracks
 
     async def _fetch_single_track_info(self, progress_bar: tqdm, track_id: int) -> dict:
-        progress_bar.update(1)
         response = await self._shazam.track_about(track_id=track_id)
+        progress_bar.update(1)
 
         return {
             SHAZAM_TRACK_KEY: track_id,
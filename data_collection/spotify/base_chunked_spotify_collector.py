@@ -0,0 +1,16 @@
+from abc import abstractmethod
+
+from data_collection.spotify.base_spotify_collector import BaseSpotifyCollector
+
+
+class BaseChunkedSpotifyCollector(BaseSpotifyCollector):
+    @abstractmethod
+    async def _collect_single_chunk(self, chunk: list) -> None:
+        raise NotImplementedError
+
+    async def _collect_multiple_chunks(self, lst: list, filtering_list: list) -> None:
+        await self._chunks_generator.execute_by_chunk(
+            lst=lst,
+            filtering_list=filtering_list,
+            func=self._collect_single_chunk
+        )
@@ -5,15 +5,14 @@ from typing import List, Optional
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
-from consts.api_consts import AIO_POOL_SIZE, ARTISTS_ALBUMS_URL_FORMAT
+from consts.api_consts import ARTISTS_ALBUMS_URL_FORMAT
 from consts.data_consts import ARTIST_ID, ITEMS, NEXT
 from consts.env_consts import SPOTIFY_ALBUMS_DETAILS_DRIVE_ID
 from consts.path_consts import ARTISTS_IDS_OUTPUT_PATH, ALBUMS_DETAILS_OUTPUT_PATH
-from data_collection.spotify.base_spotify_collector import BaseSpotifyCollector
+from data_collection.spotify.base_chunked_spotify_collector import BaseChunkedSpotifyCollector
 from tools.google_drive.google_drive_upload_metadata import GoogleDriveUploadMetadata
 from utils.data_utils import extract_column_existing_values
 from utils.drive_utils import upload_files_to_drive
@@ -21,7 +20,7 @@ from utils.file_utils import append_to_csv
 from utils.spotify_utils import build_spotify_headers
 
 
-class ArtistsAlbumsDetailsCollector(BaseSpotifyCollector):
+class ArtistsAlbumsDetailsCollector(BaseChunkedSpotifyCollector):
     def __init__(self, session: ClientSession, chunk_size: int, max_chunks_number: Optional[int]):
         super().__init__(session, chunk_size, max_chunks_number)
 
@@ -44,19 +43,17 @@ class ArtistsAlbumsDetailsCollector(BaseSpotifyCollector):
             print('No valid dfs. Skipping append to csv')
 
     async def _get_artists_albums(self, artists_ids: List[str]) -> List[DataFrame]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(artists_ids)) as progress_bar:
             func = partial(self._get_single_artist_albums, progress_bar)
 
-            return await pool.map(fn=func, iterable=artists_ids)
+            return await self._pool.map(fn=func, iterable=artists_ids)
 
     async def _get_single_artist_albums(self,
                                         progress_bar: tqdm,
                                         artist_id: str) -> DataFrame:
-        progress_bar.update(1)
         url = ARTISTS_ALBUMS_URL_FORMAT.format(artist_id)
         albums_pages = await self._fetch_albums_pages(url=url, albums_pages=[])
+        progress_bar.update(1)
         albums_data = self._extract_albums_details(albums_pages)
 
         if not albums_data.empty:
@@ -5,16 +5,15 @@ from typing import List, Dict, Tuple
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
-from consts.api_consts import AIO_POOL_SIZE, TRACKS_URL_FORMAT
+from consts.api_consts import TRACKS_URL_FORMAT
 from consts.data_consts import ARTIST_NAME, ARTISTS, ARTIST_ID
 from consts.data_consts import ID
 from consts.env_consts import SPOTIFY_ARTISTS_IDS_DRIVE_ID
 from consts.path_consts import ARTISTS_IDS_OUTPUT_PATH
-from data_collection.spotify.base_spotify_collector import BaseSpotifyCollector
+from data_collection.spotify.base_chunked_spotify_collector import BaseChunkedSpotifyCollector
 from tools.environment_manager import EnvironmentManager
 from tools.google_drive.google_drive_upload_metadata import GoogleDriveUploadMetadata
 from utils.data_utils import extract_column_existing_values, read_merged_data
@@ -23,13 +22,13 @@ from utils.file_utils import append_to_csv
 from utils.spotify_utils import build_spotify_headers
 
 
-class ArtistsIDsCollector(BaseSpotifyCollector):
+class ArtistsIDsCollector(BaseChunkedSpotifyCollector):
     def __init__(self, session: ClientSession, chunk_size: int, max_chunks_number: int):
         super().__init__(session, chunk_size, max_chunks_number)
 
     async def collect(self, **kwargs):
         EnvironmentManager().set_env_variables()
-        data = read_merged_data()
+        data = read_merged_data(columns=[ARTIST_NAME, ID])
         data.dropna(subset=[ID], inplace=True)
         data.drop_duplicates(subset=[ARTIST_NAME], inplace=True)
         artists_and_track_ids = [(artist, track_id) for artist, track_id in zip(data[ARTIST_NAME], data[ID])]
@@ -48,18 +47,15 @@ class ArtistsIDsCollector(BaseSpotifyCollector):
         self._output_results(artists_ids_data)
 
     async def _get_artists_ids(self, artists_and_track_ids: List[Tuple[str, str]]) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(artists_and_track_ids)) as progress_bar:
             func = partial(self._get_single_track_artist_id, progress_bar)
 
-            return await pool.map(fn=func, iterable=artists_and_track_ids)
+            return await self._pool.map(fn=func, iterable=artists_and_track_ids)
 
     async def _get_single_track_artist_id(self,
                                           progress_bar: tqdm,
                                           artist_and_track_id: Tuple[str, str]) -> Dict[str, str]:
         artist, track_id = artist_and_track_id
-        progress_bar.update(1)
         url = TRACKS_URL_FORMAT.format(track_id)
 
         async with self._session.get(url=url) as raw_response:
@@ -70,12 +66,14 @@ class ArtistsIDsCollector(BaseSpotifyCollector):
             return await self._get_single_track_artist_id(progress_bar, artist_and_track_id)
 
         elif not raw_response.ok:
+            progress_bar.update(1)
             return {
                 ID: track_id,
                 ARTIST_NAME: artist
             }
 
         else:
+            progress_bar.update(1)
             return self._extract_artist_id_from_response(artist, track_id, response)
 
     @staticmethod
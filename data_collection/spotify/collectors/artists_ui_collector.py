@@ -3,7 +3,6 @@ from functools import partial
 from typing import List, Dict
 
 import pandas as pd
-from asyncio_pool import AioPool
 from bs4 import BeautifulSoup
 from selenium.webdriver import Chrome
 from selenium.webdriver.common.by import By
@@ -12,6 +11,7 @@ from tqdm import tqdm
 from consts.data_consts import SCRAPED_AT, ARTIST_ID
 from consts.path_consts import ARTISTS_UI_DETAILS_OUTPUT_PATH
 from consts.spotify_ui_consts import ARTIST_ABOUT_CLICK_BUTTON_CSS_SELECTOR, ARTIST_PAGE_URL_FORMAT
+from tools.adaptive_aio_pool import AdaptiveAioPool
 from tools.data_chunks_generator import DataChunksGenerator
 from tools.website_crawling.html_element import HTMLElement
 from tools.website_crawling.web_element import WebElement
@@ -30,6 +30,7 @@ class SpotifyArtistUICollector:
         self._date = get_current_datetime()
         self._web_elements_extractor = WebElementsExtractor()
         self._data_chunks_generator = DataChunksGenerator(chunk_size, max_chunks_number)
+        self._pool = AdaptiveAioPool(10)
 
     async def collect(self):
         await self._data_chunks_generator.execute_by_chunk(
@@ -40,7 +41,7 @@ class SpotifyArtistUICollector:
 
     @staticmethod
     def _get_unique_artists_ids() -> List[str]:
-        data = read_merged_data()
+        data = read_merged_data(columns=[ARTIST_ID])
         return data[ARTIST_ID].dropna().unique().tolist()
 
     async def _collect_single_chunk(self, chunk: List[str]) -> None:
@@ -53,12 +54,10 @@ class SpotifyArtistUICollector:
             append_to_csv(data, ARTISTS_UI_DETAILS_OUTPUT_PATH)
 
     async def _collect_raw_records(self, artist_ids: List[str]) -> List[dict]:
-        pool = AioPool(10)
-
         with driver_session() as driver:
             with tqdm(total=len(artist_ids)) as progress_bar:
                 func = partial(self._collect_single_artist_wrapper, driver, progress_bar)
-                records = await pool.map(func, artist_ids)
+                records = await self._pool.map(func, artist_ids)
 
         return records
 
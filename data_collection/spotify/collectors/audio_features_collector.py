@@ -4,11 +4,10 @@ from typing import Union, Tuple, List, Optional
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
-from consts.api_consts import AUDIO_FEATURES_URL_FORMAT, AIO_POOL_SIZE
+from consts.api_consts import AUDIO_FEATURES_URL_FORMAT
 from consts.data_consts import NAME, ARTIST_NAME, TRACKS, ITEMS, URI, TRACK
 from consts.env_consts import SPOTIFY_AUDIO_FEATURES_DRIVE_ID
 from consts.path_consts import AUDIO_FEATURES_CHUNK_OUTPUT_PATH_FORMAT, AUDIO_FEATURES_DATA_PATH
@@ -27,12 +26,17 @@ class AudioFeaturesCollector(BaseSpotifyCollector):
         self._sp = get_spotipy()
 
     async def collect(self, **kwargs) -> None:
-        data = read_merged_data()
+        data = read_merged_data(columns=[NAME, ARTIST_NAME])
         data.drop_duplicates(subset=[NAME, ARTIST_NAME], inplace=True)
         artists_and_tracks = [(artist, track) for artist, track in zip(data[ARTIST_NAME], data[NAME])]
         existing_artists_and_tracks = extract_column_existing_values(AUDIO_FEATURES_DATA_PATH, [ARTIST_NAME, NAME])
 
-        await self._collect_multiple_chunks(artists_and_tracks, existing_artists_and_tracks)
+        await self._chunks_generator.execute_by_chunk_pipelined(
+            lst=artists_and_tracks,
+            filtering_list=existing_artists_and_tracks,
+            fetch_func=self._fetch_chunk_features,
+            output_func=self._output_results
+        )
 
     @staticmethod
     def _get_existing_tracks_and_artists() -> List[Tuple[str, str]]:
@@ -44,26 +48,22 @@ class AudioFeaturesCollector(BaseSpotifyCollector):
 
         return [(artist, track) for artist, track in zip(existing_data[ARTIST_NAME], existing_data[NAME])]
 
-    async def _collect_single_chunk(self, chunk: List[Tuple[str, str]]) -> None:
+    async def _fetch_chunk_features(self, chunk: List[Tuple[str, str]]) -> DataFrame:
         tracks_features = await self._get_tracks_features(chunk)
         valid_features = [feature for feature in tracks_features if isinstance(feature, dict)]
         print(f'Failed to collect audio features for {len(tracks_features) - len(valid_features)} out of {len(tracks_features)} tracks')
-        tracks_features_data = pd.DataFrame.from_records(valid_features)
 
-        self._output_results(tracks_features_data)
+        return pd.DataFrame.from_records(valid_features)
 
     async def _get_tracks_features(self, chunk: List[Tuple[str, str]]) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(chunk)) as progress_bar:
             func = partial(self._get_single_track_features, progress_bar)
 
-            return await pool.map(fn=func, iterable=chunk)
+            return await self._pool.map(fn=func, iterable=chunk)
 
     async def _get_single_track_features(self,
                                          progress_bar: tqdm,
                                          artist_and_track: Tuple[str, str]) -> dict:
-        progress_bar.update(1)
         artist, track = artist_and_track
         url = self._build_request_url(artist, track)
 
@@ -74,6 +74,7 @@ class AudioFeaturesCollector(BaseSpotifyCollector):
             await self._renew_client_session()
             return await self._get_single_track_features(progress_bar, artist_and_track)
 
+        progress_bar.update(1)
         audio_features_response[ARTIST_NAME] = artist
         audio_features_response[NAME] = track
 
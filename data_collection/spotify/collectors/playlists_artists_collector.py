@@ -11,7 +11,7 @@ from consts.data_consts import TRACK, ARTISTS, ARTIST_ID, ID, ARTIST_NAME, NAME,
 from consts.miscellaneous_consts import NAMED_PLAYLISTS, OUTPUT_PATH, RECORD_KEY, RECORD_VALUE
 from consts.path_consts import SPOTIFY_LGBTQ_PLAYLISTS_OUTPUT_PATH
 from consts.playlists_consts import GLOW_PLAYLISTS
-from data_collection.spotify.base_spotify_collector import BaseSpotifyCollector
+from data_collection.spotify.base_chunked_spotify_collector import BaseChunkedSpotifyCollector
 from data_collection.spotify.collectors.playlists_collector import PlaylistsCollector
 from data_collection.spotify.collectors.radio_stations_snapshots.data_classes.playlist import Playlist
 from tools.environment_manager import EnvironmentManager
@@ -20,7 +20,7 @@ from utils.general_utils import chain_lists, binary_search
 from utils.spotify_utils import build_spotify_headers
 
 
-class PlaylistsArtistsCollector(BaseSpotifyCollector):
+class PlaylistsArtistsCollector(BaseChunkedSpotifyCollector):
     def __init__(self, session: ClientSession, chunk_size: int, max_chunks_number: Optional[int]):
         super().__init__(session, chunk_size, max_chunks_number)
         self._session = session
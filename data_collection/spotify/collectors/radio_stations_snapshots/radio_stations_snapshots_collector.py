@@ -4,7 +4,6 @@ from typing import List, Optional
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 
 from consts.api_consts import AIO_POOL_SIZE, ARTISTS_URL_FORMAT
@@ -17,6 +16,7 @@ from data_collection.spotify.collectors.radio_stations_snapshots.data_classes.ar
 from data_collection.spotify.collectors.radio_stations_snapshots.data_classes.playlist import Playlist
 from data_collection.spotify.collectors.radio_stations_snapshots.data_classes.station import Station
 from data_collection.spotify.collectors.radio_stations_snapshots.data_classes.track import Track
+from tools.adaptive_aio_pool import AdaptiveAioPool
 from tools.data_chunks_generator import DataChunksGenerator
 from tools.google_drive.google_drive_upload_metadata import GoogleDriveUploadMetadata
 from utils.datetime_utils import get_current_datetime
@@ -32,6 +32,7 @@ class RadioStationsSnapshotsCollector:
     def __init__(self, session: ClientSession):
         self._session = session
         self._playlists_collector = PlaylistsCollector(self._session)
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def collect(self) -> None:
         print('Starting to run `RadioStationsSnapshotsCollector`')
@@ -57,8 +58,7 @@ class RadioStationsSnapshotsCollector:
         artists_ids = self._get_artists_ids(playlist.tracks)
         chunks_generator = DataChunksGenerator(chunk_size=MAX_ARTISTS_PER_REQUEST, max_chunks_number=None)
         chunks = chunks_generator.generate_data_chunks(lst=artists_ids, filtering_list=None)
-        pool = AioPool(AIO_POOL_SIZE)
-        artists = await pool.map(self._get_single_chunk_artists, chunks)
+        artists = await self._pool.map(self._get_single_chunk_artists, chunks)
         flattened_artists = chain_lists(artists)
 
         return self._serialize_tracks(playlist.tracks, flattened_artists)
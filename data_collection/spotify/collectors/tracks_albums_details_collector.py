@@ -4,29 +4,28 @@ from typing import List, Dict, Optional
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
-from consts.api_consts import AIO_POOL_SIZE, TRACKS_URL_FORMAT
+from consts.api_consts import TRACKS_URL_FORMAT
 from consts.data_consts import ALBUM_ID, ALBUM, ALBUM_GROUP, \
     ALBUM_TYPE, ARTIST_ID, ARTISTS
 from consts.data_consts import ID
 from consts.env_consts import SPOTIFY_TRACKS_IDS_DRIVE_ID
 from consts.path_consts import TRACKS_IDS_OUTPUT_PATH, TRACKS_ALBUMS_DETAILS_OUTPUT_PATH
-from data_collection.spotify.base_spotify_collector import BaseSpotifyCollector
+from data_collection.spotify.base_chunked_spotify_collector import BaseChunkedSpotifyCollector
 from tools.google_drive.google_drive_upload_metadata import GoogleDriveUploadMetadata
 from utils.data_utils import extract_column_existing_values, read_merged_data
 from utils.drive_utils import upload_files_to_drive
 from utils.file_utils import append_to_csv
 
 
-class TracksAlbumsDetailsCollector(BaseSpotifyCollector):
+class TracksAlbumsDetailsCollector(BaseChunkedSpotifyCollector):
     def __init__(self, session: ClientSession, chunk_size: int, max_chunks_number: Optional[int]):
         super().__init__(session, chunk_size, max_chunks_number)
 
     async def collect(self, **kwargs):
-        data = read_merged_data()
+        data = read_merged_data(columns=[ID, ALBUM_ID])
         missing_album_ids_data = data[data[ALBUM_ID].isna()]
         missing_album_ids_data.drop_duplicates(subset=[ID], inplace=True)
         tracks_ids = data[ID].unique().tolist()
@@ -47,19 +46,17 @@ class TracksAlbumsDetailsCollector(BaseSpotifyCollector):
             self._output_results(albums_details_data)
 
     async def _get_albums_details(self, tracks_ids: List[str]) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(tracks_ids)) as progress_bar:
             func = partial(self._get_single_track_album_details, progress_bar)
 
-            return await pool.map(fn=func, iterable=tracks_ids)
+            return await self._pool.map(fn=func, iterable=tracks_ids)
 
     async def _get_single_track_album_details(self, progress_bar: tqdm, track_id: str) -> Dict[str, str]:
-        progress_bar.update(1)
         url = TRACKS_URL_FORMAT.format(track_id)
 
         async with self._session.get(url=url) as raw_response:
             if not raw_response.ok:
+                progress_bar.update(1)
                 return {}
 
             response = await raw_response.json()
@@ -68,6 +65,7 @@ class TracksAlbumsDetailsCollector(BaseSpotifyCollector):
             await self._renew_client_session()
             return await self._get_single_track_album_details(progress_bar, track_id)
 
+        progress_bar.update(1)
         return self._extract_album_details(track_id, response)
 
     def _extract_album_details(self, track_id: str, response: dict) -> Dict[str, str]:
@@ -5,16 +5,15 @@ from typing import List, Dict, Tuple, Optional
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
-from consts.api_consts import AIO_POOL_SIZE, SEARCH_URL
+from consts.api_consts import SEARCH_URL
 from consts.data_consts import ARTIST_NAME, NAME, TRACK, TYPE, TRACKS, ITEMS, URI, SONG
 from consts.data_consts import ID
 from consts.env_consts import SPOTIFY_TRACKS_IDS_DRIVE_ID
 from consts.path_consts import TRACKS_IDS_OUTPUT_PATH
-from data_collection.spotify.base_spotify_collector import BaseSpotifyCollector
+from data_collection.spotify.base_chunked_spotify_collector import BaseChunkedSpotifyCollector
 from tools.environment_manager import EnvironmentManager
 from tools.google_drive.google_drive_upload_metadata import GoogleDriveUploadMetadata
 from utils.data_utils import extract_column_existing_values, read_merged_data
@@ -23,13 +22,13 @@ from utils.file_utils import append_to_csv
 from utils.spotify_utils import build_spotify_headers, build_spotify_query
 
 
-class TracksIDsCollector(BaseSpotifyCollector):
+class TracksIDsCollector(BaseChunkedSpotifyCollector):
     def __init__(self, session: ClientSession, chunk_size: int, max_chunks_number: Optional[int]):
         super().__init__(session, chunk_size, max_chunks_number)
 
     async def collect(self, **kwargs):
         EnvironmentManager().set_env_variables()
-        data = read_merged_data()
+        data = read_merged_data(columns=[ID, SONG, ARTIST_NAME, NAME])
         missing_ids_data = data[data[ID].isna()]
         missing_ids_data.drop_duplicates(subset=[SONG], inplace=True)
         artists_and_tracks_names = self._extract_artists_and_tracks_names(missing_ids_data)
@@ -50,17 +49,14 @@ class TracksIDsCollector(BaseSpotifyCollector):
             self._output_results(tracks_ids_data)
 
     async def _get_tracks_ids(self, artists_and_tracks_names: List[Tuple[str, str]]) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(artists_and_tracks_names)) as progress_bar:
             func = partial(self._get_single_track_id, progress_bar)
 
-            return await pool.map(fn=func, iterable=artists_and_tracks_names)
+            return await self._pool.map(fn=func, iterable=artists_and_tracks_names)
 
     async def _get_single_track_id(self,
                                    progress_bar: tqdm,
                                    artist_and_track_name: Tuple[str, str]) -> Dict[str, str]:
-        progress_bar.update(1)
         artist, track_name = artist_and_track_name
         params = {
             'q': build_spotify_query(artist, track_name),
@@ -69,6 +65,7 @@ class TracksIDsCollector(BaseSpotifyCollector):
 
         async with self._session.get(url=SEARCH_URL, params=params) as raw_response:
             if not raw_response.ok:
+                progress_bar.update(1)
                 return {
                     NAME: track_name,
                     ARTIST_NAME: artist
@@ -80,6 +77,7 @@ class TracksIDsCollector(BaseSpotifyCollector):
             return await self._get_single_track_id(progress_bar, artist_and_track_name)
 
         else:
+            progress_bar.update(1)
             return self._extract_track_id_and_uri_from_response(artist, track_name, response)
 
     @staticmethod
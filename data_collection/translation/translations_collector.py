@@ -1,11 +1,10 @@
 import os
 import uuid
 from functools import partial
-from typing import List, Dict
+from typing import List, Dict, Set
 
 import pandas as pd
 from aiohttp import ClientSession
-from asyncio_pool import AioPool
 from pandas import DataFrame
 from tqdm import tqdm
 
@@ -18,15 +17,17 @@ from consts.miscellaneous_consts import UTF_8_ENCODING
 from consts.path_consts import TRANSLATIONS_PATH
 from consts.rapid_api_consts import CONTENT_TYPE
 from data_collection.translation.translators.microsoft_translator import MicrosoftTranslator
+from tools.adaptive_aio_pool import AdaptiveAioPool
 from tools.data_chunks_generator import DataChunksGenerator
 from utils.data_utils import read_merged_data
 from utils.file_utils import append_to_csv
-from utils.general_utils import chain_dicts, is_in_hebrew
+from utils.general_utils import chain_dicts, are_in_hebrew
 
 
 class TranslationsCollector:
     def __init__(self, chunk_size: int = 50, max_chunks_number: int = 5):
         self._data_chunks_generator = DataChunksGenerator(chunk_size, max_chunks_number)
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
 
     async def collect(self):
         await self._data_chunks_generator.execute_by_chunk(
@@ -46,8 +47,7 @@ class TranslationsCollector:
 
     @staticmethod
     def _load_artists_names() -> List[str]:
-        data = read_merged_data()
-        israeli_data = data[data[IS_ISRAELI] == True]
+        israeli_data = read_merged_data(columns=[ARTIST_NAME], filters=[(IS_ISRAELI, '==', True)])
         israeli_data.dropna(subset=[ARTIST_NAME], inplace=True)
         israeli_artists = israeli_data[ARTIST_NAME].unique().tolist()
 
@@ -61,7 +61,6 @@ class TranslationsCollector:
         append_to_csv(data=data, output_path=TRANSLATIONS_PATH)
 
     async def _collect_translations(self, israeli_artists: List[str]) -> List[dict]:
-        pool = AioPool(AIO_POOL_SIZE)
         headers = {
             MICROSOFT_SUBSCRIPTION_KEY: os.environ['MICROSOFT_TRANSLATOR_KEY'],
             MICROSOFT_SUBSCRIPTION_REGION: MICROSOFT_TRANSLATION_LOCATION,
@@ -69,20 +68,23 @@ class TranslationsCollector:
             CLIENT_TRACE_ID: str(uuid.uuid4())
         }
 
+        hebrew_artists = {
+            artist for artist, is_hebrew in zip(israeli_artists, are_in_hebrew(israeli_artists)) if is_hebrew
+        }
+
         with tqdm(total=len(israeli_artists)) as progress_bar:
             async with ClientSession(headers=headers) as session:
                 translator = MicrosoftTranslator(session)
-                func = partial(self._translate_single_artist_name, translator, progress_bar)
+                func = partial(self._translate_single_artist_name, translator, progress_bar, hebrew_artists)
 
-                return await pool.map(func, israeli_artists)
+                return await self._pool.map(func, israeli_artists)
 
     @staticmethod
     async def _translate_single_artist_name(translator: MicrosoftTranslator,
                                             progress_bar: tqdm,
+                                            hebrew_artists: Set[str],
                                             artist_name: str) -> Dict[str, str]:
-        progress_bar.update(1)
-
-        if is_in_hebrew(artist_name):
+        if artist_name in hebrew_artists:
             translation = artist_name
         else:
             translation = await translator.translate(
@@ -91,6 +93,7 @@ class TranslationsCollector:
                 target_lang=HEBREW_LANGUAGE_ABBREVIATION
             )
 
+        progress_bar.update(1)
         return {artist_name: translation}
 
     @staticmethod
@@ -6,7 +6,6 @@ from functools import partial
 from typing import List, Dict, Tuple
 
 import pandas as pd
-from asyncio_pool import AioPool
 from tqdm import tqdm
 
 from component_factory import ComponentFactory
@@ -15,6 +14,7 @@ from consts.data_consts import ARTIST_NAME
 from consts.datetime_consts import DATETIME_FORMAT
 from consts.path_consts import WIKIPEDIA_AGE_OUTPUT_PATH, HEBREW_MONTHS_MAPPING_PATH
 from consts.wikipedia_consts import WIKIPEDIA_DATETIME_FORMATS, BIRTH_DATE, DEATH_DATE
+from tools.adaptive_aio_pool import AdaptiveAioPool
 from tools.data_chunks_generator import DataChunksGenerator
 from utils.callable_utils import run_async
 from utils.file_utils import append_to_csv, read_json
@@ -25,6 +25,7 @@ class BaseWikipediaAgeCollector(ABC):
     def __init__(self):
         self._punctuation_regex = re.compile(r'[^A-Za-z0-9]+')
         self._data_chunks_generator = DataChunksGenerator()
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)
         self._hebrew_months_mapping = read_json(HEBREW_MONTHS_MAPPING_PATH)
 
     async def collect(self):
@@ -53,21 +54,19 @@ class BaseWikipediaAgeCollector(ABC):
             print('No valid records. skipped appending to CSV')
 
     async def _collect_records(self, artists_details: List[str]) -> List[Dict[str, str]]:
-        pool = AioPool(AIO_POOL_SIZE)
-
         with tqdm(total=len(artists_details)) as progress_bar:
             func = partial(self._collect_single_artist_age, progress_bar)
-            records = await pool.map(func, artists_details)
+            records = await self._pool.map(func, artists_details)
 
         return records
 
     async def _collect_single_artist_age(self, progress_bar: tqdm, artist_detail: str) -> Dict[str, str]:
-        progress_bar.update(1)
         artist_page_name = self._get_artist_wikipedia_name(artist_detail)
         wikipedia_abbreviation = self._get_wikipedia_abbreviation(artist_detail)
         wikipedia = ComponentFactory.get_wikipedia(wikipedia_abbreviation)
         func = partial(wikipedia.page, artist_page_name)
         page = await run_async(func)
+        progress_bar.update(1)
         birth_date, death_date = self._get_birth_and_death_date(page.summary)
 
         return {
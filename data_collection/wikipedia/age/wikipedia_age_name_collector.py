@@ -15,7 +15,7 @@ class WikipediaAgeNameCollector(BaseWikipediaAgeCollector):
         super().__init__()
 
     def _get_contender_artists(self) -> List[str]:
-        data = read_merged_data()
+        data = read_merged_data(columns=[ARTIST_NAME, ARTIST_POPULARITY])
         data.dropna(subset=[ARTIST_NAME], inplace=True)
         data.drop_duplicates(subset=[ARTIST_NAME], inplace=True)
         data.sort_values(by=[ARTIST_POPULARITY], ascending=False, inplace=True)
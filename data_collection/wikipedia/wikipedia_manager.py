@@ -5,7 +5,6 @@ from wikipediaapi import WikipediaPage
 
 from component_factory import ComponentFactory
 from consts.language_consts import HEBREW_LANGUAGE_ABBREVIATION, ENGLISH_LANGUAGE_ABBREVIATION
-from tools.language_detector import LanguageDetector
 from utils.general_utils import is_in_hebrew
 
 
@@ -13,7 +12,6 @@ class WikipediaManager:
     def __init__(self):
         self._he_wiki = ComponentFactory.get_wikipedia(HEBREW_LANGUAGE_ABBREVIATION)
         self._en_wiki = ComponentFactory.get_wikipedia(ENGLISH_LANGUAGE_ABBREVIATION)
-        self._language_detector = LanguageDetector()
 
     def get_page_summary(self, page_title: str) -> str:
         page = self._get_page(page_title)
@@ -1,43 +1,273 @@
 import os
-from functools import reduce
-from typing import Generator, Optional, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Generator, Optional, Iterable, List, Dict, Iterator
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
 from pandas.errors import EmptyDataError
+from pandas.util import hash_pandas_object
 from tqdm import tqdm
 
 from consts.data_consts import NAME, ADDED_AT, STATION, SCRAPED_AT
 from consts.miscellaneous_consts import CSV_FILE_SUFFIX
-from consts.spotify_consts import RADIO_SNAPSHOTS_DUPLICATE_COLUMNS
+from consts.spotify_consts import RADIO_SNAPSHOTS_DUPLICATE_COLUMNS, RADIO_SNAPSHOTS_PARTITION_COLUMNS
+from utils.data_utils import to_snapshots_parquet, read_snapshots_parquet
+from utils.file_utils import read_json, to_json, append_to_csv
+
+MANIFEST_FILE_SUFFIX = '.manifest.json'
+KEYS_FILE_SUFFIX = '.keys.npy'
+MANIFEST_FILES = 'files'
+MANIFEST_OUTPUT = 'output'
+FILE_SIZE = 'size'
+FILE_MODIFIED_AT = 'modified_at'
+PROCESS_POOL_CHUNK_SIZE = 20
+EMPTY_KEYS_HASHES = np.array([], dtype=np.uint64)
 
 
 class DataMerger:
-    def __init__(self, drop_duplicates_on: Iterable[str] = RADIO_SNAPSHOTS_DUPLICATE_COLUMNS):
+    def __init__(self,
+                 drop_duplicates_on: Iterable[str] = RADIO_SNAPSHOTS_DUPLICATE_COLUMNS,
+                 incremental: bool = False,
+                 max_workers: Optional[int] = 1,
+                 partition_columns: List[str] = RADIO_SNAPSHOTS_PARTITION_COLUMNS):
         self._drop_duplicates_on = drop_duplicates_on
+        self._incremental = incremental
+        self._max_workers = max_workers
+        self._partition_columns = partition_columns
 
     def merge(self, dir_path: str, output_path: Optional[str] = None) -> DataFrame:
-        files_data = self._generate_files_data(dir_path)
-        merged_data: DataFrame = reduce(lambda df1, df2: pd.concat([df1, df2]), files_data)
-        non_duplicated_data = merged_data.drop_duplicates(subset=self._drop_duplicates_on)
+        if self._incremental and output_path is not None:
+            self.merge_new_files(dir_path, output_path)
+            return self._read_output(output_path)
+
+        non_duplicated_data = self._merge_files(dir_path, self._list_csv_files(dir_path))
 
         if output_path is not None:
-            non_duplicated_data.to_csv(output_path, index=False)
+            self._write_output(non_duplicated_data, output_path)
 
         return non_duplicated_data
 
-    def _generate_files_data(self, dir_path: str) -> Generator[DataFrame, None, None]:
-        dir_files = os.listdir(dir_path)
+    def merge_new_files(self, dir_path: str, output_path: str) -> DataFrame:
+        # Returns only the rows appended to the output, so callers needing the increment never read the whole archive
+        new_data_chunks = list(self._write_new_files_chunks(dir_path, output_path, chunk_size=None))
+        return pd.concat(new_data_chunks) if new_data_chunks else DataFrame()
+
+    def merge_to_output(self, dir_path: str, output_path: str, chunk_size: int) -> None:
+        # Merged rows are written every chunk size rows and not returned, so memory is bounded by the chunk size
+        if self._incremental:
+            written_chunks = self._write_new_files_chunks(dir_path, output_path, chunk_size)
+        else:
+            written_chunks = self._write_files_chunks(
+                dir_path=dir_path,
+                files_names=self._list_csv_files(dir_path),
+                output_path=output_path,
+                seen_keys_hashes=EMPTY_KEYS_HASHES,
+                mode='w',
+                chunk_size=chunk_size
+            )
+
+        for _ in written_chunks:
+            pass
+
+    def read_keys_hashes(self, output_path: str) -> np.ndarray:
+        return np.load(self._get_keys_path(output_path))
+
+    def _merge_files(self,
+                     dir_path: str,
+                     files_names: List[str],
+                     seen_keys_hashes: np.ndarray = EMPTY_KEYS_HASHES) -> DataFrame:
+        non_duplicated_files_data = list(
+            self._generate_non_duplicated_files_data(dir_path, files_names, seen_keys_hashes)
+        )
+        return pd.concat(non_duplicated_files_data) if non_duplicated_files_data else DataFrame()
+
+    def _write_new_files_chunks(self,
+                                dir_path: str,
+                                output_path: str,
+                                chunk_size: Optional[int]) -> Generator[DataFrame, None, None]:
+        files_fingerprints = {
+            file_name: self._fingerprint(os.path.join(dir_path, file_name))
+            for file_name in self._list_csv_files(dir_path)
+        }
+        merged_files_fingerprints = self._read_manifest(output_path)
+
+        if merged_files_fingerprints is None:
+            print(f'No valid merge manifest was found for `{output_path}`. Merging all files')
+            new_files_names = list(files_fingerprints.keys())
+            existing_keys_hashes = EMPTY_KEYS_HASHES
+            mode = 'w'
+        else:
+            new_files_names = [
+                file_name for file_name, fingerprint in files_fingerprints.items()
+                if merged_files_fingerprints.get(file_name) != fingerprint
+            ]
+            existing_keys_hashes = self.read_keys_hashes(output_path)
+            mode = 'a'
+            print(f'Merging {len(new_files_names)} new files into `{output_path}`')
+
+        keys_hashes = [existing_keys_hashes]
+        for new_data in self._write_files_chunks(
+                dir_path, new_files_names, output_path, existing_keys_hashes, mode, chunk_size):
+            keys_hashes.append(self._hash_duplicates_keys(new_data).values)
+            yield new_data
+
+        if not os.path.exists(output_path):  # No rows were merged yet, so there is no output to fingerprint
+            print(f'No rows were merged into `{output_path}`. Skipping the merge manifest')
+            return
+
+        np.save(self._get_keys_path(output_path), np.concatenate(keys_hashes))
+        self._write_manifest(output_path, files_fingerprints)
+
+    def _write_files_chunks(self,
+                            dir_path: str,
+                            files_names: List[str],
+                            output_path: str,
+                            seen_keys_hashes: np.ndarray,
+                            mode: str,
+                            chunk_size: Optional[int]) -> Generator[DataFrame, None, None]:
+        # Without a chunk size, all files are written as a single chunk
+        chunk_files_data = []
+        chunk_rows_number = 0
+
+        for file_data in self._generate_non_duplicated_files_data(dir_path, files_names, seen_keys_hashes):
+            if file_data.empty:  # E.g. a rewritten snapshot holding only merged rows, which has nothing to write
+                continue
+
+            chunk_files_data.append(file_data)
+            chunk_rows_number += len(file_data)
+
+            if chunk_size is not None and chunk_rows_number >= chunk_size:
+                yield self._write_chunk(chunk_files_data, output_path, mode)
+                chunk_files_data = []
+                chunk_rows_number = 0
+                mode = 'a'
+
+        if chunk_files_data:
+            yield self._write_chunk(chunk_files_data, output_path, mode)
+
+    def _write_chunk(self, files_data: List[DataFrame], output_path: str, mode: str) -> DataFrame:
+        chunk = pd.concat(files_data)
+        self._write_output(chunk, output_path, mode)
+
+        return chunk
+
+    def _generate_non_duplicated_files_data(self,
+                                            dir_path: str,
+                                            files_names: List[str],
+                                            seen_keys_hashes: np.ndarray) -> Generator[DataFrame, None, None]:
+        # Seen hashes are kept in sorted blocks of geometrically decreasing sizes, merged like a binary counter, so
+        # each file is checked by binary search and every hash is re-sorted only a logarithmic number of times
+        seen_keys_hashes_blocks = [np.sort(seen_keys_hashes)]
+
+        for file_data in self._generate_files_data(dir_path, files_names):
+            keys_hashes = self._hash_duplicates_keys(file_data)
+            is_new_key = ~keys_hashes.duplicated().values & ~self._is_seen(keys_hashes.values, seen_keys_hashes_blocks)
+            self._add_seen_keys_hashes(seen_keys_hashes_blocks, keys_hashes.values[is_new_key])
+
+            yield file_data.loc[is_new_key]
+
+    @staticmethod
+    def _add_seen_keys_hashes(sorted_blocks: List[np.ndarray], new_keys_hashes: np.ndarray) -> None:
+        sorted_blocks.append(np.sort(new_keys_hashes))
+
+        while len(sorted_blocks) > 1 and len(sorted_blocks[-2]) <= len(sorted_blocks[-1]):
+            last_block = sorted_blocks.pop()
+            sorted_blocks[-1] = np.sort(np.concatenate([sorted_blocks[-1], last_block]))
+
+    def _is_seen(self, keys_hashes: np.ndarray, sorted_blocks: List[np.ndarray]) -> np.ndarray:
+        is_seen = np.zeros(len(keys_hashes), dtype=bool)
 
-        with tqdm(total=len(dir_files)) as progress_bar:
-            for file_name in dir_files:
+        for sorted_block in sorted_blocks:
+            is_seen |= self._is_in_sorted_block(keys_hashes, sorted_block)
+
+        return is_seen
+
+    @staticmethod
+    def _is_in_sorted_block(keys_hashes: np.ndarray, sorted_seen_keys_hashes: np.ndarray) -> np.ndarray:
+        positions = np.searchsorted(sorted_seen_keys_hashes, keys_hashes)
+        is_in_bounds = positions < len(sorted_seen_keys_hashes)
+        is_seen = np.zeros(len(keys_hashes), dtype=bool)
+        is_seen[is_in_bounds] = sorted_seen_keys_hashes[positions[is_in_bounds]] == keys_hashes[is_in_bounds]
+
+        return is_seen
+
+    def _hash_duplicates_keys(self, data: DataFrame) -> Series:
+        return hash_pandas_object(data[list(self._drop_duplicates_on)], index=False)
+
+    def _write_output(self, data: DataFrame, output_path: str, mode: str = 'w') -> None:
+        if not self._is_csv_file(output_path):
+            to_snapshots_parquet(data, output_path, self._partition_columns, mode)
+
+        elif mode == 'a':
+            append_to_csv(data=data.copy(), output_path=output_path)
+
+        else:
+            data.to_csv(output_path, index=False)
+
+    def _read_output(self, output_path: str) -> DataFrame:
+        if not os.path.exists(output_path):
+            return DataFrame()
+
+        if self._is_csv_file(output_path):
+            return pd.read_csv(output_path)
+
+        return read_snapshots_parquet(output_path)
+
+    def _read_manifest(self, output_path: str) -> Optional[Dict[str, dict]]:
+        manifest_path = self._get_manifest_path(output_path)
+        if not all(os.path.exists(path) for path in [manifest_path, self._get_keys_path(output_path), output_path]):
+            return None
+
+        manifest = read_json(manifest_path)
+        if manifest[MANIFEST_OUTPUT] != self._fingerprint(output_path):  # Output was rewritten outside the merger
+            return None
+
+        return manifest[MANIFEST_FILES]
+
+    def _write_manifest(self, output_path: str, files_fingerprints: Dict[str, dict]) -> None:
+        manifest = {
+            MANIFEST_OUTPUT: self._fingerprint(output_path),
+            MANIFEST_FILES: files_fingerprints
+        }
+        to_json(d=manifest, path=self._get_manifest_path(output_path))
+
+    @staticmethod
+    def _get_manifest_path(output_path: str) -> str:
+        return str(Path(output_path).with_suffix(MANIFEST_FILE_SUFFIX))
+
+    @staticmethod
+    def _get_keys_path(output_path: str) -> str:
+        return str(Path(output_path).with_suffix(KEYS_FILE_SUFFIX))
+
+    @staticmethod
+    def _fingerprint(path: str) -> dict:
+        return {
+            FILE_SIZE: os.path.getsize(path),
+            FILE_MODIFIED_AT: os.path.getmtime(path)
+        }
+
+    def _list_csv_files(self, dir_path: str) -> List[str]:
+        return sorted(file_name for file_name in os.listdir(dir_path) if self._is_csv_file(file_name))
+
+    def _generate_files_data(self, dir_path: str, files_names: List[str]) -> Generator[DataFrame, None, None]:
+        with tqdm(total=len(files_names)) as progress_bar:
+            for file_data in self._read_files(dir_path, files_names):
                 progress_bar.update(1)
 
-                if self._is_csv_file(file_name):
-                    file_data = self._wrap_generate_single_file_data(dir_path, file_name)
+                if file_data is not None:
+                    yield file_data
+
+    def _read_files(self, dir_path: str, files_names: List[str]) -> Iterator[Optional[DataFrame]]:
+        func = partial(self._wrap_generate_single_file_data, dir_path)
 
-                    if file_data is not None:
-                        yield file_data
+        if self._max_workers == 1:
+            yield from map(func, files_names)
+        else:
+            with ProcessPoolExecutor(self._max_workers) as executor:
+                yield from executor.map(func, files_names, chunksize=PROCESS_POOL_CHUNK_SIZE)
 
     def _wrap_generate_single_file_data(self, dir_path: str, file_name: str) -> Optional[DataFrame]:
         try:
@@ -1,5 +1,9 @@
-from typing import List, Optional
+import os
+from functools import partial
+from typing import List, Optional, Iterator
 
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from analysis.analyzer_interface import IAnalyzer
@@ -13,8 +17,10 @@ from analysis.analyzers.musixmatch_lyrics_analyzer import MusixmatchLyricsAnalyz
 from analysis.analyzers.shazam_analyzer import ShazamAnalyzer
 from analysis.analyzers.shazam_tracks_about_analyzer import ShazamTracksAboutAnalyzer
 from consts.miscellaneous_consts import UTF_8_ENCODING
-from consts.path_consts import MERGED_DATA_PATH, RADIO_STATIONS_SNAPSHOTS_DIR
-from consts.spotify_consts import RADIO_SNAPSHOTS_DUPLICATE_COLUMNS
+from consts.path_consts import MERGED_DATA_PATH, RADIO_STATIONS_SNAPSHOTS_DIR, RADIO_STATIONS_MERGED_SNAPSHOTS_DIR, \
+    PRE_PROCESSING_MANIFEST_PATH, PRE_PROCESSED_KEYS_PATH
+from consts.profiling_consts import PRE_SCRIPT_ANALYZERS_STAGE, PRE_PROCESSING_STAGE
+from consts.spotify_consts import RADIO_SNAPSHOTS_DUPLICATE_COLUMNS, RADIO_SNAPSHOTS_PARTITION_COLUMNS
 from data_processing.data_merger import DataMerger
 from data_processing.pre_processors.age_pre_processor import AgePreProcessor
 from data_processing.pre_processors.albums_details_pre_processor import AlbumsDetailsPreProcessor
@@ -34,37 +40,283 @@ from data_processing.pre_processors.tracks_ids_pre_processor import TracksIDSPre
 from data_processing.pre_processors.tracks_lyrics_pre_processor import TracksLyricsPreProcessor
 from data_processing.pre_processors.tracks_lyrics_words_pre_processor import TracksLyricsWordsPreProcessor
 from data_processing.pre_processors.year_pre_processor import YearPreProcessor
+from data_processing.pre_processed_chunks_writer import PreProcessedChunksWriter
+from data_processing.pre_processing_manifest import PreProcessingManifest
+from data_processing.pre_processors_checkpointer import PreProcessorsCheckpointer
+from data_processing.pre_processors_scheduler import PreProcessorsScheduler
+from tools.profiling.stage_profiler import StageProfiler
+from utils.data_utils import to_snapshots_parquet, apply_compact_dtypes, read_snapshots_parquet, \
+    generate_merged_data_chunks, mark_merged_data_parquet_store_updated, generate_snapshots_parquet_chunks
+from utils.file_utils import stringify_parquet_incompatible_columns, to_csv
+
+MERGED_DATA_EXPORT_CHUNK_SIZE = 500000
 
 
 class DataPreProcessor:
-    def __init__(self, max_year: int):
+    def __init__(self,
+                 max_year: int,
+                 incremental_merge: bool = False,
+                 merge_workers: Optional[int] = 1,
+                 pre_processing_workers: Optional[int] = 1,
+                 checkpoints_dir: Optional[str] = None,
+                 incremental_pre_processing: bool = False,
+                 profiling_reports_dir: Optional[str] = None,
+                 chunk_size: Optional[int] = None):
+        if chunk_size is not None:
+            self._validate_chunked_pre_processing(incremental_pre_processing, checkpoints_dir, profiling_reports_dir)
+
         self._max_year = max_year
-        self._data_merger = DataMerger()
+        self._incremental_merge = incremental_merge
+        self._incremental_pre_processing = incremental_pre_processing
+        self._chunk_size = chunk_size
+        self._pre_processing_workers = pre_processing_workers
+        self._data_merger = DataMerger(incremental=incremental_merge, max_workers=merge_workers)
+        self._pre_processing_manifest = PreProcessingManifest(PRE_PROCESSING_MANIFEST_PATH, PRE_PROCESSED_KEYS_PATH)
+        self._profiler = StageProfiler(profiling_reports_dir)
+        self._pre_processors_scheduler = PreProcessorsScheduler(
+            max_workers=pre_processing_workers,
+            checkpointer=None if checkpoints_dir is None else PreProcessorsCheckpointer(checkpoints_dir),
+            profiler=self._profiler
+        )
 
-    def pre_process(self, output_path: Optional[str] = None):
+    def pre_process(self,
+                    output_path: Optional[str] = None,
+                    parquet_output_dir: Optional[str] = None) -> Optional[DataFrame]:
+        if self._chunk_size is not None:
+            self._pre_process_in_chunks(output_path, parquet_output_dir)
+            return
+
+        should_pre_process_incrementally = self._should_pre_process_incrementally(parquet_output_dir)
         print(f'Starting to merge data to single data frame')
-        data = self._data_merger.merge(dir_path=RADIO_STATIONS_SNAPSHOTS_DIR, output_path=MERGED_DATA_PATH)
-        self._run_pre_script_analyzers()
-        pre_processed_data = self._pre_process_data(data)
+        data = self._merge_radio_stations_snapshots(should_pre_process_incrementally)
+        self._export_incremental_merge()
+        self._profiler.run(stage=PRE_SCRIPT_ANALYZERS_STAGE, func=self._run_pre_script_analyzers)
+        merged_keys_hashes = self._get_merged_keys_hashes(data) if self._incremental_pre_processing else None
+        pre_processed_data = self._pre_process_in_memory(
+            data=data,
+            output_path=output_path,
+            parquet_output_dir=parquet_output_dir,
+            should_pre_process_incrementally=should_pre_process_incrementally
+        )
+
+        if self._incremental_pre_processing:
+            self._pre_processing_manifest.write(merged_keys_hashes, self._sorted_pre_processors)
+
+        self._profiler.write_report()
+
+        return pre_processed_data
+
+    def _pre_process_in_memory(self,
+                               data: DataFrame,
+                               output_path: Optional[str],
+                               parquet_output_dir: Optional[str],
+                               should_pre_process_incrementally: bool) -> DataFrame:
+        if should_pre_process_incrementally:
+            pre_processing_func = partial(self._pre_process_incrementally, parquet_output_dir=parquet_output_dir)
+        else:
+            pre_processing_func = self._pre_process_data
+
+        pre_processed_data = self._profiler.run(stage=PRE_PROCESSING_STAGE, func=pre_processing_func, data=data)
 
         if output_path is not None:
             pre_processed_data.to_csv(output_path, encoding=UTF_8_ENCODING, index=False)
 
+        if parquet_output_dir is not None:
+            to_snapshots_parquet(pre_processed_data, parquet_output_dir, RADIO_SNAPSHOTS_PARTITION_COLUMNS)
+            mark_merged_data_parquet_store_updated(parquet_output_dir)
+
         return pre_processed_data
 
+    def _pre_process_in_chunks(self, output_path: Optional[str], parquet_output_dir: Optional[str]) -> None:
+        # The merged data is streamed to disk and read back in chunks, so memory is bounded by the chunk size
+        print(f'Starting to merge data in chunks of {self._chunk_size} rows')
+        self._data_merger.merge_to_output(
+            dir_path=RADIO_STATIONS_SNAPSHOTS_DIR,
+            output_path=self._merged_data_output_path,
+            chunk_size=self._chunk_size
+        )
+        self._export_incremental_merge()
+        self._profiler.run(stage=PRE_SCRIPT_ANALYZERS_STAGE, func=self._run_pre_script_analyzers)
+        self._profiler.run(
+            stage=PRE_PROCESSING_STAGE,
+            func=partial(
+                self._pre_process_merged_data_chunks,
+                output_path=output_path,
+                parquet_output_dir=parquet_output_dir
+            )
+        )
+        self._profiler.write_report()
+
+    def _pre_process_merged_data_chunks(self, output_path: Optional[str], parquet_output_dir: Optional[str]) -> None:
+        # Column local outputs are cached across chunks, so each artist or track is enriched once
+        scheduler = PreProcessorsScheduler(max_workers=self._pre_processing_workers, cache_column_local_outputs=True)
+        pre_processors = self._sorted_pre_processors
+        chunks_writer = PreProcessedChunksWriter(output_path, parquet_output_dir)
+
+        for i, chunk in enumerate(self._generate_merged_data_chunks()):
+            print(f'Starting to pre process chunk {i + 1} of {len(chunk)} rows')
+            compact_chunk = apply_compact_dtypes(chunk)
+            pre_processed_chunk = scheduler.run(compact_chunk, pre_processors)
+            # Merged rows are unique, so rows duplicated by pre processors merges never span different chunks
+            non_duplicated_chunk = pre_processed_chunk.drop_duplicates(subset=RADIO_SNAPSHOTS_DUPLICATE_COLUMNS)
+            chunks_writer.write(apply_compact_dtypes(non_duplicated_chunk))
+
+        chunks_writer.close()
+
+    def _generate_merged_data_chunks(self) -> Iterator[DataFrame]:
+        if self._incremental_merge:
+            return generate_snapshots_parquet_chunks(RADIO_STATIONS_MERGED_SNAPSHOTS_DIR, self._chunk_size)
+
+        return generate_merged_data_chunks(self._chunk_size)
+
+    @property
+    def _merged_data_output_path(self) -> str:
+        # MERGED_DATA_PATH is overwritten by the pre processed data, so the incremental merge keeps its own output
+        return RADIO_STATIONS_MERGED_SNAPSHOTS_DIR if self._incremental_merge else MERGED_DATA_PATH
+
+    @staticmethod
+    def _validate_chunked_pre_processing(incremental_pre_processing: bool,
+                                         checkpoints_dir: Optional[str],
+                                         profiling_reports_dir: Optional[str]) -> None:
+        if incremental_pre_processing:
+            raise ValueError(
+                'Incremental pre processing reads all previously pre processed data into memory, so it cannot be '
+                'combined with a chunk size'
+            )
+
+        if checkpoints_dir is not None:
+            print('Pre processing stages are not checkpointed in chunked mode')
+
+        if profiling_reports_dir is not None:
+            print('Only the pre script analyzers and the pre processing as a whole are profiled in chunked mode')
+
+    def _merge_radio_stations_snapshots(self, should_pre_process_incrementally: bool) -> DataFrame:
+        if self._incremental_merge and should_pre_process_incrementally:
+            return self._merge_new_radio_stations_snapshots()
+
+        return self._data_merger.merge(dir_path=RADIO_STATIONS_SNAPSHOTS_DIR, output_path=self._merged_data_output_path)
+
+    def _merge_new_radio_stations_snapshots(self) -> DataFrame:
+        new_data = self._data_merger.merge_new_files(
+            dir_path=RADIO_STATIONS_SNAPSHOTS_DIR,
+            output_path=RADIO_STATIONS_MERGED_SNAPSHOTS_DIR
+        )
+        merged_keys_hashes = self._data_merger.read_keys_hashes(RADIO_STATIONS_MERGED_SNAPSHOTS_DIR)
+
+        if self._pre_processing_manifest.count_new_keys(merged_keys_hashes) > len(new_data):
+            print('Previously merged rows were not pre processed. Reading all merged data')
+            return self._data_merger.merge(
+                dir_path=RADIO_STATIONS_SNAPSHOTS_DIR,
+                output_path=RADIO_STATIONS_MERGED_SNAPSHOTS_DIR
+            )
+
+        return new_data
+
+    def _export_incremental_merge(self) -> None:
+        # Pre script analyzers read MERGED_DATA_PATH, which still holds the previous run pre processed data when the
+        # incremental merge keeps its own output. The whole merge is copied in chunks, even if only new rows are used
+        if not self._incremental_merge:
+            return
+
+        if not os.path.exists(RADIO_STATIONS_MERGED_SNAPSHOTS_DIR):
+            print('No merged data was found. Pre script analyzers read the existing merged data')
+            return
+
+        print(f'Exporting merged data to `{MERGED_DATA_PATH}` for the pre script analyzers')
+        chunk_size = self._chunk_size or MERGED_DATA_EXPORT_CHUNK_SIZE
+        chunks = generate_snapshots_parquet_chunks(RADIO_STATIONS_MERGED_SNAPSHOTS_DIR, chunk_size)
+
+        for i, chunk in enumerate(chunks):
+            to_csv(data=chunk, output_path=MERGED_DATA_PATH, header=i == 0, mode='w' if i == 0 else 'a')
+
+    def _get_merged_keys_hashes(self, data: DataFrame) -> np.ndarray:
+        if self._incremental_merge:  # Merged data may hold only the new rows, while the merger tracks all rows keys
+            return self._data_merger.read_keys_hashes(RADIO_STATIONS_MERGED_SNAPSHOTS_DIR)
+
+        return self._pre_processing_manifest.hash_keys(data)
+
     def _run_pre_script_analyzers(self) -> None:
         for analyzer in self._pre_script_analyzers:
             print(f'Starting to apply {analyzer.name}')
-            analyzer.analyze()
+            self._profiler.run(stage=analyzer.name, func=analyzer.analyze)
 
-    def _pre_process_data(self, data: DataFrame) -> DataFrame:
-        pre_processed_data = data.copy(deep=True)
+    def _should_pre_process_incrementally(self, parquet_output_dir: Optional[str]) -> bool:
+        if not self._incremental_pre_processing or parquet_output_dir is None:
+            return False
+
+        if not self._pre_processing_manifest.exists() or not os.path.exists(parquet_output_dir):
+            print('No previous pre processing output was found. Pre processing all data')
+            return False
+
+        if self._pre_processing_manifest.has_code_changed(self._sorted_pre_processors):
+            print('Pre processors were changed since the previous run. Pre processing all data')
+            return False
+
+        return True
+
+    def _pre_process_incrementally(self, data: DataFrame, parquet_output_dir: str) -> DataFrame:
+        existing_data = self._refresh_existing_data(read_snapshots_parquet(parquet_output_dir))
+        new_data = self._pre_processing_manifest.filter_new_rows(data)
+
+        if new_data.empty:
+            print('No new rows were found. Returning existing pre processed data')
+            return apply_compact_dtypes(existing_data)
 
-        for pre_processor in self._sorted_pre_processors:
-            print(f'Starting to apply {pre_processor.name}')
-            pre_processed_data = pre_processor.pre_process(pre_processed_data)
+        print(f'Pre processing {len(new_data)} new rows')
+        new_pre_processed_data = self._pre_process_data(new_data)
+        # Lists and dicts of existing rows are read back stringified, so new rows are stringified the same way
+        pre_processed_data = pd.concat(
+            [existing_data, stringify_parquet_incompatible_columns(new_pre_processed_data)],
+            ignore_index=True
+        )
+        non_duplicated_data = pre_processed_data.drop_duplicates(subset=RADIO_SNAPSHOTS_DUPLICATE_COLUMNS)
 
-        return pre_processed_data.drop_duplicates(subset=RADIO_SNAPSHOTS_DUPLICATE_COLUMNS)
+        return apply_compact_dtypes(non_duplicated_data)
+
+    def _refresh_existing_data(self, existing_data: DataFrame) -> DataFrame:
+        # Only column local pre processors can be re-applied on pre processed rows. Other changed side inputs are
+        # applied to new rows only, until the next full pre processing
+        pre_processors = self._sorted_pre_processors
+        changed_pre_processors = self._pre_processing_manifest.get_changed_side_inputs_pre_processors(pre_processors)
+        refreshed_pre_processors = self._get_refreshed_pre_processors(pre_processors, changed_pre_processors)
+        skipped_pre_processors = [
+            pre_processor.name for pre_processor in changed_pre_processors
+            if pre_processor not in refreshed_pre_processors
+        ]
+
+        if skipped_pre_processors:
+            print(f'Side inputs of {", ".join(skipped_pre_processors)} were changed. Existing rows are not refreshed')
+
+        if not refreshed_pre_processors:
+            return existing_data
+
+        scheduler = PreProcessorsScheduler(max_workers=self._pre_processing_workers)
+        refreshed_data = scheduler.run(existing_data, refreshed_pre_processors)
+
+        return stringify_parquet_incompatible_columns(refreshed_data)
+
+    @staticmethod
+    def _get_refreshed_pre_processors(pre_processors: List[IPreProcessor],
+                                      changed_pre_processors: List[IPreProcessor]) -> List[IPreProcessor]:
+        refreshed_pre_processors = []
+        refreshed_columns = set()
+
+        for pre_processor in pre_processors:
+            if pre_processor.input_columns is None or pre_processor.output_columns is None:
+                continue
+
+            # Pre processors reading refreshed columns are refreshed as well
+            if pre_processor in changed_pre_processors or not refreshed_columns.isdisjoint(pre_processor.input_columns):
+                refreshed_pre_processors.append(pre_processor)
+                refreshed_columns.update(pre_processor.output_columns)
+
+        return refreshed_pre_processors
+
+    def _pre_process_data(self, data: DataFrame) -> DataFrame:
+        compact_data = apply_compact_dtypes(data)
+        pre_processed_data = self._pre_processors_scheduler.run(compact_data, self._sorted_pre_processors)
+        non_duplicated_data = pre_processed_data.drop_duplicates(subset=RADIO_SNAPSHOTS_DUPLICATE_COLUMNS)
+        return apply_compact_dtypes(non_duplicated_data)
 
     @property
     def _sorted_pre_processors(self) -> List[IPreProcessor]:
@@ -0,0 +1,70 @@
+import os
+from typing import Optional
+
+from pandas import DataFrame, Series, CategoricalDtype
+
+from consts.spotify_consts import RADIO_SNAPSHOTS_PARTITION_COLUMNS
+from utils.data_utils import to_snapshots_parquet, mark_merged_data_parquet_store_updated
+from utils.file_utils import to_csv
+
+TEMPORARY_FILE_SUFFIX = '.tmp'
+
+
+class PreProcessedChunksWriter:
+    def __init__(self, output_path: Optional[str] = None, parquet_output_dir: Optional[str] = None):
+        self._output_path = output_path
+        self._parquet_output_dir = parquet_output_dir
+        self._dtypes: Optional[Series] = None
+
+    def write(self, chunk: DataFrame) -> None:
+        is_first_chunk = self._dtypes is None
+        if is_first_chunk:
+            self._dtypes = chunk.dtypes
+        else:
+            chunk = self._align_to_first_chunk(chunk)
+
+        if self._output_path is not None:
+            # The output path may be the merged data file the chunks are read from, so it is replaced only at the end
+            to_csv(
+                data=chunk,
+                output_path=self._temporary_output_path,
+                header=is_first_chunk,
+                mode='w' if is_first_chunk else 'a'
+            )
+
+        if self._parquet_output_dir is not None:
+            to_snapshots_parquet(
+                data=chunk,
+                output_dir=self._parquet_output_dir,
+                partition_columns=RADIO_SNAPSHOTS_PARTITION_COLUMNS,
+                mode='w' if is_first_chunk else 'a'
+            )
+
+    def close(self) -> None:
+        if self._dtypes is None:
+            return
+
+        if self._output_path is not None:
+            os.replace(self._temporary_output_path, self._output_path)
+
+        if self._parquet_output_dir is not None:
+            mark_merged_data_parquet_store_updated(self._parquet_output_dir)
+
+    def _align_to_first_chunk(self, chunk: DataFrame) -> DataFrame:
+        # Files of the same parquet dataset must share a schema, e.g. a column missing in one chunk is all NaN
+        aligned_chunk = chunk.reindex(columns=self._dtypes.index)
+
+        for column, dtype in self._dtypes.items():
+            if isinstance(dtype, CategoricalDtype):  # Categories differ between chunks
+                dtype = 'category'
+
+            try:
+                aligned_chunk[column] = aligned_chunk[column].astype(dtype)
+            except (TypeError, ValueError):
+                print(f'Could not convert chunk column `{column}` to `{dtype}`. Keeping `{aligned_chunk[column].dtype}`')
+
+        return aligned_chunk
+
+    @property
+    def _temporary_output_path(self) -> str:
+        return f'{self._output_path}{TEMPORARY_FILE_SUFFIX}'
@@ -0,0 +1,72 @@
+import os
+from typing import List, Optional
+
+import numpy as np
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+
+from consts.spotify_consts import RADIO_SNAPSHOTS_DUPLICATE_COLUMNS
+from data_processing.pre_processors.pre_processor_fingerprint import fingerprint_pre_processor_code, \
+    fingerprint_side_inputs
+from data_processing.pre_processors.pre_processor_interface import IPreProcessor
+from utils.file_utils import read_json, to_json
+
+MANIFEST_PRE_PROCESSORS = 'pre_processors'
+MANIFEST_CODE = 'code'
+MANIFEST_SIDE_INPUTS = 'side_inputs'
+
+
+class PreProcessingManifest:
+    def __init__(self, manifest_path: str, keys_path: str):
+        self._manifest_path = manifest_path
+        self._keys_path = keys_path
+
+    def exists(self) -> bool:
+        return os.path.exists(self._manifest_path) and os.path.exists(self._keys_path)
+
+    def has_code_changed(self, pre_processors: List[IPreProcessor]) -> bool:
+        manifest_pre_processors = read_json(self._manifest_path)[MANIFEST_PRE_PROCESSORS]
+        pre_processors_code = [fingerprint_pre_processor_code(pre_processor) for pre_processor in pre_processors]
+        manifest_pre_processors_code = [pre_processor[MANIFEST_CODE] for pre_processor in manifest_pre_processors]
+
+        return pre_processors_code != manifest_pre_processors_code
+
+    def get_changed_side_inputs_pre_processors(self, pre_processors: List[IPreProcessor]) -> List[IPreProcessor]:
+        manifest_pre_processors = read_json(self._manifest_path)[MANIFEST_PRE_PROCESSORS]
+        changed_pre_processors = []
+
+        for pre_processor, manifest_pre_processor in zip(pre_processors, manifest_pre_processors):
+            if fingerprint_side_inputs(pre_processor) != manifest_pre_processor[MANIFEST_SIDE_INPUTS]:
+                changed_pre_processors.append(pre_processor)
+
+        return changed_pre_processors
+
+    def count_new_keys(self, keys_hashes: np.ndarray) -> int:
+        processed_keys_hashes = np.load(self._keys_path)
+        return int(np.count_nonzero(~np.isin(keys_hashes, processed_keys_hashes)))
+
+    def filter_new_rows(self, data: DataFrame) -> DataFrame:
+        if data.empty:
+            return data
+
+        processed_keys_hashes = np.load(self._keys_path)
+        is_new_row = ~np.isin(self.hash_keys(data), processed_keys_hashes)
+
+        return data.loc[is_new_row]
+
+    def write(self, keys_hashes: np.ndarray, pre_processors: List[IPreProcessor]) -> None:
+        np.save(self._keys_path, np.unique(keys_hashes))
+        manifest = {
+            MANIFEST_PRE_PROCESSORS: [
+                {
+                    MANIFEST_CODE: fingerprint_pre_processor_code(pre_processor),
+                    MANIFEST_SIDE_INPUTS: fingerprint_side_inputs(pre_processor)
+                }
+                for pre_processor in pre_processors
+            ]
+        }
+        to_json(d=manifest, path=self._manifest_path)
+
+    @staticmethod
+    def hash_keys(data: DataFrame) -> np.ndarray:
+        return hash_pandas_object(data[list(RADIO_SNAPSHOTS_DUPLICATE_COLUMNS)], index=False).values
@@ -1,23 +1,24 @@
-from datetime import datetime
-from typing import Union
+from typing import List
 
-import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from component_factory import ComponentFactory
 from consts.data_consts import AGE, IS_DEAD, ARTIST_NAME
 from consts.path_consts import WIKIPEDIA_AGE_OUTPUT_PATH
 from consts.wikipedia_consts import BIRTH_DATE, DEATH_DATE
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
-from utils.datetime_utils import convert_timedelta_to_years
+from utils.datetime_utils import calculate_ages
 from consts.datetime_consts import DATETIME_FORMAT
 
 
 class AgePreProcessor(IPreProcessor):
     def pre_process(self, data: DataFrame) -> DataFrame:
         age_data = pd.read_csv(WIKIPEDIA_AGE_OUTPUT_PATH)
-        age_data[AGE] = age_data[BIRTH_DATE].apply(self._calculate_age)
-        age_data[IS_DEAD] = age_data[[BIRTH_DATE, DEATH_DATE]].apply(lambda x: self._is_artist_dead(*x), axis=1)
+        age_data.drop_duplicates(subset=[ARTIST_NAME], inplace=True)
+        birth_dates = ComponentFactory.get_datetimes_parser().parse(age_data[BIRTH_DATE], DATETIME_FORMAT)
+        age_data[AGE] = calculate_ages(birth_dates)
+        age_data[IS_DEAD] = age_data[DEATH_DATE].notna().where(age_data[BIRTH_DATE].notna())
 
         return data.merge(
             how='left',
@@ -25,23 +26,17 @@ class AgePreProcessor(IPreProcessor):
             right=age_data
         )
 
-    @staticmethod
-    def _calculate_age(birth_date: Union[str, float]) -> Union[int, float]:
-        if pd.isna(birth_date):
-            return np.nan
-
-        serialized_birth_date = datetime.strptime(birth_date, DATETIME_FORMAT)
-        now = datetime.now()
-        age_timedelta = now - serialized_birth_date
-
-        return convert_timedelta_to_years(age_timedelta)
+    @property
+    def input_columns(self) -> List[str]:
+        return [ARTIST_NAME]
 
-    @staticmethod
-    def _is_artist_dead(birth_date: Union[str, float], death_date: Union[str, float]) -> bool:
-        if pd.isna(birth_date):
-            return np.nan
+    @property
+    def output_columns(self) -> List[str]:
+        return [BIRTH_DATE, DEATH_DATE, AGE, IS_DEAD]
 
-        return not pd.isna(death_date)
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [WIKIPEDIA_AGE_OUTPUT_PATH]
 
     @property
     def name(self) -> str:
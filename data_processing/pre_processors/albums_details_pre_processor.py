@@ -1,11 +1,13 @@
+from typing import List
+
 import pandas as pd
 from pandas import DataFrame
 
-from consts.data_consts import ARTIST_NAME, ID, ARTIST_ID, ALBUM_ID
+from consts.data_consts import ARTIST_NAME, ID, ARTIST_ID, ALBUM_ID, MAIN_ALBUM
 from consts.path_consts import ARTISTS_IDS_OUTPUT_PATH, ALBUMS_DETAILS_ANALYZER_OUTPUT_PATH, ALBUMS_DETAILS_OUTPUT_PATH, \
     TRACKS_ALBUMS_DETAILS_OUTPUT_PATH
 from consts.spotify_albums_details_consts import RAW_ALBUMS_DETAILS_RELEVANT_COLUMNS, ALBUMS_COLUMNS_RENAME_MAPPING, \
-    RAW_ALBUMS_DETAILS_MERGE_COLUMNS
+    RAW_ALBUMS_DETAILS_MERGE_COLUMNS, ALBUMS_DETAILS_AGGREGATED_COLUMNS
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
 
 
@@ -19,11 +21,13 @@ class AlbumsDetailsPreProcessor(IPreProcessor):
 
     @staticmethod
     def _merge_artists_ids(data: DataFrame) -> DataFrame:
-        artists_ids_data = pd.read_csv(ARTISTS_IDS_OUTPUT_PATH)
+        artists_ids_data = pd.read_csv(ARTISTS_IDS_OUTPUT_PATH, usecols=[ARTIST_NAME, ARTIST_ID])
+        artists_ids_data.drop_duplicates(subset=[ARTIST_NAME], inplace=True)
+
         return data.merge(
             how='left',
             on=ARTIST_NAME,
-            right=artists_ids_data.drop(ID, axis=1)
+            right=artists_ids_data
         )
 
     @staticmethod
@@ -56,6 +60,30 @@ class AlbumsDetailsPreProcessor(IPreProcessor):
             right=albums_details_aggregated_data
         )
 
+    @property
+    def input_columns(self) -> List[str]:
+        return [ARTIST_NAME, MAIN_ALBUM]
+
+    @property
+    def output_columns(self) -> List[str]:
+        albums_details_columns = [
+            ALBUMS_COLUMNS_RENAME_MAPPING.get(column, column) for column in RAW_ALBUMS_DETAILS_RELEVANT_COLUMNS
+        ]
+        albums_details_non_merge_columns = [
+            column for column in albums_details_columns if column not in RAW_ALBUMS_DETAILS_MERGE_COLUMNS
+        ]
+
+        return [ARTIST_ID, *albums_details_non_merge_columns, *ALBUMS_DETAILS_AGGREGATED_COLUMNS]
+
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [
+            ARTISTS_IDS_OUTPUT_PATH,
+            ALBUMS_DETAILS_OUTPUT_PATH,
+            TRACKS_ALBUMS_DETAILS_OUTPUT_PATH,
+            ALBUMS_DETAILS_ANALYZER_OUTPUT_PATH
+        ]
+
     @property
     def name(self) -> str:
         return 'albums details pre processor'
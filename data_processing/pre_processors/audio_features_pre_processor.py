@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pandas import DataFrame
 
 from consts.audio_features_consts import KEY, KEY_NAMES_MAPPING
@@ -21,8 +23,19 @@ AUDIO_FEATURES_DROP_COLUMNS = [
 class AudioFeaturesPreProcessor(IPreProcessor):
     def __init__(self):
         self._data_merger = DataMerger(drop_duplicates_on=[NAME, ARTIST_NAME])
+        self._audio_features: Optional[DataFrame] = None
 
     def pre_process(self, data: DataFrame) -> DataFrame:
+        if self._audio_features is None:  # Chunked pre processing applies the same instance on every chunk
+            self._audio_features = self._load_audio_features()
+
+        return data.merge(
+            right=self._audio_features,
+            how='left',
+            on=[NAME, ARTIST_NAME]
+        )
+
+    def _load_audio_features(self) -> DataFrame:
         audio_features = self._data_merger.merge(
             dir_path=AUDIO_FEATURES_BASE_DIR,
             output_path=AUDIO_FEATURES_DATA_PATH
@@ -30,11 +43,11 @@ class AudioFeaturesPreProcessor(IPreProcessor):
         audio_features.drop([DURATION_MS, SCRAPED_AT], axis=1, inplace=True)
         audio_features[KEY] = audio_features[KEY].map(KEY_NAMES_MAPPING)
 
-        return data.merge(
-            right=audio_features,
-            how='left',
-            on=[NAME, ARTIST_NAME]
-        )
+        return audio_features
+
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [AUDIO_FEATURES_BASE_DIR]
 
     @property
     def name(self) -> str:
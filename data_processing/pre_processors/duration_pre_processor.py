@@ -1,3 +1,5 @@
+from typing import List
+
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
@@ -23,6 +25,14 @@ class DurationPreProcessor(IPreProcessor):
 
         return duration_ms / (1000 * 60)
 
+    @property
+    def input_columns(self) -> List[str]:
+        return [DURATION_MS]
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [DURATION_MINUTES]
+
     @property
     def name(self) -> str:
         return 'duration pre processor'
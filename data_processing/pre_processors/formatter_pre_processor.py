@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict
 
 from pandas import DataFrame
 
@@ -6,6 +6,7 @@ from consts.data_consts import STATION, SONG, ARTIST_NAME, NAME
 from consts.playlists_consts import SPOTIFY_VIRAL_50_ISRAEL, SPOTIFY_TOP_50_GLOBAL_DAILY, SPOTIFY_TOP_50_ISRAEL_DAILY, \
     SPOTIFY_TOP_50_WEEKLY
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
+from utils.song_utils import build_songs
 
 IRRELEVANT_STATIONS = [
     SPOTIFY_TOP_50_WEEKLY,
@@ -21,7 +22,7 @@ class FormatterPreProcessor(IPreProcessor):
         relevant_stations_data.dropna(subset=[NAME, ARTIST_NAME], inplace=True)
         stations_names_mapping = self._map_raw_stations_to_formatted_stations(data)
         relevant_stations_data[STATION] = relevant_stations_data[STATION].map(stations_names_mapping)
-        relevant_stations_data[SONG] = self._create_song_column(relevant_stations_data)
+        relevant_stations_data[SONG] = build_songs(relevant_stations_data[ARTIST_NAME], relevant_stations_data[NAME])
 
         return relevant_stations_data
 
@@ -40,18 +41,6 @@ class FormatterPreProcessor(IPreProcessor):
 
         return ' '.join(titlized_tokens)
 
-    @staticmethod
-    def _create_song_column(data: DataFrame) -> List[str]:
-        songs = []
-
-        for i, row in data.iterrows():
-            artist_name = row[ARTIST_NAME]
-            name = row[NAME]
-            song_name = f'{artist_name} - {name}'
-            songs.append(song_name)
-
-        return songs
-
     @property
     def name(self) -> str:
         return 'formatter pre processor'
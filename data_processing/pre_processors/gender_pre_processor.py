@@ -1,7 +1,11 @@
+from typing import List
+
 import pandas as pd
 from pandas import DataFrame
 
 from consts.data_consts import ARTIST_NAME
+from consts.gender_consts import SOURCE
+from consts.openai_consts import ARTIST_GENDER
 from consts.path_consts import MAPPED_GENDERS_OUTPUT_PATH
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
 
@@ -9,6 +13,7 @@ from data_processing.pre_processors.pre_processor_interface import IPreProcessor
 class GenderPreProcessor(IPreProcessor):
     def pre_process(self, data: DataFrame) -> DataFrame:
         genders_mapping = pd.read_csv(MAPPED_GENDERS_OUTPUT_PATH)
+        genders_mapping.drop_duplicates(subset=[ARTIST_NAME], inplace=True)
         merged_data = data.merge(
             right=genders_mapping,
             how='left',
@@ -17,6 +22,18 @@ class GenderPreProcessor(IPreProcessor):
 
         return merged_data
 
+    @property
+    def input_columns(self) -> List[str]:
+        return [ARTIST_NAME]
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [ARTIST_GENDER, SOURCE]
+
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [MAPPED_GENDERS_OUTPUT_PATH]
+
     @property
     def name(self) -> str:
         return 'gender pre processor'
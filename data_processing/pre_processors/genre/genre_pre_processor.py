@@ -1,10 +1,11 @@
+from ast import literal_eval
 from collections import Counter
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from pandas import DataFrame
-from tqdm import tqdm
 
 from consts.data_consts import MAIN_GENRE, GENRES, N_GENRES
+from consts.path_consts import GENRES_LABELS_PATH
 from data_processing.pre_processors.genre.main_genre_mapper import MainGenreMapper, OTHER
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
 
@@ -14,32 +15,33 @@ NA = 'N/A'
 class GenrePreProcessor(IPreProcessor):
     def __init__(self):
         self._main_genre_mapper = MainGenreMapper()
+        self._parsed_raw_genres: Dict[str, Tuple[str, int]] = {}
 
     def pre_process(self, data: DataFrame) -> DataFrame:
-        tracks_raw_genres = data[GENRES].unique().tolist()
+        print('Mapping raw genres to main genres and number of genres')
+        main_genres_mapping = {}
+        n_genres_mapping = {}
 
-        main_genres_mapping = self._get_main_genres_mapping(tracks_raw_genres)
-        data[MAIN_GENRE] = data[GENRES].map(main_genres_mapping)
+        for raw_genres in data[GENRES].unique().tolist():
+            main_genres_mapping[raw_genres], n_genres_mapping[raw_genres] = self._parse_raw_genres(raw_genres)
 
-        n_genres_mapping = self._get_n_genres_mapping(tracks_raw_genres)
+        data[MAIN_GENRE] = data[GENRES].map(main_genres_mapping)
         data[N_GENRES] = data[GENRES].map(n_genres_mapping)
 
         return data
 
-    def _get_main_genres_mapping(self, raw_genres: List[str]) -> Dict[str, str]:
-        print('Mapping raw genres to main genres')
-        main_genres = {}
+    def _parse_raw_genres(self, raw_genres: str) -> Tuple[str, int]:
+        parsed_raw_genres = self._parsed_raw_genres.get(raw_genres)
 
-        with tqdm(total=len(raw_genres)) as progress_bar:
-            for track_genres in raw_genres:
-                main_genre = self._get_single_track_main_genre(track_genres)
-                main_genres[track_genres] = main_genre
-                progress_bar.update(1)
+        if parsed_raw_genres is None:
+            genres = self._to_list(raw_genres)
+            parsed_raw_genres = self._get_single_track_main_genre(genres), len(genres)
+            self._parsed_raw_genres[raw_genres] = parsed_raw_genres
 
-        return main_genres
+        return parsed_raw_genres
 
-    def _get_single_track_main_genre(self, raw_genres: str) -> str:
-        main_genres = self._map_raw_genres_to_main_genres(raw_genres)
+    def _get_single_track_main_genre(self, genres: List[str]) -> str:
+        main_genres = [self._main_genre_mapper.map(genre) for genre in genres]
 
         if not main_genres:
             return NA
@@ -51,19 +53,12 @@ class GenrePreProcessor(IPreProcessor):
 
         return self._extract_most_common_main_genre(non_other_main_genres)
 
-    def _map_raw_genres_to_main_genres(self, raw_genres: str) -> List[str]:
-        genres = self._to_list(raw_genres)
-        mapped_genres = []
-
-        for genre in genres:
-            mapped_genre = self._main_genre_mapper.map(genre)
-            mapped_genres.append(mapped_genre)
-
-        return mapped_genres
-
     @staticmethod
     def _to_list(raw_genres: str) -> List[str]:
-        return eval(raw_genres)
+        if not isinstance(raw_genres, str):
+            return []
+
+        return literal_eval(raw_genres)  # Raw genres are stringified lists, so they are parsed without evaluating code
 
     @staticmethod
     def _extract_most_common_main_genre(main_genres: List[str]) -> str:
@@ -73,17 +68,17 @@ class GenrePreProcessor(IPreProcessor):
 
         return genre_name
 
-    def _get_n_genres_mapping(self, raw_genres: List[str]) -> Dict[str, int]:
-        print('Mapping raw genres to number of genres')
-        mapping = {}
+    @property
+    def input_columns(self) -> List[str]:
+        return [GENRES]
 
-        with tqdm(total=len(raw_genres)) as progress_bar:
-            for track_raw_genres in raw_genres:
-                genres = self._to_list(track_raw_genres)
-                mapping[track_raw_genres] = len(genres)
-                progress_bar.update(1)
+    @property
+    def output_columns(self) -> List[str]:
+        return [MAIN_GENRE, N_GENRES]
 
-        return mapping
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [GENRES_LABELS_PATH]
 
     @property
     def name(self) -> str:
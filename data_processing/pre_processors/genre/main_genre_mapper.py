@@ -1,18 +1,36 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
-import pandas as pd
 from nltk import MWETokenizer
 
+from component_factory import ComponentFactory
 from consts.data_consts import GENRE, MAIN_GENRE
-from consts.path_consts import GENRES_LABELS_PATH
+from consts.side_tables_consts import GENRES_LABELS_TABLE
 
 OTHER = 'other'
 TOKENIZER_SEPARATOR = ' '
 
 
 class MainGenreMapper:
+    def __init__(self):
+        self._tagged_genres: Optional[Dict[str, str]] = None
+        self._main_genres: Optional[Set[str]] = None
+        self._tokenizer: Optional[MWETokenizer] = None
+        self._mapped_genres: Dict[str, str] = {}
+
     def map(self, genre: str) -> str:
-        if self._is_genre_tagged(genre):
+        mapped_genre = self._mapped_genres.get(genre)
+
+        if mapped_genre is None:
+            mapped_genre = self._map_single_genre(genre)
+            self._mapped_genres[genre] = mapped_genre
+
+        return mapped_genre
+
+    def _map_single_genre(self, genre: str) -> str:
+        if self._tagged_genres is None:  # Labels are loaded and compiled once, on the first mapped genre
+            self._compile()
+
+        if genre in self._tagged_genres:
             return self._tagged_genres[genre]
 
         contained_main_genre = self._extract_main_genre_if_contained(genre)
@@ -21,21 +39,22 @@ class MainGenreMapper:
 
         return OTHER
 
-    def _is_genre_tagged(self, genre: str) -> bool:
-        return genre in self._tagged_genres.keys()
-
     def _extract_main_genre_if_contained(self, genre: str) -> Optional[str]:
         raw_tokens = genre.split(TOKENIZER_SEPARATOR)
         tokenized_genre = self._tokenizer.tokenize(raw_tokens)
+        contained_main_genres = [token for token in tokenized_genre if token in self._main_genres]
+
+        if contained_main_genres:
+            return min(contained_main_genres)  # Main genres are matched in alphabetical order
 
-        for main_genre in self._main_genres:
-            for token in tokenized_genre:
-                if token == main_genre:
-                    return main_genre
+    def _compile(self) -> None:
+        self._tagged_genres = self._load_tagged_genres()
+        self._main_genres = set(self._tagged_genres.values())
+        self._tokenizer = self._build_tokenizer(sorted(self._main_genres))
 
-    @property
-    def _tagged_genres(self) -> Dict[str, str]:
-        genres_data = pd.read_csv(GENRES_LABELS_PATH).fillna('')
+    @staticmethod
+    def _load_tagged_genres() -> Dict[str, str]:
+        genres_data = ComponentFactory.get_side_tables_registry().get(GENRES_LABELS_TABLE).fillna('')
         genres_mapping = {}
 
         for genre, main_genre in zip(genres_data[GENRE], genres_data[MAIN_GENRE]):
@@ -44,16 +63,10 @@ class MainGenreMapper:
 
         return genres_mapping
 
-    @property
-    def _main_genres(self) -> List[str]:
-        main_genres = set(self._tagged_genres.values())
-        return list(sorted(main_genres))
-
-    @property
-    def _tokenizer(self) -> MWETokenizer:
+    def _build_tokenizer(self, main_genres: List[str]) -> MWETokenizer:
         tokenizer = MWETokenizer(separator=TOKENIZER_SEPARATOR)
 
-        for genre in self._main_genres:
+        for genre in main_genres:
             if self._is_multi_word_expression(genre):
                 tokenizer_formatted_genre = tuple(genre.split(TOKENIZER_SEPARATOR))
                 tokenizer.add_mwe(tokenizer_formatted_genre)
@@ -1,99 +1,63 @@
-import json
-from typing import List, Dict, Union
+from typing import List, Dict, Set
 
-import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
-from tqdm import tqdm
 
 from consts.data_consts import IS_ISRAELI, ARTIST_NAME, NAME, MAIN_ALBUM, GENRES, ARTISTS
+from consts.language_consts import HEBREW_CHAR_REGEX
 from consts.path_consts import KAN_GIMEL_ANALYZER_OUTPUT_PATH, SPOTIFY_ISRAELI_PLAYLISTS_OUTPUT_PATH
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
-from utils.general_utils import binary_search
-from utils.regex_utils import contains_any_hebrew_character
+from utils.file_utils import read_json
 
 ISRAELI = 'israeli'
 
 
 class IsraeliPreProcessor(IPreProcessor):
     def pre_process(self, data: DataFrame) -> DataFrame:
-        artists_mapping = self._create_israeli_artists_mapping(data)
-        data[IS_ISRAELI] = data[ARTIST_NAME].map(artists_mapping)
-        known_artists_data = data[~data[IS_ISRAELI].isna()]
-        unknown_artists_data = data[data[IS_ISRAELI].isna()]
-        unknown_artists_data[IS_ISRAELI] = self._is_israeli(unknown_artists_data)
+        print('Mapping tracks to Israeli or not')
+        data[IS_ISRAELI] = self._is_israeli_artist(data[ARTIST_NAME]) | self._is_israeli_track(data)
+        return data
 
-        return pd.concat([known_artists_data, unknown_artists_data]).reset_index(drop=True)
+    def _is_israeli_artist(self, artists_names: Series) -> Series:
+        israeli_artists = self._load_israeli_artists()
+        return artists_names.isin(israeli_artists) | self._contains_any_hebrew_character(artists_names)
 
-    def _create_israeli_artists_mapping(self, data: DataFrame) -> Dict[str, Union[bool, float]]:
-        print('Mapping artists to Israeli or not')
-        unique_artists = data[ARTIST_NAME].unique().tolist()
-        artists_mapping = {}
+    def _is_israeli_track(self, data: DataFrame) -> Series:
+        is_hebrew_name = self._contains_any_hebrew_character(data[NAME])
+        is_hebrew_album = self._contains_any_hebrew_character(data[MAIN_ALBUM])
 
-        with tqdm(total=len(unique_artists)) as progress_bar:
-            for artist in unique_artists:
-                artists_mapping[artist] = self._is_israeli_artist(artist)
-                progress_bar.update(1)
+        return is_hebrew_name | is_hebrew_album | self._has_any_israeli_genre(data[GENRES])
 
-        return artists_mapping
-
-    def _is_israeli_artist(self, artist_name: str) -> Union[bool, float]:
-        is_in_israeli_spotify_playlists, _ = binary_search(self._israeli_artists_from_spotify_playlists, artist_name)
-        if is_in_israeli_spotify_playlists:
-            return True
-
-        if self._is_included_in_kan_gimel_data(artist_name):
-            return True
-
-        if self._contains_any_hebrew_character(artist_name):
-            return True
-
-        return np.nan
-
-    def _is_israeli(self, data: DataFrame) -> List[bool]:
-        print('Mapping unknown artists tracks to Israeli or not')
-        is_israeli = []
-
-        with tqdm(total=len(data)) as progress_bar:
-            for i, row in data.iterrows():
-                is_track_israeli = self._is_track_israeli(row)
-                is_israeli.append(is_track_israeli)
-                progress_bar.update(1)
-
-        return is_israeli
-
-    def _is_track_israeli(self, row: Series) -> bool:
-        if self._contains_any_hebrew_character(row[NAME], row[MAIN_ALBUM]):
-            return True
+    @staticmethod
+    def _contains_any_hebrew_character(column: Series) -> Series:
+        return column.astype(str).str.contains(HEBREW_CHAR_REGEX)
 
-        else:
-            return self._has_any_israeli_genre(row[GENRES])
+    @staticmethod
+    def _has_any_israeli_genre(genres: Series) -> Series:
+        # Raw genres are stringified lists, and a genre name never spans two list items
+        raw_genres = genres.astype(object)
+        israeli_genres_mapping = {genres: ISRAELI in genres.lower() for genres in raw_genres.dropna().unique()}
 
-    def _is_included_in_kan_gimel_data(self, artist_name: str) -> bool:
-        return artist_name in self._kan_gimel_data[ARTISTS]
+        return raw_genres.map(israeli_genres_mapping).fillna(False).astype(bool)
 
     @staticmethod
-    def _contains_any_hebrew_character(*track_metadata: str) -> bool:
-        for datapoint in track_metadata:
-            if contains_any_hebrew_character(str(datapoint)):
-                return True
+    def _load_israeli_artists() -> Set[str]:
+        spotify_playlists_artists = pd.read_csv(SPOTIFY_ISRAELI_PLAYLISTS_OUTPUT_PATH, usecols=[ARTIST_NAME])
+        kan_gimel_data: Dict[str, List[str]] = read_json(KAN_GIMEL_ANALYZER_OUTPUT_PATH)
 
-        return False
+        return set(spotify_playlists_artists[ARTIST_NAME]) | set(kan_gimel_data[ARTISTS])
 
-    @staticmethod
-    def _has_any_israeli_genre(genres: str) -> bool:
-        genres_list = eval(genres)
-        return any(genre.lower().__contains__(ISRAELI) for genre in genres_list)
+    @property
+    def input_columns(self) -> List[str]:
+        return [ARTIST_NAME, NAME, MAIN_ALBUM, GENRES]
 
     @property
-    def _israeli_artists_from_spotify_playlists(self) -> List[str]:
-        artists_data = pd.read_csv(SPOTIFY_ISRAELI_PLAYLISTS_OUTPUT_PATH)
-        return artists_data[ARTIST_NAME].tolist()
+    def output_columns(self) -> List[str]:
+        return [IS_ISRAELI]
 
     @property
-    def _kan_gimel_data(self) -> Dict[str, List[str]]:
-        with open(KAN_GIMEL_ANALYZER_OUTPUT_PATH, 'r') as f:
-            return json.load(f)
+    def side_inputs_paths(self) -> List[str]:
+        return [SPOTIFY_ISRAELI_PLAYLISTS_OUTPUT_PATH, KAN_GIMEL_ANALYZER_OUTPUT_PATH]
 
     @property
     def name(self) -> str:
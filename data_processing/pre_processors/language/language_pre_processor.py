@@ -1,16 +1,19 @@
-from typing import Generator
+from typing import List
 
 import pandas as pd
 from pandas import DataFrame
-from tqdm import tqdm
 
+from component_factory import ComponentFactory
 from consts.data_consts import SPOTIFY_ID, ID
 from consts.language_consts import LANGUAGE, SCORE
+from consts.lyrics_consts import LYRICS_SOURCE
 from consts.path_consts import SHAZAM_TRACKS_IDS_PATH, SHAZAM_TRACKS_LANGUAGES_PATH, MUSIXMATCH_TRACKS_LANGUAGES_PATH, \
     LANGUAGES_ABBREVIATIONS_MAPPING_PATH
 from consts.shazam_consts import SHAZAM_TRACK_KEY, APPLE_MUSIC_ADAM_ID
-from data_processing.pre_processors.language.language_record import LanguageRecord
+from consts.side_tables_consts import SHAZAM_TRACKS_IDS_TABLE
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
+from models.data_source import DataSource
+from utils.data_utils import get_first_non_na_positions, select_by_positions
 from utils.file_utils import read_json
 
 SHAZAM_KEY = 'shazam_key'
@@ -23,10 +26,16 @@ RAW_LANGUAGE_COLUMN_NAMES = [
     MUSIXMATCH_LANGUAGE,
     MUSIXMATCH_SCORE
 ]
+LANGUAGE_SOURCES_COLUMNS = {
+    DataSource.SHAZAM: (LANGUAGE, SCORE),
+    DataSource.MUSIXMATCH: (MUSIXMATCH_LANGUAGE, MUSIXMATCH_SCORE)
+}
+DEFAULT_LANGUAGE_SOURCES_PRIORITY = [DataSource.SHAZAM, DataSource.MUSIXMATCH]
 
 
 class LanguagePreProcessor(IPreProcessor):
-    def __init__(self):
+    def __init__(self, sources_priority: List[DataSource] = DEFAULT_LANGUAGE_SOURCES_PRIORITY):
+        self._sources_priority = sources_priority
         self._languages_abbreviations_mapping = read_json(LANGUAGES_ABBREVIATIONS_MAPPING_PATH)
 
     def pre_process(self, data: DataFrame) -> DataFrame:
@@ -40,8 +49,10 @@ class LanguagePreProcessor(IPreProcessor):
 
     @staticmethod
     def _merge_shazam_tracks_ids_data(data: DataFrame) -> DataFrame:
-        shazam_tracks_ids_data = pd.read_csv(SHAZAM_TRACKS_IDS_PATH)
-        shazam_tracks_ids_relevant_data = shazam_tracks_ids_data[[SHAZAM_TRACK_KEY, APPLE_MUSIC_ADAM_ID, SPOTIFY_ID]]
+        shazam_tracks_ids_relevant_data = ComponentFactory.get_side_tables_registry().get(
+            name=SHAZAM_TRACKS_IDS_TABLE,
+            columns=[SHAZAM_TRACK_KEY, APPLE_MUSIC_ADAM_ID, SPOTIFY_ID]
+        )
         shazam_tracks_ids_relevant_data.columns = [SHAZAM_KEY, SHAZAM_ADAMID, ID]
         shazam_tracks_ids_relevant_data.drop_duplicates(subset=ID, inplace=True)
 
@@ -77,40 +88,37 @@ class LanguagePreProcessor(IPreProcessor):
         )
 
     def _create_data_with_single_language_column(self, data: DataFrame) -> DataFrame:
-        unique_songs_data = data.drop_duplicates(subset=ID)
-        language_records = [record.to_dict() for record in self._generate_language_data_records(unique_songs_data)]
-        language_data = pd.DataFrame.from_records(language_records)
-        relevant_data = data.drop(RAW_LANGUAGE_COLUMN_NAMES, axis=1)
-
-        return relevant_data.merge(
-            right=language_data,
-            how='left',
-            on=[ID]
+        print('Starting to select final language from different sources')
+        languages_columns = [LANGUAGE_SOURCES_COLUMNS[source][0] for source in self._sources_priority]
+        scores_columns = [LANGUAGE_SOURCES_COLUMNS[source][1] for source in self._sources_priority]
+        sources_codes = get_first_non_na_positions(data[languages_columns])
+        language_data = data.drop(RAW_LANGUAGE_COLUMN_NAMES, axis=1)
+
+        language_data[LANGUAGE] = select_by_positions(data[languages_columns], sources_codes)
+        language_data[SCORE] = select_by_positions(data[scores_columns], sources_codes).astype(float)
+        language_data[LYRICS_SOURCE] = pd.Categorical.from_codes(
+            codes=sources_codes,
+            categories=[source.value for source in self._sources_priority]
         )
 
-    @staticmethod
-    def _generate_language_data_records(data: DataFrame) -> Generator[LanguageRecord, None, None]:
-        print('Starting to select final language from different sources')
+        return language_data
+
+    @property
+    def input_columns(self) -> List[str]:
+        return [ID]
 
-        with tqdm(total=len(data)) as progress_bar:
-            for i, row in data.iterrows():
-                if not pd.isna(row[LANGUAGE]):
-                    yield LanguageRecord(
-                        id=row[ID],
-                        language=row[LANGUAGE],
-                        score=row[SCORE],
-                        lyrics_source='shazam'
-                    )
-
-                elif not pd.isna(row[MUSIXMATCH_LANGUAGE]):
-                    yield LanguageRecord(
-                        id=row[ID],
-                        language=row[MUSIXMATCH_LANGUAGE],
-                        score=row[MUSIXMATCH_SCORE],
-                        lyrics_source='musixmatch'
-                    )
-
-                progress_bar.update(1)
+    @property
+    def output_columns(self) -> List[str]:
+        return [SHAZAM_KEY, SHAZAM_ADAMID, LANGUAGE, SCORE, LYRICS_SOURCE]
+
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [
+            SHAZAM_TRACKS_IDS_PATH,
+            SHAZAM_TRACKS_LANGUAGES_PATH,
+            MUSIXMATCH_TRACKS_LANGUAGES_PATH,
+            LANGUAGES_ABBREVIATIONS_MAPPING_PATH
+        ]
 
     @property
     def name(self) -> str:
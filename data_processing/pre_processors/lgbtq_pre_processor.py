@@ -1,3 +1,5 @@
+from typing import List
+
 import pandas as pd
 from pandas import DataFrame
 
@@ -10,7 +12,7 @@ class LGBTQPreProcessor(IPreProcessor):
     def pre_process(self, data: DataFrame) -> DataFrame:
         lgbtq_data = pd.read_csv(SPOTIFY_LGBTQ_PLAYLISTS_OUTPUT_PATH)
         merged_data = data.merge(
-            right=lgbtq_data[[ARTIST_ID, IS_LGBTQ]],
+            right=lgbtq_data[[ARTIST_ID, IS_LGBTQ]].drop_duplicates(subset=[ARTIST_ID]),
             how="left",
             on=[ARTIST_ID]
         )
@@ -18,6 +20,18 @@ class LGBTQPreProcessor(IPreProcessor):
 
         return merged_data
 
+    @property
+    def input_columns(self) -> List[str]:
+        return [ARTIST_ID]
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [IS_LGBTQ]
+
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [SPOTIFY_LGBTQ_PLAYLISTS_OUTPUT_PATH]
+
     @property
     def name(self) -> str:
         return "lgbtq pre processor"
@@ -0,0 +1,118 @@
+import ast
+import hashlib
+import inspect
+import json
+import os
+import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import Union, List, Optional
+
+from data_processing.pre_processors.pre_processor_interface import IPreProcessor
+from utils.file_utils import hash_file_content
+
+PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def fingerprint_pre_processor_code(pre_processor: IPreProcessor) -> list:
+    pre_processor_class = type(pre_processor)
+    attributes = {k: v for k, v in vars(pre_processor).items() if isinstance(v, PRIMITIVE_TYPES)}
+    modules_sources_hashes = [
+        [module.__name__, _hash_module_source(module)]
+        for module in _collect_project_modules(inspect.getmodule(pre_processor_class))
+    ]
+
+    return [
+        f'{pre_processor_class.__module__}.{pre_processor_class.__qualname__}',
+        hash_value(json.dumps(modules_sources_hashes)),
+        attributes
+    ]
+
+
+def fingerprint_side_inputs(pre_processor: IPreProcessor) -> list:
+    return [fingerprint_path(path) for path in pre_processor.side_inputs_paths]
+
+
+def fingerprint_path(path: str) -> list:
+    if not os.path.exists(path):
+        return [path, None]
+
+    if os.path.isfile(path):
+        return [path, hash_file(path)]
+
+    # Parquet part files get random names on every write, so files are identified by their directory and content
+    files_hashes = sorted(
+        [os.path.relpath(dir_path, path), hash_file(os.path.join(dir_path, file_name))]
+        for dir_path, _, files_names in os.walk(path)
+        for file_name in files_names
+    )
+    return [path, hash_value(json.dumps(files_hashes))]
+
+
+def hash_file(path: str) -> str:
+    # Side inputs are rewritten by the pre script analyzers on every run, so file stats only key the memoized hash
+    file_stat = os.stat(path)
+    return _hash_file_content(os.path.abspath(path), file_stat.st_size, file_stat.st_mtime_ns)
+
+
+def hash_value(value: Union[str, bytes]) -> str:
+    if isinstance(value, str):
+        value = value.encode()
+
+    return hashlib.sha256(value).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _hash_file_content(path: str, size: int, modified_at: int) -> str:
+    return hash_file_content(path)
+
+
+def _collect_project_modules(module: ModuleType) -> List[ModuleType]:
+    # Helpers imported by the pre processor module, directly or transitively, change its outputs as well
+    modules = {module.__name__: module}
+    pending_modules = [module]
+
+    while pending_modules:
+        for imported_module in _get_imported_modules(pending_modules.pop()):
+            if imported_module.__name__ not in modules and _is_project_module(imported_module):
+                modules[imported_module.__name__] = imported_module
+                pending_modules.append(imported_module)
+
+    return [modules[module_name] for module_name in sorted(modules)]
+
+
+def _get_imported_modules(module: ModuleType) -> List[ModuleType]:
+    # Imports are read from the source, since constants imported from a module keep no reference to it
+    imported_modules_names = []
+
+    for node in ast.walk(ast.parse(_get_module_source(module))):
+        if isinstance(node, ast.Import):
+            imported_modules_names.extend(alias.name for alias in node.names)
+
+        elif isinstance(node, ast.ImportFrom) and node.module is not None and node.level == 0:
+            imported_modules_names.append(node.module)
+            imported_modules_names.extend(f'{node.module}.{alias.name}' for alias in node.names)
+
+    return [sys.modules[name] for name in imported_modules_names if name in sys.modules]
+
+
+def _is_project_module(module: ModuleType) -> bool:
+    module_path = getattr(module, '__file__', None)
+    if module_path is None:
+        return False
+
+    module_path = os.path.abspath(module_path)
+    return module_path.startswith(PROJECT_DIR + os.sep) and 'site-packages' not in module_path
+
+
+def _hash_module_source(module: ModuleType) -> str:
+    return hash_value(_get_module_source(module))
+
+
+@lru_cache(maxsize=None)
+def _get_module_source(module: ModuleType) -> str:
+    try:
+        return inspect.getsource(module)
+    except OSError:  # Empty modules, such as packages `__init__` files
+        return ''
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from pandas import DataFrame
 
@@ -12,3 +13,19 @@ class IPreProcessor(ABC):
     @abstractmethod
     def name(self) -> str:
         raise NotImplementedError
+
+    # Pre processors declaring both input and output columns must compute each row outputs from its input columns
+    # values only, keeping the number and order of rows. They are applied once per unique input columns values,
+    # concurrently with independent pre processors, and joined back to the data. None means the whole data frame
+    @property
+    def input_columns(self) -> Optional[List[str]]:
+        return None
+
+    @property
+    def output_columns(self) -> Optional[List[str]]:
+        return None
+
+    # Files and directories read by the pre processor, used to invalidate its cached outputs
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return []
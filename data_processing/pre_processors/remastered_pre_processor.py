@@ -1,3 +1,5 @@
+from typing import List
+
 from pandas import DataFrame
 
 from consts.data_consts import NAME, IS_REMASTERED, REMASTER
@@ -9,6 +11,14 @@ class RemasteredPreProcessor(IPreProcessor):
         data[IS_REMASTERED] = data[NAME].str.contains(REMASTER, case=False)
         return data
 
+    @property
+    def input_columns(self) -> List[str]:
+        return [NAME]
+
+    @property
+    def output_columns(self) -> List[str]:
+        return [IS_REMASTERED]
+
     @property
     def name(self) -> str:
         return 'remastered pre processor'
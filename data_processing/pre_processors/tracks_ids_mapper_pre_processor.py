@@ -1,19 +1,21 @@
-from typing import Dict, Union
+from typing import Dict, Union, List
 
 import numpy as np
-import pandas as pd
 from pandas import DataFrame
 
+from component_factory import ComponentFactory
 from consts.audio_features_consts import KEY
 from consts.data_consts import ID, SPOTIFY_ID, GENIUS_ID, SONG
 from consts.musixmatch_consts import MUSIXMATCH_ID, MUSIXMATCH_TRACK_ID
 from consts.path_consts import SHAZAM_TRACKS_IDS_PATH, MUSIXMATCH_TRACK_IDS_PATH, GENIUS_TRACKS_IDS_OUTPUT_PATH, \
     SHAZAM_APPLE_TRACKS_IDS_MAPPING_OUTPUT_PATH
 from consts.shazam_consts import APPLE_MUSIC_ADAM_ID, APPLE_MUSIC_TRACK_ID, APPLE_MUSIC_ID
+from consts.side_tables_consts import SHAZAM_TRACKS_IDS_TABLE, SHAZAM_APPLE_TRACKS_IDS_MAPPING_TABLE, \
+    MUSIXMATCH_TRACK_IDS_TABLE, GENIUS_TRACKS_IDS_TABLE
 from data_processing.pre_processors.language.language_pre_processor import SHAZAM_KEY
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
-from utils.file_utils import read_json
 from utils.general_utils import stringify_float
+from utils.song_utils import merge_on_songs
 
 SHAZAM_ID_COLUMNS = [KEY, APPLE_MUSIC_ADAM_ID]
 
@@ -36,7 +38,7 @@ class TracksIDSMapperPreProcessor(IPreProcessor):
         return data_with_genius_ids.drop(SONG, axis=1)
 
     def _merge_shazam_ids(self, data: DataFrame) -> DataFrame:
-        shazam_data = pd.read_csv(SHAZAM_TRACKS_IDS_PATH)
+        shazam_data = ComponentFactory.get_side_tables_registry().get(SHAZAM_TRACKS_IDS_TABLE)
         shazam_data.drop_duplicates(subset=[SPOTIFY_ID], inplace=True)
         shazam_data[SHAZAM_ID_COLUMNS] = shazam_data[SHAZAM_ID_COLUMNS].applymap(stringify_float)
         shazam_data.rename(columns={KEY: SHAZAM_KEY, SPOTIFY_ID: ID}, inplace=True)
@@ -52,7 +54,7 @@ class TracksIDSMapperPreProcessor(IPreProcessor):
     def _merge_apple_ids(data: DataFrame) -> DataFrame:
         data.dropna(subset=[SHAZAM_KEY], inplace=True)
         data[SHAZAM_KEY] = data[SHAZAM_KEY].astype(str)
-        shazam_apple_mapping = pd.read_csv(SHAZAM_APPLE_TRACKS_IDS_MAPPING_OUTPUT_PATH)
+        shazam_apple_mapping = ComponentFactory.get_side_tables_registry().get(SHAZAM_APPLE_TRACKS_IDS_MAPPING_TABLE)
         shazam_apple_mapping.rename(columns={APPLE_MUSIC_TRACK_ID: APPLE_MUSIC_ID}, inplace=True)
         shazam_apple_mapping[SHAZAM_KEY] = shazam_apple_mapping[SHAZAM_KEY].astype(str)
 
@@ -63,21 +65,21 @@ class TracksIDSMapperPreProcessor(IPreProcessor):
         )
 
     def _merge_musixmatch_ids(self, data: DataFrame) -> DataFrame:
-        musixmatch_data = read_json(MUSIXMATCH_TRACK_IDS_PATH)
+        musixmatch_data = ComponentFactory.get_side_tables_registry().get(MUSIXMATCH_TRACK_IDS_TABLE)
         data[MUSIXMATCH_ID] = data[ID].apply(lambda x: self._extract_musixmatch_id(x, musixmatch_data))
 
         return data
 
     @staticmethod
     def _merge_genius_ids(data: DataFrame) -> DataFrame:
-        genius_data = pd.read_csv(GENIUS_TRACKS_IDS_OUTPUT_PATH)
+        genius_data = ComponentFactory.get_side_tables_registry().get(GENIUS_TRACKS_IDS_TABLE)
         genius_data.dropna(subset=[ID], inplace=True)
         genius_data[GENIUS_ID] = genius_data[ID].apply(stringify_float)
 
-        return data.merge(
+        return merge_on_songs(
+            left=data,
             right=genius_data[[SONG, GENIUS_ID]],
-            how="left",
-            on=SONG
+            how="left"
         )
 
     @staticmethod
@@ -85,6 +87,15 @@ class TracksIDSMapperPreProcessor(IPreProcessor):
         raw_id = musixmatch_data.get(spotify_id, {}).get(MUSIXMATCH_TRACK_ID, np.nan)
         return stringify_float(raw_id)
 
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [
+            SHAZAM_TRACKS_IDS_PATH,
+            MUSIXMATCH_TRACK_IDS_PATH,
+            GENIUS_TRACKS_IDS_OUTPUT_PATH,
+            SHAZAM_APPLE_TRACKS_IDS_MAPPING_OUTPUT_PATH
+        ]
+
     @property
     def name(self) -> str:
         return "tracks ids mapper pre processor"
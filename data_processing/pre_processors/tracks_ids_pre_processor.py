@@ -1,8 +1,12 @@
+from typing import List
+
 import pandas as pd
 from pandas import DataFrame
 
+from component_factory import ComponentFactory
 from consts.data_consts import ARTIST_NAME, NAME, ID, URI
 from consts.path_consts import TRACKS_IDS_OUTPUT_PATH
+from consts.side_tables_consts import TRACKS_IDS_TABLE
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
 
 
@@ -11,7 +15,7 @@ class TracksIDSPreProcessor(IPreProcessor):
         non_missing_tracks_ids_data = data[~data[ID].isna()]
         missing_tracks_ids_data = data[data[ID].isna()]
         missing_tracks_ids_data.drop([ID, URI], axis=1, inplace=True)
-        tracks_ids_data = pd.read_csv(TRACKS_IDS_OUTPUT_PATH)
+        tracks_ids_data = ComponentFactory.get_side_tables_registry().get(TRACKS_IDS_TABLE)
         merged_data = missing_tracks_ids_data.merge(
             right=tracks_ids_data,
             how='left',
@@ -20,6 +24,10 @@ class TracksIDSPreProcessor(IPreProcessor):
 
         return pd.concat([non_missing_tracks_ids_data, merged_data]).reset_index(drop=True)
 
+    @property
+    def side_inputs_paths(self) -> List[str]:
+        return [TRACKS_IDS_OUTPUT_PATH]
+
     @property
     def name(self) -> str:
         return 'tracks ids pre processor'
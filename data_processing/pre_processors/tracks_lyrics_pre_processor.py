@@ -1,77 +1,66 @@
-from typing import Tuple, Union, List, Dict
+from typing import List
 
-import numpy as np
+import pandas as pd
 from pandas import DataFrame, Series
 
+from component_factory import ComponentFactory
 from consts.data_consts import GENIUS_ID
-from consts.lyrics_consts import SHAZAM_LYRICS, GENIUS_LYRICS, MUSIXMATCH_LYRICS, LYRICS_SOURCES, LYRICS_COLUMNS
-from consts.musixmatch_consts import MUSIXMATCH_ID
+from consts.lyrics_consts import LYRICS_SOURCE
+from consts.musixmatch_consts import MUSIXMATCH_ID, LYRICS
 from consts.path_consts import SHAZAM_TRACKS_LYRICS_PATH, GENIUS_LYRICS_OUTPUT_PATH, \
     MUSIXMATCH_FORMATTED_TRACKS_LYRICS_PATH
 from data_processing.pre_processors.language.language_pre_processor import SHAZAM_KEY
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
 from models.data_source import DataSource
-from utils.data_utils import is_list_na
-from utils.file_utils import read_json
-from utils.general_utils import stringify_float
+from utils.data_utils import get_first_non_na_positions, select_by_positions
+from utils.general_utils import stringify_floats
+
+LYRICS_SOURCES_KEYS_AND_PATHS = {
+    DataSource.SHAZAM: (SHAZAM_KEY, SHAZAM_TRACKS_LYRICS_PATH),
+    DataSource.GENIUS: (GENIUS_ID, GENIUS_LYRICS_OUTPUT_PATH),
+    DataSource.MUSIXMATCH: (MUSIXMATCH_ID, MUSIXMATCH_FORMATTED_TRACKS_LYRICS_PATH)
+}
+DEFAULT_LYRICS_SOURCES_PRIORITY = [DataSource.SHAZAM, DataSource.GENIUS, DataSource.MUSIXMATCH]
 
 
 class TracksLyricsPreProcessor(IPreProcessor):
+    def __init__(self, sources_priority: List[DataSource] = DEFAULT_LYRICS_SOURCES_PRIORITY):
+        self._sources_priority = sources_priority
+
     def pre_process(self, data: DataFrame) -> DataFrame:
         data.rename(columns={f"{SHAZAM_KEY}_x": SHAZAM_KEY}, inplace=True)  # TODO: Find root problem
         data.drop(f"{SHAZAM_KEY}_y", axis=1, inplace=True)
-        data_with_shazam_lyrics = self._merge_json_tracks_lyrics(
-            data=data,
-            path=SHAZAM_TRACKS_LYRICS_PATH,
-            key_column=SHAZAM_KEY,
-            lyrics_column=SHAZAM_LYRICS
-        )
-        data_with_genius_lyrics = self._merge_json_tracks_lyrics(
-            data=data_with_shazam_lyrics,
-            path=GENIUS_LYRICS_OUTPUT_PATH,
-            key_column=GENIUS_ID,
-            lyrics_column=GENIUS_LYRICS
-        )
-        data_with_lyrics = self._merge_json_tracks_lyrics(
-            data=data_with_genius_lyrics,
-            path=MUSIXMATCH_FORMATTED_TRACKS_LYRICS_PATH,
-            key_column=MUSIXMATCH_ID,
-            lyrics_column=MUSIXMATCH_LYRICS
+        sources_lyrics = DataFrame(
+            {source.value: self._get_source_lyrics(data, source) for source in self._sources_priority},
+            index=data.index
         )
-        data_with_lyrics[LYRICS_COLUMNS] = data_with_lyrics[LYRICS_SOURCES].apply(
-            func=self._choose_lyrics,
-            axis=1,
-            result_type='expand'
+        sources_codes = get_first_non_na_positions(sources_lyrics)
+
+        data[LYRICS] = select_by_positions(sources_lyrics, sources_codes)
+        data[LYRICS_SOURCE] = pd.Categorical.from_codes(
+            codes=sources_codes,
+            categories=[source.value for source in self._sources_priority]
         )
 
-        return data_with_lyrics.drop(LYRICS_SOURCES, axis=1)
+        return data
 
     @staticmethod
-    def _merge_json_tracks_lyrics(data: DataFrame, path: str, key_column: str, lyrics_column: str) -> DataFrame:
-        data_copy = data.copy()
-        lyrics = read_json(path)
-        filtered_lyrics = {k: v for k, v in lyrics.items() if v != []}
-        data_copy[key_column] = data_copy[key_column].apply(stringify_float)
-        data_copy[lyrics_column] = data_copy[key_column].map(filtered_lyrics)
-
-        return data_copy
-
-    def _choose_lyrics(self, row: Series) -> Tuple[Union[List[str], float], Union[str, float]]:
-        for column, source in self._prioritized_lyrics_columns_to_sources_mapping.items():
-            column_value = row[column]
-
-            if not is_list_na(column_value):
-                return column_value, source.value
+    def _get_source_lyrics(data: DataFrame, source: DataSource) -> Series:
+        key_column, lyrics_path = LYRICS_SOURCES_KEYS_AND_PATHS[source]
+        data[key_column] = stringify_floats(data[key_column])
+        lyrics_store = ComponentFactory.get_lyrics_store(lyrics_path)
+        lyrics = lyrics_store.get_many(data[key_column].dropna().unique())  # Only the lyrics of tracks in scope
+        non_empty_lyrics = {k: v for k, v in lyrics.items() if v != []}
 
-        return np.nan, np.nan
+        return data[key_column].map(non_empty_lyrics)
 
     @property
-    def _prioritized_lyrics_columns_to_sources_mapping(self) -> Dict[str, DataSource]:
-        return {
-            SHAZAM_LYRICS: DataSource.SHAZAM,
-            GENIUS_LYRICS: DataSource.GENIUS,
-            MUSIXMATCH_LYRICS: DataSource.MUSIXMATCH
-        }
+    def side_inputs_paths(self) -> List[str]:
+        return [
+            SHAZAM_TRACKS_LYRICS_PATH,
+            GENIUS_LYRICS_OUTPUT_PATH,
+            MUSIXMATCH_FORMATTED_TRACKS_LYRICS_PATH
+        ]
 
     @property
     def name(self) -> str:
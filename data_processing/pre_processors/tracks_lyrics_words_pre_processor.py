@@ -1,7 +1,4 @@
-import re
-import string
-from collections import Counter
-from typing import List, Dict, Any, Callable
+from typing import List
 
 import numpy as np
 from pandas import DataFrame
@@ -9,40 +6,30 @@ from pandas import DataFrame
 from consts.lyrics_consts import NUMBER_OF_WORDS, WORDS_COUNT
 from consts.musixmatch_consts import LYRICS
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
-from utils.dict_utils import sort_dict_by_descending_value
+from tools.lyrics_term_matrix.lyrics_term_matrix import LyricsTermMatrix
 
 
 class TracksLyricsWordsPreProcessor(IPreProcessor):
-    def __init__(self):
-        self._numeric_punctuation_spaces_regex = re.compile(r'[%s]' % re.escape(string.punctuation))
-
     def pre_process(self, data: DataFrame) -> DataFrame:
-        data[WORDS_COUNT] = data[LYRICS].apply(lambda x: self._na_cleaner_wrapper(x, self._count_single_track_words))
-        data[NUMBER_OF_WORDS] = data[WORDS_COUNT].apply(lambda x: self._na_cleaner_wrapper(x, self._sum_words_count))
-
-        return data
-
-    @staticmethod
-    def _na_cleaner_wrapper(x: Any, func: Callable) -> Any:
-        if not isinstance(x, (list, dict)):
-            return np.nan
+        term_matrix = LyricsTermMatrix.build(data[LYRICS])
+        has_lyrics = data[LYRICS].map(lambda x: isinstance(x, list)).to_numpy()
+        words_counts = np.full(len(data), np.nan, dtype=object)
 
-        return func(x)
+        for position in np.flatnonzero(has_lyrics):
+            words_counts[position] = term_matrix.get_words_count(position)
 
-    def _count_single_track_words(self, track_lyrics: List[str]) -> Dict[str, int]:
-        track_word_count = Counter()
+        data[WORDS_COUNT] = words_counts
+        data[NUMBER_OF_WORDS] = np.where(has_lyrics, term_matrix.number_of_words, np.nan)
 
-        for line in track_lyrics:
-            clean_line = self._numeric_punctuation_spaces_regex.sub('', line)
-            tokens = [token.strip().lower() for token in clean_line.split(' ') if token != '']
-            tokens_count = Counter(tokens)
-            track_word_count += tokens_count
+        return data
 
-        return sort_dict_by_descending_value(track_word_count)
+    @property
+    def input_columns(self) -> List[str]:
+        return [LYRICS]
 
-    @staticmethod
-    def _sum_words_count(words_count: Dict[str, int]) -> int:
-        return sum(words_count.values())
+    @property
+    def output_columns(self) -> List[str]:
+        return [WORDS_COUNT, NUMBER_OF_WORDS]
 
     @property
     def name(self) -> str:
@@ -1,8 +1,10 @@
 from pandas import DataFrame
 
+from component_factory import ComponentFactory
 from consts.data_consts import ADDED_AT, BROADCASTING_YEAR, RELEASE_YEAR, RELEASE_DATE
+from consts.datetime_consts import SPOTIFY_DATETIME_FORMAT
 from data_processing.pre_processors.pre_processor_interface import IPreProcessor
-from utils.regex_utils import extract_year
+from utils.regex_utils import extract_years
 
 
 class YearPreProcessor(IPreProcessor):
@@ -10,9 +12,10 @@ class YearPreProcessor(IPreProcessor):
         self._max_year = max_year
 
     def pre_process(self, data: DataFrame) -> DataFrame:
-        data[BROADCASTING_YEAR] = [extract_year(date) for date in data[ADDED_AT]]
+        added_at = ComponentFactory.get_datetimes_parser().parse(data[ADDED_AT], SPOTIFY_DATETIME_FORMAT)
+        data[BROADCASTING_YEAR] = added_at.dt.year
         filtered_data = data[data[BROADCASTING_YEAR] <= self._max_year]
-        filtered_data[RELEASE_YEAR] = [extract_year(date) for date in filtered_data[RELEASE_DATE]]
+        filtered_data[RELEASE_YEAR] = extract_years(filtered_data[RELEASE_DATE])  # Release dates precision varies
 
         return filtered_data
 
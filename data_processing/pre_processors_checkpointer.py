@@ -0,0 +1,68 @@
+import json
+import os
+from typing import List, Optional
+
+import pandas as pd
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+
+from data_processing.pre_processors.pre_processor_fingerprint import fingerprint_pre_processor_code, \
+    fingerprint_side_inputs, hash_value
+from data_processing.pre_processors.pre_processor_interface import IPreProcessor
+
+CHECKPOINT_FILE_SUFFIX = '.pkl'
+
+
+class PreProcessorsCheckpointer:
+    def __init__(self, checkpoints_dir: str):
+        self._checkpoints_dir = checkpoints_dir
+
+    def generate_keys(self, data: DataFrame, stages: List[List[IPreProcessor]]) -> List[str]:
+        # Each stage input is the previous stage output, so chaining keys identifies it without hashing it again
+        key = self._fingerprint_data(data)
+        keys = []
+
+        for stage in stages:
+            stage_fingerprint = [
+                [fingerprint_pre_processor_code(pre_processor), fingerprint_side_inputs(pre_processor)]
+                for pre_processor in stage
+            ]
+            key = hash_value(json.dumps([key, stage_fingerprint]))
+            keys.append(key)
+
+        return keys
+
+    def find_last_checkpoint(self, keys: List[str]) -> Optional[int]:
+        for i in reversed(range(len(keys))):
+            if os.path.exists(self._get_checkpoint_path(keys[i])):
+                return i
+
+    def load(self, key: str) -> DataFrame:
+        return pd.read_pickle(self._get_checkpoint_path(key))
+
+    def save(self, key: str, data: DataFrame) -> None:
+        os.makedirs(self._checkpoints_dir, exist_ok=True)
+        checkpoint_path = self._get_checkpoint_path(key)
+        temporary_path = f'{checkpoint_path}.tmp'
+        data.to_pickle(temporary_path)
+        os.replace(temporary_path, checkpoint_path)  # Crashes while writing must not leave partial checkpoints
+
+    def remove_stale_checkpoints(self, keys: List[str]) -> None:
+        if not os.path.exists(self._checkpoints_dir):
+            return
+
+        valid_files_names = {f'{key}{CHECKPOINT_FILE_SUFFIX}' for key in keys}
+
+        for file_name in os.listdir(self._checkpoints_dir):
+            if file_name not in valid_files_names:
+                os.remove(os.path.join(self._checkpoints_dir, file_name))
+
+    def _get_checkpoint_path(self, key: str) -> str:
+        return os.path.join(self._checkpoints_dir, f'{key}{CHECKPOINT_FILE_SUFFIX}')
+
+    @staticmethod
+    def _fingerprint_data(data: DataFrame) -> str:
+        rows_hashes = hash_pandas_object(data, index=True).values
+        schema = json.dumps([[str(column), str(dtype)] for column, dtype in data.dtypes.items()])
+
+        return hash_value(schema.encode() + rows_hashes.tobytes())
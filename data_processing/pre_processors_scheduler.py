@@ -0,0 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Tuple, Dict
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index
+from pandas.util import hash_pandas_object
+
+from data_processing.pre_processors.pre_processor_interface import IPreProcessor
+from data_processing.pre_processors_checkpointer import PreProcessorsCheckpointer
+from tools.profiling.stage_profiler import StageProfiler
+
+
+class PreProcessorsScheduler:
+    def __init__(self,
+                 max_workers: Optional[int] = 1,
+                 checkpointer: Optional[PreProcessorsCheckpointer] = None,
+                 profiler: Optional[StageProfiler] = None,
+                 cache_column_local_outputs: bool = False):
+        self._max_workers = max_workers
+        self._checkpointer = checkpointer
+        self._profiler = StageProfiler() if profiler is None else profiler
+        self._cache_column_local_outputs = cache_column_local_outputs
+        self._column_local_outputs_cache: Dict[str, DataFrame] = {}
+
+    def run(self, data: DataFrame, pre_processors: List[IPreProcessor]) -> DataFrame:
+        stages = self._build_stages(pre_processors)
+
+        if self._checkpointer is None:
+            for stage in stages:
+                data = self._run_stage(data, stage)
+
+            return data
+
+        return self._run_with_checkpoints(data, stages)
+
+    def _run_with_checkpoints(self, data: DataFrame, stages: List[List[IPreProcessor]]) -> DataFrame:
+        keys = self._checkpointer.generate_keys(data, stages)
+        last_checkpoint_index = self._checkpointer.find_last_checkpoint(keys)
+        first_stage_index = 0
+
+        if last_checkpoint_index is not None:
+            first_stage_index = last_checkpoint_index + 1
+            print(f'Resuming pre processing from checkpoint after {self._get_stage_name(stages[last_checkpoint_index])}')
+            data = self._checkpointer.load(keys[last_checkpoint_index])
+
+        for stage, key in zip(stages[first_stage_index:], keys[first_stage_index:]):
+            data = self._run_stage(data, stage)
+            self._checkpointer.save(key, data)
+
+        self._checkpointer.remove_stale_checkpoints(keys)
+        return data
+
+    def _run_stage(self, data: DataFrame, stage: List[IPreProcessor]) -> DataFrame:
+        return self._profiler.run(
+            stage=self._get_stage_name(stage),
+            func=partial(self._apply_stage, stage=stage),
+            data=data
+        )
+
+    def _apply_stage(self, data: DataFrame, stage: List[IPreProcessor]) -> DataFrame:
+        if self._is_column_local(stage[0]):
+            return self._run_column_local_stage(data, stage)
+
+        print(f'Starting to apply {stage[0].name}')
+        return stage[0].pre_process(data)
+
+    def _build_stages(self, pre_processors: List[IPreProcessor]) -> List[List[IPreProcessor]]:
+        stages = []
+        column_local_pre_processors = []
+
+        for pre_processor in pre_processors:
+            if self._is_column_local(pre_processor):
+                column_local_pre_processors.append(pre_processor)
+            else:
+                stages.extend(self._to_dependencies_levels(column_local_pre_processors))
+                stages.append([pre_processor])
+                column_local_pre_processors = []
+
+        stages.extend(self._to_dependencies_levels(column_local_pre_processors))
+        return stages
+
+    def _to_dependencies_levels(self, pre_processors: List[IPreProcessor]) -> List[List[IPreProcessor]]:
+        pre_processors_levels = []
+
+        for i, pre_processor in enumerate(pre_processors):
+            dependencies_levels = [
+                pre_processors_levels[j] for j in range(i)
+                if self._is_dependent(pre_processor, pre_processors[j])
+            ]
+            pre_processors_levels.append(max(dependencies_levels, default=-1) + 1)
+
+        levels = [[] for _ in range(max(pre_processors_levels, default=-1) + 1)]
+        for pre_processor, level in zip(pre_processors, pre_processors_levels):
+            levels[level].append(pre_processor)
+
+        return levels
+
+    @staticmethod
+    def _is_dependent(pre_processor: IPreProcessor, previous_pre_processor: IPreProcessor) -> bool:
+        previous_columns = set(previous_pre_processor.input_columns + previous_pre_processor.output_columns)
+        reads_previous_output = not set(pre_processor.input_columns).isdisjoint(previous_pre_processor.output_columns)
+        overwrites_previous_columns = not previous_columns.isdisjoint(pre_processor.output_columns)
+
+        return reads_previous_output or overwrites_previous_columns
+
+    def _run_column_local_stage(self, data: DataFrame, stage: List[IPreProcessor]) -> DataFrame:
+        print(f'Starting to apply {self._get_stage_name(stage)}')
+        dimensions = {
+            key_columns: self._build_dimension(data, list(key_columns))
+            for key_columns in dict.fromkeys(self._get_key_columns(pre_processor) for pre_processor in stage)
+        }
+        outputs_data = self._apply_column_local_pre_processors(dimensions, stage)
+        joined_dimensions = {
+            key_columns: self._join_dimension(
+                dimension_outputs=[
+                    output_data for pre_processor, output_data in zip(stage, outputs_data)
+                    if self._get_key_columns(pre_processor) == key_columns
+                ],
+                codes=codes,
+                index=data.index
+            )
+            for key_columns, (_, codes) in dimensions.items()
+        }
+
+        for pre_processor in stage:
+            joined_dimension = joined_dimensions[self._get_key_columns(pre_processor)]
+
+            for column in pre_processor.output_columns:
+                data[column] = joined_dimension[column]
+
+        return data
+
+    @staticmethod
+    def _build_dimension(data: DataFrame, key_columns: List[str]) -> Tuple[DataFrame, np.ndarray]:
+        # One row per unique key, indexed by the key hash, and the position of every data row key in it
+        keys_hashes = PreProcessorsScheduler._hash_keys(data[key_columns])
+        codes, unique_keys_hashes = pd.factorize(keys_hashes)
+        _, first_rows_positions = np.unique(codes, return_index=True)
+        dimension_data = data[key_columns].iloc[first_rows_positions]
+        dimension_data.index = unique_keys_hashes
+
+        return dimension_data, codes
+
+    @staticmethod
+    def _hash_keys(keys: DataFrame) -> np.ndarray:
+        try:
+            return hash_pandas_object(keys, index=False).values
+        except TypeError:  # Unhashable values such as genres lists
+            return hash_pandas_object(keys.astype(str), index=False).values
+
+    @staticmethod
+    def _join_dimension(dimension_outputs: List[DataFrame], codes: np.ndarray, index: Index) -> DataFrame:
+        dimension_data = pd.concat(dimension_outputs, axis=1).reset_index(drop=True)
+        joined_data = dimension_data.iloc[codes]
+        joined_data.index = index
+
+        return joined_data
+
+    def _apply_column_local_pre_processors(self,
+                                           dimensions: Dict[Tuple[str, ...], Tuple[DataFrame, np.ndarray]],
+                                           stage: List[IPreProcessor]) -> List[DataFrame]:
+        func = lambda pre_processor: self._apply_column_local_pre_processor(
+            dimension_data=dimensions[self._get_key_columns(pre_processor)][0],
+            pre_processor=pre_processor
+        )
+
+        if self._max_workers == 1 or len(stage) == 1:
+            return list(map(func, stage))
+
+        with ThreadPoolExecutor(self._max_workers) as executor:
+            return list(executor.map(func, stage))
+
+    def _apply_column_local_pre_processor(self, dimension_data: DataFrame, pre_processor: IPreProcessor) -> DataFrame:
+        if not self._cache_column_local_outputs:
+            return self._pre_process_dimension(dimension_data, pre_processor)
+
+        # Outputs depend on the keys values only, so keys seen in previous runs are not pre processed again
+        output_data = self._column_local_outputs_cache.get(pre_processor.name)
+
+        if output_data is None:
+            output_data = self._pre_process_dimension(dimension_data, pre_processor)
+        else:
+            new_keys_data = dimension_data[~dimension_data.index.isin(output_data.index)]
+            if not new_keys_data.empty:
+                output_data = pd.concat([output_data, self._pre_process_dimension(new_keys_data, pre_processor)])
+
+        self._column_local_outputs_cache[pre_processor.name] = output_data
+        return output_data.loc[dimension_data.index]
+
+    @staticmethod
+    def _pre_process_dimension(dimension_data: DataFrame, pre_processor: IPreProcessor) -> DataFrame:
+        output_data = pre_processor.pre_process(dimension_data.reset_index(drop=True))
+
+        if len(output_data) != len(dimension_data):
+            raise ValueError(
+                f'`{pre_processor.name}` changed the number of rows from {len(dimension_data)} to {len(output_data)} '
+                f'although it declares input and output columns'
+            )
+
+        output_data = output_data[pre_processor.output_columns]
+        output_data.index = dimension_data.index  # Merging pre processors reset the index
+
+        return output_data
+
+    @staticmethod
+    def _get_key_columns(pre_processor: IPreProcessor) -> Tuple[str, ...]:
+        return tuple(pre_processor.input_columns)
+
+    @staticmethod
+    def _get_stage_name(stage: List[IPreProcessor]) -> str:
+        return ', '.join(pre_processor.name for pre_processor in stage)
+
+    @staticmethod
+    def _is_column_local(pre_processor: IPreProcessor) -> bool:
+        return pre_processor.input_columns is not None and pre_processor.output_columns is not None
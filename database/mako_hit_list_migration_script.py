@@ -16,12 +16,13 @@ from spotipyio.utils import extract_first_search_result
 from sqlalchemy import select
 from tqdm import tqdm
 
-from consts.data_consts import SCRAPED_AT, NAME, ARTIST_NAME, ID, TRACK
+from consts.data_consts import SCRAPED_AT, NAME, ARTIST_NAME, ID, TRACK, SONG
 from consts.datetime_consts import DATETIME_FORMAT
 from consts.mako_hit_list_consts import CURRENT_RANK, OVERALL
 from consts.path_consts import MAKO_HIT_LIST_DIR_PATH
 from data_processing.data_merger import DataMerger
 from tools.environment_manager import EnvironmentManager
+from utils.song_utils import build_songs
 
 
 class MakoHitListMigrator:
@@ -56,11 +57,12 @@ class MakoHitListMigrator:
 
     async def _generate_single_date_records(self, data: DataFrame, date_: str) -> List[ChartEntry]:
         date_data = data[data[SCRAPED_AT] == date_].reset_index(drop=True)
+        date_data[SONG] = build_songs(date_data[ARTIST_NAME], date_data[NAME])
         date_ = self._parse_date(date_)
         date_records = []
 
         for i, row in date_data.iterrows():
-            key = f"{row[ARTIST_NAME]} - {row[NAME]}"
+            key = row[SONG]
             track_id = await self._get_track_id(key)
 
             if track_id is not None:
@@ -5,7 +5,6 @@ from typing import List, Type, Generator
 
 import numpy as np
 import pandas as pd
-from asyncio_pool import AioPool
 from pandas import Series, DataFrame
 from genie_datastores.postgres.operations import insert_records, execute_query
 from sqlalchemy import select
@@ -26,6 +25,7 @@ from database.orm_models.spotify_track import SpotifyTrack
 from database.orm_models.track_id_mapping import TrackIDMapping
 from database.orm_models.track_lyrics import TrackLyrics
 from database.postgres_utils import does_record_exist
+from tools.adaptive_aio_pool import AdaptiveAioPool
 from tools.environment_manager import EnvironmentManager
 from utils.data_utils import read_merged_data
 from utils.file_utils import read_json, to_json
@@ -40,10 +40,11 @@ class DatabaseMigrator:
     def __init__(self):
         EnvironmentManager().set_env_variables()
         self._db_engine = ComponentFactory.get_database_engine()
+        self._pool = AdaptiveAioPool(5)
 
     async def migrate(self):
         print("Starting to insert records to database")
-        data = read_merged_data()
+        data = read_merged_data(compact_dtypes=False)  # Records are built from the raw python values
         filtered_data = await self._filter_non_existing_records(data)
 
         if filtered_data.empty:
@@ -54,11 +55,9 @@ class DatabaseMigrator:
         await self._insert_non_existing_records(filtered_data, rows)
 
     async def _insert_non_existing_records(self, data: DataFrame, rows: Generator[Series, None, None]) -> None:
-        pool = AioPool(5)
-
         with tqdm(total=len(data)) as progress_bar:
             func = partial(self._insert_single_row_records, progress_bar)
-            results = await pool.map(func, rows)
+            results = await self._pool.map(func, rows)
 
         error_count = 0
         success_count = 0
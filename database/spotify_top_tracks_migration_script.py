@@ -19,12 +19,13 @@ from spotipyio.utils import extract_first_search_result
 from sqlalchemy import select
 from tqdm import tqdm
 
-from consts.data_consts import STATION, ADDED_AT, ID, ARTIST_NAME, NAME, TRACK
+from consts.data_consts import STATION, ADDED_AT, ID, ARTIST_NAME, NAME, TRACK, SONG
 from consts.datetime_consts import SPOTIFY_DATETIME_FORMAT
 from consts.path_consts import SPOTIFY_CHARTS_OUTPUT_PATH
 from consts.playlists_consts import SPOTIFY_TOP_50_ISRAEL_DAILY, SPOTIFY_TOP_50_GLOBAL_DAILY
 from consts.spotify_consts import RADIO_SNAPSHOTS_DUPLICATE_COLUMNS
 from tools.environment_manager import EnvironmentManager
+from utils.song_utils import build_songs
 
 
 @dataclass
@@ -56,7 +57,10 @@ class SpotifyTopTracksMigrator:
         data = pd.read_csv(SPOTIFY_CHARTS_OUTPUT_PATH)
         relevant_charts_data = data[data[STATION].isin([SPOTIFY_TOP_50_ISRAEL_DAILY, SPOTIFY_TOP_50_GLOBAL_DAILY])]
 
-        return relevant_charts_data.drop_duplicates(subset=RADIO_SNAPSHOTS_DUPLICATE_COLUMNS)
+        non_duplicated_data = relevant_charts_data.drop_duplicates(subset=RADIO_SNAPSHOTS_DUPLICATE_COLUMNS).copy()
+        non_duplicated_data[SONG] = build_songs(non_duplicated_data[ARTIST_NAME], non_duplicated_data[NAME])
+
+        return non_duplicated_data
 
     def _group_data_by_date_and_chart(self, data: DataFrame) -> List[DateChart]:
         print('Grouping data by date and chart')
@@ -125,7 +129,7 @@ class SpotifyTopTracksMigrator:
 
     async def _convert_single_row_to_chart_entry(self, chart: Chart, date: datetime, playlist_id: str, index_and_row: Tuple[int, Series]) -> ChartEntry:
         index, row = index_and_row
-        key = f"{row[ARTIST_NAME]} - {row[NAME]}"
+        key = row[SONG]
         if pd.isna(row[ID]):
             track_id = await self._get_missing_track_id(key)
         else:
@@ -3,7 +3,7 @@ from pandas import DataFrame
 from sklearn.impute import SimpleImputer
 
 from consts.aggregation_consts import MEDIAN
-from consts.data_consts import ARTIST_NAME, PLAY_COUNT, COUNT, DURATION_MS
+from consts.data_consts import ARTIST_NAME, PLAY_COUNT, COUNT, DURATION_MS, NAME
 from consts.gender_researcher_consts import AGGREGATION_MAPPING, MAIN_LANGUAGES, CATEGORICAL_COLUMNS, \
     COLINEAR_COLUMNS, SQUARED_DURATION_MS
 from consts.language_consts import LANGUAGE
@@ -15,7 +15,7 @@ from utils.data_utils import read_merged_data
 
 class GenderDataPreProcessor:
     def pre_process(self):
-        data = read_merged_data()
+        data = read_merged_data(columns=list(AGGREGATION_MAPPING.keys()) + [ARTIST_NAME, NAME])
         groupbyed_data = self._groupby_data(data)
         groupbyed_data[LANGUAGE] = groupbyed_data[LANGUAGE].apply(lambda x: x if x in MAIN_LANGUAGES else OTHER)
         dummies_data = pd.get_dummies(groupbyed_data, columns=CATEGORICAL_COLUMNS)
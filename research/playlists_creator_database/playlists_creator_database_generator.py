@@ -1,12 +1,12 @@
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict
 
 from pandas import DataFrame
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import FunctionTransformer
 
 from consts.aggregation_consts import FIRST, COUNT
-from consts.data_consts import SONG, URI, DURATION_MINUTES, DURATION_MS, MAJOR, MINOR, IS_REMASTERED, REMASTER
+from consts.data_consts import SONG, URI, DURATION_MINUTES, DURATION_MS, MAJOR, MINOR, IS_REMASTERED
 from consts.env_consts import PLAYLISTS_CREATOR_DATABASE_DRIVE_ID, PLAYLISTS_CREATOR_EMBEDDINGS_DRIVE_ID
 from consts.path_consts import PLAYLISTS_CREATOR_DATABASE_OUTPUT_PATH, \
     PLAYLISTS_CREATOR_DATABASE_FILE_NAME, TRACK_NAMES_EMBEDDINGS_FILE_NAME, TRACK_NAMES_EMBEDDINGS_PATH
@@ -16,9 +16,9 @@ from tools.google_drive.google_drive_adapter import GoogleDriveAdapter
 from tools.google_drive.google_drive_upload_metadata import GoogleDriveUploadMetadata
 from utils.data_utils import read_merged_data
 from utils.general_utils import chain_dicts
+from utils.song_utils import remove_remaster_suffixes
 
 ISRAELI_RADIO_PLAY_COUNT = 'israeli_radio_play_count'
-REMASTERED_SEPARATOR = ' - '
 
 
 class PlaylistsCreatorDatabaseGenerator:
@@ -28,7 +28,7 @@ class PlaylistsCreatorDatabaseGenerator:
     def generate_database(self) -> None:
         print('Starting to create PlaylistsCreator database file')
         data = read_merged_data()
-        data[SONG] = data[[SONG, IS_REMASTERED]].apply(lambda x: self._reformat_remaster_title(*x), axis=1)
+        data[SONG] = remove_remaster_suffixes(data[SONG], data[IS_REMASTERED]).astype('category')
         groubyed_data = self._groupby_data(data)
         groubyed_data.dropna(subset=[URI], inplace=True)
         pre_processed_data = self._apply_transformations(groubyed_data)
@@ -37,29 +37,11 @@ class PlaylistsCreatorDatabaseGenerator:
 
         self._output_results(pre_processed_data)
 
-    def _reformat_remaster_title(self, song_name: str, is_remastered: bool) -> str:
-        if not is_remastered:
-            return song_name
-
-        song_name_components = song_name.split(REMASTERED_SEPARATOR)
-        remaster_component_index = self._extract_remaster_component_index(song_name_components)
-
-        if remaster_component_index is None:
-            return song_name
-
-        return REMASTERED_SEPARATOR.join(song_name_components[:remaster_component_index])
-
-    @staticmethod
-    def _extract_remaster_component_index(song_name_components: List[str]) -> Optional[int]:
-        for i, component in enumerate(song_name_components):
-            if component.lower().__contains__(REMASTER):
-                return i
-
     def _groupby_data(self, data: DataFrame) -> DataFrame:
         relevant_data = data.drop(DROPPABLE_COLUMNS, axis=1)
         relevant_data[ISRAELI_RADIO_PLAY_COUNT] = relevant_data[SONG]
         aggregation_mapping = self._build_group_by_aggregation_mapping()
-        groupbyed_data = relevant_data.groupby(SONG, as_index=False).agg(aggregation_mapping)
+        groupbyed_data = relevant_data.groupby(SONG, as_index=False, observed=True).agg(aggregation_mapping)
         groupbyed_data.columns = groupbyed_data.columns.droplevel(1)
 
         return groupbyed_data
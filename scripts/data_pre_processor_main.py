@@ -5,7 +5,7 @@ from data_collectors.components import ComponentFactory
 from spotipyio import SpotifyClient
 from spotipyio.logic.authentication.spotify_session import SpotifySession
 
-from consts.path_consts import MERGED_DATA_PATH
+from consts.path_consts import MERGED_DATA_PATH, MERGED_DATA_PARQUET_DIR, PROFILING_REPORTS_DIR
 from data_processing.data_pre_processor import DataPreProcessor
 from database.migration_script import DatabaseMigrator
 from database.shazam_top_tracks_migration_script import ShazamTopTracksMigrationScript
@@ -26,8 +26,15 @@ async def run_spotify_top_tracks_migration() -> None:
 
 
 async def main():
-    pre_processor = DataPreProcessor(max_year=2024)
-    pre_processor.pre_process(output_path=MERGED_DATA_PATH)
+    pre_processor = DataPreProcessor(
+        max_year=2024,
+        incremental_merge=True,
+        merge_workers=None,
+        pre_processing_workers=None,
+        profiling_reports_dir=PROFILING_REPORTS_DIR,
+        chunk_size=500000
+    )
+    pre_processor.pre_process(output_path=MERGED_DATA_PATH, parquet_output_dir=MERGED_DATA_PARQUET_DIR)
     await DatabaseMigrator().migrate()
     await ShazamTopTracksMigrationScript().run(minimal_date=datetime(2023, 11, 27))
     await ShazamTracksMigrationScript().run()
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, List, Optional
+
+from aiohttp import ClientResponse, ClientResponseError, ServerTimeoutError
+
+from consts.api_consts import AIO_POOL_SIZE
+from consts.typing_consts import AF
+
+TOO_MANY_REQUESTS_STATUS = 429
+SERVER_ERROR_STATUS = 500
+RETRY_AFTER = 'Retry-After'
+
+
+class ThrottlingError(Exception):
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__(f'Request was throttled. Retry after: {retry_after}')
+        self.retry_after = retry_after
+
+
+def raise_for_throttling(response: ClientResponse) -> None:
+    if response.status == TOO_MANY_REQUESTS_STATUS or response.status >= SERVER_ERROR_STATUS:
+        raise ThrottlingError(_parse_retry_after(response.headers.get(RETRY_AFTER)))
+
+
+def _parse_retry_after(raw_retry_after: Optional[str]) -> Optional[float]:
+    if raw_retry_after is None:
+        return
+
+    if raw_retry_after.isdigit():
+        return float(raw_retry_after)
+
+    try:
+        return max(parsedate_to_datetime(raw_retry_after).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return
+
+
+class AdaptiveAioPool:
+    def __init__(self,
+                 size: int = AIO_POOL_SIZE,
+                 min_size: int = 1,
+                 max_size: int = 50,
+                 decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0,
+                 max_retries: int = 3):
+        self._limit = float(size)
+        self._min_size = min_size
+        self._max_size = max_size
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._max_retries = max_retries
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._last_decrease_at = 0.0
+        self._base_latency: Optional[float] = None
+        self._condition = asyncio.Condition()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def size(self) -> int:
+        return int(self._limit)
+
+    async def map(self, fn: AF, iterable: Iterable) -> List[Any]:
+        # Like AioPool, results keep the iterable order and exceptions are returned in place of results
+        self._bind_to_running_loop()
+        return await asyncio.gather(*[self._execute_with_retries(fn, element) for element in iterable])
+
+    def _bind_to_running_loop(self) -> None:
+        # Pools live as long as their collectors, which may be run by more than one event loop
+        loop = asyncio.get_running_loop()
+
+        if loop is not self._loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._in_flight = 0
+
+    async def _execute_with_retries(self, fn: AF, element: Any) -> Any:
+        for attempt in range(self._max_retries + 1):
+            started_at = await self._acquire()
+
+            try:
+                result = await fn(element)
+
+            except (ThrottlingError, ClientResponseError, ServerTimeoutError, asyncio.TimeoutError) as e:
+                if not self._is_throttling(e):
+                    await self._release()
+                    return e
+
+                await self._release(started_at=started_at, throttling=e)
+                if attempt == self._max_retries:
+                    return e
+
+            except Exception as e:
+                await self._release()
+                return e
+
+            else:
+                await self._release(started_at=started_at)
+                return result
+
+    async def _acquire(self) -> float:
+        async with self._condition:
+            while True:
+                waiting_time = self._resume_at - time.monotonic()
+
+                if waiting_time > 0:
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout=waiting_time)
+                    except asyncio.TimeoutError:
+                        pass
+
+                elif self._in_flight >= self.size:
+                    await self._condition.wait()
+
+                else:
+                    self._in_flight += 1
+                    return time.monotonic()
+
+    async def _release(self, started_at: Optional[float] = None, throttling: Optional[Exception] = None) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+
+            if throttling is not None:
+                self._decrease(started_at, throttling)
+            elif started_at is not None:
+                self._increase(time.monotonic() - started_at)
+
+            self._condition.notify_all()
+
+    def _increase(self, latency: float) -> None:
+        self._base_latency = latency if self._base_latency is None else min(self._base_latency, latency)
+
+        if latency <= self._base_latency * self._latency_tolerance:  # Grows by one request per full window
+            self._limit = min(self._limit + 1 / self._limit, self._max_size)
+
+    def _decrease(self, started_at: float, throttling: Exception) -> None:
+        # Requests sent before the last decrease saw the old limit, so a burst of failures backs off only once
+        if started_at >= self._last_decrease_at:
+            previous_size = self.size
+            self._limit = max(self._limit * self._decrease_factor, self._min_size)
+            self._last_decrease_at = time.monotonic()
+
+            if self.size != previous_size:
+                print(f'Requests are throttled. Decreasing concurrency from {previous_size} to {self.size}')
+
+        retry_after = self._get_retry_after(throttling)
+        if retry_after is not None:
+            self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+    @staticmethod
+    def _get_retry_after(throttling: Exception) -> Optional[float]:
+        if isinstance(throttling, ThrottlingError):
+            return throttling.retry_after
+
+        if isinstance(throttling, ClientResponseError) and throttling.headers is not None:
+            return _parse_retry_after(throttling.headers.get(RETRY_AFTER))
+
+    @staticmethod
+    def _is_throttling(e: Exception) -> bool:
+        if isinstance(e, ClientResponseError):
+            return e.status == TOO_MANY_REQUESTS_STATUS or e.status >= SERVER_ERROR_STATUS
+
+        return True
@@ -1,34 +1,73 @@
+import asyncio
+from asyncio import Queue, Task
 from functools import partial
 from inspect import iscoroutinefunction
+from itertools import islice, count
 from math import ceil
-from typing import Generator, Optional, Union, Any, Type
+from typing import Generator, Optional, Union, Any, Type, Iterable, Container, Sized
 
-from asyncio_pool import AioPool
 from tqdm import tqdm
 
 from consts.api_consts import AIO_POOL_SIZE
 from consts.typing_consts import AF, F
+from tools.adaptive_aio_pool import AdaptiveAioPool
+
+PIPELINE_END = object()
 
 
 class DataChunksGenerator:
     def __init__(self, chunk_size: int = 50, max_chunks_number: Optional[int] = 5):
         self._chunk_size = chunk_size
         self._max_chunks_number = max_chunks_number
+        self._pool = AdaptiveAioPool(AIO_POOL_SIZE)  # Shared by all chunks, so learned limits carry over
 
     async def execute_by_chunk_in_parallel(self,
-                                           lst: list,
-                                           filtering_list: Optional[list],
+                                           lst: Iterable,
+                                           filtering_list: Optional[Iterable],
                                            element_func: AF,
                                            chunk_func: F,
-                                           expected_type: Type[Any]):
-        chunks = self.generate_data_chunks(lst=lst, filtering_list=filtering_list)
-
-        for chunk in chunks:
+                                           expected_type: Type[Any],
+                                           pipeline_depth: int = 1):
+        async def fetch_valid_results(chunk: list) -> list:
             results = await self._execute_single_chunk(element_func, chunk)
-            valid_results = [res for res in results if isinstance(res, expected_type)]
-            chunk_func(valid_results)
-
-    async def execute_by_chunk(self, lst: list, filtering_list: Optional[list], func: Union[F, AF]) -> None:
+            return [res for res in results if isinstance(res, expected_type)]
+
+        await self.execute_by_chunk_pipelined(
+            lst=lst,
+            filtering_list=filtering_list,
+            fetch_func=fetch_valid_results,
+            output_func=chunk_func,
+            pipeline_depth=pipeline_depth
+        )
+
+    async def execute_by_chunk_pipelined(self,
+                                         lst: Iterable,
+                                         filtering_list: Optional[Iterable],
+                                         fetch_func: AF,
+                                         output_func: F,
+                                         pipeline_depth: int = 1) -> None:
+        # Up to `pipeline_depth` fetched chunks wait for their output, while the next chunk is already fetched
+        fetched_chunks = Queue(maxsize=pipeline_depth)
+        outputter = asyncio.create_task(self._output_fetched_chunks(fetched_chunks, output_func))
+
+        fetch_error: Optional[BaseException] = None
+
+        try:
+            for chunk in self.generate_data_chunks(lst, filtering_list):
+                fetched_chunk = await fetch_func(chunk)
+                await self._put_fetched_chunk(fetched_chunks, fetched_chunk, outputter)
+
+        except BaseException as e:
+            fetch_error = e
+            raise
+
+        finally:
+            if not outputter.done():  # Already fetched chunks are still written when fetching fails
+                await fetched_chunks.put(PIPELINE_END)
+
+            await self._wait_for_outputter(outputter, fetch_error)
+
+    async def execute_by_chunk(self, lst: Iterable, filtering_list: Optional[Iterable], func: Union[F, AF]) -> None:
         chunks = self.generate_data_chunks(lst, filtering_list)
 
         for i, chunk in enumerate(chunks):
@@ -37,28 +76,105 @@ class DataChunksGenerator:
             else:
                 func(chunk)
 
-    def generate_data_chunks(self, lst: list, filtering_list: Optional[list]) -> Generator[list, None, None]:
-        if filtering_list is not None:
-            lst = [artist for artist in lst if artist not in filtering_list]
+    def generate_data_chunks(self,
+                             lst: Iterable,
+                             filtering_list: Optional[Iterable]) -> Generator[list, None, None]:
+        excluded_elements = self._build_exclusion_index(filtering_list)
+        elements = iter(lst) if excluded_elements is None else (e for e in lst if e not in excluded_elements)
+        total_chunks = self._count_total_chunks(lst, excluded_elements)
+        n_chunks = self._get_chunks_number(total_chunks)
 
-        total_chunks = ceil(len(lst) / self._chunk_size)
-        n_chunks = total_chunks if self._max_chunks_number is None else min(total_chunks, self._max_chunks_number)
-        current_chunk = 0
+        for chunk_number in count(1):
+            if n_chunks is not None and chunk_number > n_chunks:
+                break
 
-        for i in range(0, len(lst), self._chunk_size):
-            if current_chunk == n_chunks:
+            chunk = list(islice(elements, self._chunk_size))
+            if not chunk:
                 break
 
-            print(f'Generating chunk {self._get_chunk_number(i)} out of {n_chunks} (Total: {total_chunks})')
-            yield lst[i: i + self._chunk_size]
-            current_chunk += 1
+            print(f'Generating chunk {chunk_number} {self._format_chunks_progress(n_chunks, total_chunks)}')
+            yield chunk
 
-    async def _execute_single_chunk(self, func: AF, chunk: list) -> Any:
-        pool = AioPool(AIO_POOL_SIZE)
+    @staticmethod
+    def _build_exclusion_index(filtering_list: Optional[Iterable]) -> Optional[Container]:
+        # Without exclusions elements are not looked up at all, so unhashable elements are supported as well
+        if filtering_list is None or (isinstance(filtering_list, Sized) and len(filtering_list) == 0):
+            return None
+
+        if isinstance(filtering_list, (set, frozenset, dict)):
+            return filtering_list
+
+        if isinstance(filtering_list, Container) and not isinstance(filtering_list, Sized):
+            return filtering_list  # E.g. an on disk keys index, queried per element
 
+        return set(filtering_list)
+
+    def _get_chunks_number(self, total_chunks: Optional[int]) -> Optional[int]:
+        if total_chunks is None:
+            return self._max_chunks_number
+
+        if self._max_chunks_number is None:
+            return total_chunks
+
+        return min(total_chunks, self._max_chunks_number)
+
+    def _count_total_chunks(self, lst: Iterable, excluded_elements: Optional[Container]) -> Optional[int]:
+        if not isinstance(lst, Sized):  # Iterators are consumed once, so their length is unknown in advance
+            return None
+
+        if excluded_elements is None:
+            n_excluded = 0
+        elif isinstance(excluded_elements, (set, frozenset, dict)):
+            n_excluded = sum(1 for element in lst if element in excluded_elements)  # Repeated elements count each time
+        else:
+            return None  # Counting would query the index once more for every element
+
+        return ceil((len(lst) - n_excluded) / self._chunk_size)
+
+    @staticmethod
+    def _format_chunks_progress(n_chunks: Optional[int], total_chunks: Optional[int]) -> str:
+        if total_chunks is not None:
+            return f'out of {n_chunks} (Total: {total_chunks})'
+
+        if n_chunks is not None:
+            return f'out of at most {n_chunks} (Total: unknown)'
+
+        return '(Total: unknown)'
+
+    @staticmethod
+    async def _put_fetched_chunk(fetched_chunks: Queue, fetched_chunk: Any, outputter: Task) -> None:
+        put = asyncio.ensure_future(fetched_chunks.put(fetched_chunk))
+        await asyncio.wait([put, outputter], return_when=asyncio.FIRST_COMPLETED)
+
+        if outputter.done():  # A failed output stops consuming, so a full queue would block forever
+            put.cancel()
+            outputter.result()
+
+    @staticmethod
+    async def _wait_for_outputter(outputter: Task, fetch_error: Optional[BaseException]) -> None:
+        try:
+            await outputter
+
+        except Exception as e:
+            if fetch_error is None or e is fetch_error:
+                raise
+
+            print(f'Failed to fetch chunk: {fetch_error!r}')
+            raise e from fetch_error  # The output failure is raised, without hiding the fetch failure before it
+
+    @staticmethod
+    async def _output_fetched_chunks(fetched_chunks: Queue, output_func: F) -> None:
+        while True:
+            fetched_chunk = await fetched_chunks.get()
+            if fetched_chunk is PIPELINE_END:
+                return
+
+            await asyncio.to_thread(output_func, fetched_chunk)  # Writes and uploads do not block the event loop
+
+    async def _execute_single_chunk(self, func: AF, chunk: list) -> Any:
         with tqdm(total=len(chunk)) as progress_bar:
             func = partial(self._execute_single_element, progress_bar, func)
-            return await pool.map(func, chunk)
+            return await self._pool.map(func, chunk)
 
     @staticmethod
     async def _execute_single_element(progress_bar: tqdm, func: AF, element: Any) -> Any:
@@ -66,7 +182,3 @@ class DataChunksGenerator:
         progress_bar.update(1)
 
         return result
-
-    def _get_chunk_number(self, index: int) -> int:
-        chunk_number = (index / self._chunk_size) + 1
-        return int(chunk_number)
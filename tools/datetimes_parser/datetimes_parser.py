@@ -0,0 +1,44 @@
+from threading import Lock
+from typing import Dict
+
+import pandas as pd
+from pandas import Series
+
+DEFAULT_MAX_CACHED_VALUES = 1000000
+
+
+class DatetimesParser:
+    def __init__(self, max_cached_values: int = DEFAULT_MAX_CACHED_VALUES):
+        self._max_cached_values = max_cached_values
+        self._parsed_datetimes: Dict[str, Series] = {}
+        self._lock = Lock()
+
+    def parse(self, column: Series, datetime_format: str) -> Series:
+        with self._lock:
+            parsed_datetimes = self._parse_missing_values(column, datetime_format)
+
+        return Series(parsed_datetimes.reindex(column.to_numpy()).to_numpy(), index=column.index)
+
+    def clear(self) -> None:
+        self._parsed_datetimes = {}
+
+    def _parse_missing_values(self, column: Series, datetime_format: str) -> Series:
+        # Each raw value is parsed once per format, even when pre processors and chunks parse the same column again
+        parsed_datetimes = self._parsed_datetimes.get(datetime_format, Series(dtype='datetime64[ns]'))
+        unique_values = Series(column.dropna().unique())
+        missing_values = unique_values[~unique_values.isin(parsed_datetimes.index)]
+
+        if not missing_values.empty:
+            missing_datetimes = pd.to_datetime(missing_values, format=datetime_format, errors='coerce')
+            missing_datetimes.index = missing_values.to_numpy()
+            parsed_datetimes = pd.concat([parsed_datetimes, missing_datetimes])
+
+        self._parsed_datetimes[datetime_format] = self._evict_least_recently_used(parsed_datetimes, unique_values)
+        return parsed_datetimes
+
+    def _evict_least_recently_used(self, parsed_datetimes: Series, used_values: Series) -> Series:
+        # Values are kept ordered from least to most recently used, so chunked runs keep a bounded cache
+        is_used = parsed_datetimes.index.isin(used_values)
+        ordered_datetimes = pd.concat([parsed_datetimes[~is_used], parsed_datetimes[is_used]])
+
+        return ordered_datetimes.iloc[-self._max_cached_values:]
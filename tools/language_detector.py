@@ -1,24 +1,82 @@
-from typing import Dict, Union
+from importlib.metadata import version, PackageNotFoundError
+from threading import Lock
+from typing import Dict, Union, List, Optional
 
 import spacy
 import spacy_langdetect
 from spacy import Language
 
+from consts.language_consts import LANGUAGE, SCORE, HEBREW_LANGUAGE_ABBREVIATION, HEBREW_CHAR_REGEX, \
+    NON_HEBREW_LETTER_REGEX
+from tools.memo_cache.persistent_memo_cache import PersistentMemoCache
+
 LANGUAGE_DETECTOR_FACTORY_KEY = "language_detector"
+SENTENCIZER_FACTORY_KEY = "sentencizer"
 SPACY_ENGLISH_SMALL_MODEL = "en_core_web_sm"
+LANGUAGE_DETECTION_PACKAGES = [SPACY_ENGLISH_SMALL_MODEL, "spacy_langdetect", "langdetect"]
+SPACY_UNNEEDED_COMPONENTS = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+CERTAIN_SCORE = 1.0
+LanguageRecord = Dict[str, Union[str, float]]
 
 
 class LanguageDetector:
-    def detect_language(self, text: str) -> Dict[str, Union[str, float]]:
-        nlp_doc = self._spacy_model(text)
-        return nlp_doc._.language
+    def __init__(self, batch_size: int = 64, cache: Optional[PersistentMemoCache] = None):
+        self._batch_size = batch_size
+        self._cache = cache
+        self._spacy_model: Optional[Language] = None
+        self._lock = Lock()
+
+    def detect_language(self, text: str) -> LanguageRecord:
+        return self.detect_many([text])[0]
+
+    def detect_many(self, texts: List[str]) -> List[LanguageRecord]:
+        records: List[Optional[LanguageRecord]] = [self._detect_without_model(text) for text in texts]
+        undetected_positions = [i for i, record in enumerate(records) if record is None]
+
+        undetected_texts = list(dict.fromkeys(texts[i] for i in undetected_positions))
+        texts_records = {} if self._cache is None else self._cache.get_many(undetected_texts)
+        new_texts = [text for text in undetected_texts if text not in texts_records]
+
+        if new_texts:
+            docs = self._get_spacy_model().pipe(new_texts, batch_size=self._batch_size)
+            new_texts_records = {text: dict(doc._.language) for text, doc in zip(new_texts, docs)}
+            texts_records.update(new_texts_records)
+
+            if self._cache is not None:
+                self._cache.put_many(new_texts_records)
+
+        for position in undetected_positions:
+            records[position] = dict(texts_records[texts[position]])
+
+        return records
+
+    @staticmethod
+    def get_model_version() -> str:
+        packages_versions = []
+
+        for package in LANGUAGE_DETECTION_PACKAGES:
+            try:
+                packages_versions.append(f'{package}=={version(package)}')
+            except PackageNotFoundError:
+                packages_versions.append(package)
+
+        return ','.join(packages_versions)
+
+    @staticmethod
+    def _detect_without_model(text: str) -> Optional[LanguageRecord]:
+        # Letters are Hebrew only, so running the model could not tell anything else
+        if HEBREW_CHAR_REGEX.search(text) is not None and NON_HEBREW_LETTER_REGEX.search(text) is None:
+            return {LANGUAGE: HEBREW_LANGUAGE_ABBREVIATION, SCORE: CERTAIN_SCORE}
 
-    @property
-    def _spacy_model(self) -> Language:
-        spacy_model = spacy.load(SPACY_ENGLISH_SMALL_MODEL)
-        spacy_model.add_pipe(LANGUAGE_DETECTOR_FACTORY_KEY, last=True)
+    def _get_spacy_model(self) -> Language:
+        with self._lock:
+            if self._spacy_model is None:
+                self._spacy_model = spacy.load(SPACY_ENGLISH_SMALL_MODEL, exclude=SPACY_UNNEEDED_COMPONENTS)
+                # spacy_langdetect scores each sentence, so a lightweight rule based splitter replaces the parser
+                self._spacy_model.add_pipe(SENTENCIZER_FACTORY_KEY)
+                self._spacy_model.add_pipe(LANGUAGE_DETECTOR_FACTORY_KEY, last=True)
 
-        return spacy_model
+            return self._spacy_model
 
     @staticmethod
     @Language.factory(LANGUAGE_DETECTOR_FACTORY_KEY)
@@ -0,0 +1,118 @@
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Iterable, Optional, Tuple
+
+import numpy as np
+
+from consts.miscellaneous_consts import JSON_ENCODING
+from utils.file_utils import read_json, hash_file_content
+
+LYRICS_STORE_DATA_SUFFIX = '.bin'
+LYRICS_STORE_INDEX_SUFFIX = '.index.npz'
+TEMPORARY_FILE_SUFFIX = '.tmp'
+INDEX_IDS = 'ids'
+INDEX_OFFSETS = 'offsets'
+INDEX_LENGTHS = 'lengths'
+INDEX_SOURCE_HASH = 'source_hash'
+
+
+class LyricsStore:
+    def __init__(self, source_path: str, store_dir: str):
+        store_name = Path(source_path).stem
+        self._source_path = source_path
+        self._data_path = os.path.join(store_dir, f'{store_name}{LYRICS_STORE_DATA_SUFFIX}')
+        self._index_path = os.path.join(store_dir, f'{store_name}{LYRICS_STORE_INDEX_SUFFIX}')
+        self._index: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._index_modified_at: Optional[float] = None
+        self._checked_source_stat: Optional[Tuple[int, int]] = None
+        self._lock = Lock()
+
+    @property
+    def ids(self) -> np.ndarray:
+        ids, _, _ = self._load_index()
+        return ids
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, List[str]]:
+        stored_ids, offsets, lengths = self._load_index()
+        requested_ids = np.unique(np.asarray(list(ids), dtype=str))
+        if len(stored_ids) == 0 or len(requested_ids) == 0:
+            return {}
+
+        positions = np.minimum(np.searchsorted(stored_ids, requested_ids), len(stored_ids) - 1)
+        positions = positions[stored_ids[positions] == requested_ids]
+        positions.sort()  # Ids are sorted by offset, so the data file is read sequentially
+        lyrics = {}
+
+        with open(self._data_path, 'rb') as f:
+            for position in positions:
+                f.seek(offsets[position])
+                lyrics[str(stored_ids[position])] = json.loads(f.read(lengths[position]).decode(JSON_ENCODING))
+
+        return lyrics
+
+    def _load_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        with self._lock:
+            if self._is_outdated():
+                self._build()
+
+            index_modified_at = os.path.getmtime(self._index_path)
+            if self._index is None or self._index_modified_at != index_modified_at:
+                with np.load(self._index_path) as index:
+                    self._index = index[INDEX_IDS], index[INDEX_OFFSETS], index[INDEX_LENGTHS]
+
+                self._index_modified_at = index_modified_at
+
+            return self._index
+
+    def _is_outdated(self) -> bool:
+        if not os.path.exists(self._index_path) or not os.path.exists(self._data_path):
+            return True
+
+        # The source is rewritten by its analyzer on every run, so its content is compared once per rewrite
+        source_stat = self._get_source_stat()
+        if source_stat == self._checked_source_stat:
+            return False
+
+        with np.load(self._index_path) as index:
+            if INDEX_SOURCE_HASH not in index.files or str(index[INDEX_SOURCE_HASH]) != self._hash_source():
+                return True
+
+        self._checked_source_stat = source_stat
+        return False
+
+    def _build(self) -> None:
+        print(f'Building lyrics store of `{self._source_path}`')
+        source_stat = self._get_source_stat()
+        source_hash = self._hash_source()
+        lyrics = read_json(self._source_path)
+        ids = np.array(sorted(lyrics.keys()), dtype=str)
+        offsets = np.zeros(len(ids), dtype=np.int64)
+        lengths = np.zeros(len(ids), dtype=np.int64)
+        os.makedirs(os.path.dirname(self._data_path), exist_ok=True)
+
+        with open(f'{self._data_path}{TEMPORARY_FILE_SUFFIX}', 'wb') as f:
+            for i, track_id in enumerate(ids):
+                encoded_lyrics = json.dumps(lyrics[track_id], ensure_ascii=False).encode(JSON_ENCODING)
+                offsets[i] = f.tell()
+                lengths[i] = len(encoded_lyrics)
+                f.write(encoded_lyrics)
+
+        with open(f'{self._index_path}{TEMPORARY_FILE_SUFFIX}', 'wb') as f:
+            np.savez(
+                f,
+                **{INDEX_IDS: ids, INDEX_OFFSETS: offsets, INDEX_LENGTHS: lengths, INDEX_SOURCE_HASH: source_hash}
+            )
+
+        # A crash between the replacements keeps the previous index, whose source hash no longer matches the source
+        os.replace(f'{self._data_path}{TEMPORARY_FILE_SUFFIX}', self._data_path)
+        os.replace(f'{self._index_path}{TEMPORARY_FILE_SUFFIX}', self._index_path)
+        self._checked_source_stat = source_stat
+
+    def _get_source_stat(self) -> Tuple[int, int]:
+        source_stat = os.stat(self._source_path)
+        return source_stat.st_size, source_stat.st_mtime_ns
+
+    def _hash_source(self) -> str:
+        return hash_file_content(self._source_path)
@@ -0,0 +1,88 @@
+import re
+import string
+from typing import Dict, Iterable, List, Optional, Pattern
+
+import numpy as np
+import pandas as pd
+from pandas import Series
+from scipy.sparse import csr_matrix
+
+DEFAULT_CLEANING_REGEX = re.compile(r'[%s]' % re.escape(string.punctuation))
+MATRIX_DATA = 'data'
+MATRIX_INDICES = 'indices'
+MATRIX_INDPTR = 'indptr'
+MATRIX_SHAPE = 'shape'
+VOCABULARY = 'vocabulary'
+IDS = 'ids'
+
+
+class LyricsTermMatrix:
+    def __init__(self, matrix: csr_matrix, vocabulary: np.ndarray, ids: np.ndarray):
+        self.matrix = matrix
+        self.vocabulary = vocabulary
+        self.ids = ids
+
+    @classmethod
+    def build(cls,
+              lyrics: Iterable[Optional[List[str]]],
+              ids: Optional[Iterable[str]] = None,
+              cleaning_regex: Pattern = DEFAULT_CLEANING_REGEX,
+              replacement: str = '',
+              lowercase: bool = True) -> 'LyricsTermMatrix':
+        tracks_lyrics = Series(list(lyrics), dtype=object)
+        is_valid = tracks_lyrics.map(lambda x: isinstance(x, list))
+        texts = tracks_lyrics.where(is_valid, None).str.join('\n').fillna('')
+        texts = texts.str.replace(cleaning_regex, replacement, regex=True)
+        if lowercase:
+            texts = texts.str.lower()
+
+        tokens = texts.str.split().explode().dropna()  # All tracks are tokenized in a single batched pass
+        tokens_codes, vocabulary = pd.factorize(tokens, sort=True)
+        matrix = csr_matrix(
+            (np.ones(len(tokens_codes), dtype=np.int32), (tokens.index.to_numpy(), tokens_codes)),
+            shape=(len(tracks_lyrics), len(vocabulary))
+        )
+        matrix.sum_duplicates()
+        tracks_ids = np.arange(len(tracks_lyrics)).astype(str) if ids is None else np.asarray(list(ids), dtype=str)
+
+        return cls(matrix=matrix, vocabulary=np.asarray(vocabulary, dtype=str), ids=tracks_ids)
+
+    @property
+    def number_of_words(self) -> np.ndarray:
+        return np.asarray(self.matrix.sum(axis=1)).ravel()
+
+    def top_words(self, k: int) -> Dict[str, int]:
+        words_totals = np.asarray(self.matrix.sum(axis=0)).ravel()
+        top_positions = np.argsort(-words_totals, kind='stable')[:k]
+
+        return dict(zip(self.vocabulary[top_positions].tolist(), words_totals[top_positions].tolist()))
+
+    def get_words_count(self, position: int) -> Dict[str, int]:
+        start, end = self.matrix.indptr[position], self.matrix.indptr[position + 1]
+        counts = self.matrix.data[start:end]
+        descending_order = np.argsort(-counts, kind='stable')
+        words = self.vocabulary[self.matrix.indices[start:end][descending_order]]
+
+        return dict(zip(words.tolist(), counts[descending_order].tolist()))
+
+    def to_npz(self, path: str) -> None:
+        np.savez_compressed(
+            path,
+            **{
+                MATRIX_DATA: self.matrix.data,
+                MATRIX_INDICES: self.matrix.indices,
+                MATRIX_INDPTR: self.matrix.indptr,
+                MATRIX_SHAPE: np.array(self.matrix.shape),
+                VOCABULARY: self.vocabulary,
+                IDS: self.ids
+            }
+        )
+
+    @classmethod
+    def from_npz(cls, path: str) -> 'LyricsTermMatrix':
+        with np.load(path) as term_matrix:
+            matrix = csr_matrix(
+                (term_matrix[MATRIX_DATA], term_matrix[MATRIX_INDICES], term_matrix[MATRIX_INDPTR]),
+                shape=tuple(term_matrix[MATRIX_SHAPE])
+            )
+            return cls(matrix=matrix, vocabulary=term_matrix[VOCABULARY], ids=term_matrix[IDS])
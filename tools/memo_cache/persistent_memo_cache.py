@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Any, Dict, List
+
+SQLITE_MAX_VARIABLES = 900
+CREATE_TABLE_QUERY = 'CREATE TABLE IF NOT EXISTS memo (key TEXT PRIMARY KEY, value TEXT, used_at INTEGER)'
+CREATE_INDEX_QUERY = 'CREATE INDEX IF NOT EXISTS memo_used_at ON memo (used_at)'
+
+
+class PersistentMemoCache:
+    def __init__(self, path: str, version: str, max_size: int = 1000000):
+        self._path = path
+        self._version = version
+        self._max_size = max_size
+        self._connection = None
+        self._lock = Lock()
+
+    def get_many(self, texts: List[str]) -> Dict[str, Any]:
+        keys_texts = {self._to_key(text): text for text in texts}
+        keys = list(keys_texts.keys())
+        values = {}
+
+        with self._lock:
+            connection = self._get_connection()
+
+            for i in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                keys_batch = keys[i: i + SQLITE_MAX_VARIABLES]
+                placeholders = ','.join('?' * len(keys_batch))
+                rows = connection.execute(f'SELECT key, value FROM memo WHERE key IN ({placeholders})', keys_batch)
+                found_keys = []
+
+                for key, value in rows.fetchall():
+                    values[keys_texts[key]] = json.loads(value)
+                    found_keys.append(key)
+
+                connection.executemany(
+                    'UPDATE memo SET used_at = ? WHERE key = ?',
+                    [(time.time_ns(), key) for key in found_keys]
+                )
+
+            connection.commit()
+
+        return values
+
+    def put_many(self, texts_values: Dict[str, Any]) -> None:
+        rows = [(self._to_key(text), json.dumps(value), time.time_ns()) for text, value in texts_values.items()]
+
+        with self._lock:
+            connection = self._get_connection()
+            connection.executemany('INSERT OR REPLACE INTO memo (key, value, used_at) VALUES (?, ?, ?)', rows)
+            self._evict_least_recently_used(connection)
+            connection.commit()
+
+    def _evict_least_recently_used(self, connection: sqlite3.Connection) -> None:
+        size = connection.execute('SELECT COUNT(*) FROM memo').fetchone()[0]
+
+        if size > self._max_size:
+            connection.execute(
+                'DELETE FROM memo WHERE key IN (SELECT key FROM memo ORDER BY used_at LIMIT ?)',
+                (size - self._max_size,)
+            )
+
+    def _to_key(self, text: str) -> str:
+        # Results of another model version are never returned, and are evicted once they are the least recently used
+        return hashlib.sha256(f'{self._version}\0{text}'.encode()).hexdigest()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._path) or '.', exist_ok=True)
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.execute(CREATE_TABLE_QUERY)
+            self._connection.execute(CREATE_INDEX_QUERY)
+
+        return self._connection
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from dataclasses_json import dataclass_json
+
+
+@dataclass_json
+@dataclass
+class StageProfile:
+    stage: str
+    wall_time_seconds: float
+    cpu_time_seconds: float
+    peak_rss_delta_bytes: int
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    columns_out: Optional[int] = None
+    bytes_in: Optional[int] = None
+    bytes_out: Optional[int] = None
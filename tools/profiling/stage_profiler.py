@@ -0,0 +1,134 @@
+import os
+import time
+from datetime import datetime
+from threading import Thread, Event
+from typing import Callable, Any, Optional, List
+
+import pandas as pd
+import psutil
+from pandas import DataFrame
+
+from consts.datetime_consts import DATETIME_FORMAT
+from consts.profiling_consts import STAGE, PROFILING_REPORT_JSON_SUFFIX, PROFILING_REPORT_CSV_SUFFIX, \
+    PROFILING_DIFF_SUFFIX, PROFILING_DIFF_COLUMNS, PREVIOUS_SUFFIX, DIFF_SUFFIX, RSS_SAMPLING_INTERVAL_SECONDS
+from tools.profiling.stage_profile import StageProfile
+from utils.file_utils import to_json, read_json, to_csv
+
+
+class StageProfiler:
+    def __init__(self, reports_dir: Optional[str] = None, compare_to_previous_run: bool = True):
+        self._reports_dir = reports_dir
+        self._compare_to_previous_run = compare_to_previous_run
+        self._process = psutil.Process()
+        self._profiles: List[StageProfile] = []
+
+    def run(self, stage: str, func: Callable[..., Any], data: Optional[DataFrame] = None) -> Any:
+        if self._reports_dir is None:  # Profiling is disabled
+            return func() if data is None else func(data)
+
+        rows_in = self._count_rows(data)
+        bytes_in = self._count_bytes(data)  # Measured before pre processors modify their input in place
+        rss_sampler = _PeakRSSSampler(self._process)
+        rss_sampler.start()
+        cpu_start_time = self._get_cpu_time()
+        start_time = time.perf_counter()
+
+        output = func() if data is None else func(data)
+
+        wall_time = time.perf_counter() - start_time
+        cpu_time = self._get_cpu_time() - cpu_start_time
+        self._profiles.append(
+            StageProfile(
+                stage=stage,
+                wall_time_seconds=wall_time,
+                cpu_time_seconds=cpu_time,
+                peak_rss_delta_bytes=rss_sampler.stop(),
+                rows_in=rows_in,
+                rows_out=self._count_rows(output),
+                columns_out=len(output.columns) if isinstance(output, DataFrame) else None,
+                bytes_in=bytes_in,
+                bytes_out=self._count_bytes(output)
+            )
+        )
+
+        return output
+
+    def write_report(self) -> Optional[DataFrame]:
+        if self._reports_dir is None:
+            return
+
+        os.makedirs(self._reports_dir, exist_ok=True)
+        previous_report_path = self._find_previous_report_path()
+        report_name = datetime.now().strftime(DATETIME_FORMAT)
+        report_path = os.path.join(self._reports_dir, report_name)
+        records = [profile.to_dict() for profile in self._profiles]
+        report = pd.DataFrame.from_records(records)
+
+        to_json(d=records, path=f'{report_path}{PROFILING_REPORT_JSON_SUFFIX}')
+        to_csv(data=report, output_path=f'{report_path}{PROFILING_REPORT_CSV_SUFFIX}')
+
+        if self._compare_to_previous_run and previous_report_path is not None:
+            diff = self._diff_reports(report, previous_report_path)
+            to_csv(data=diff, output_path=f'{report_path}{PROFILING_DIFF_SUFFIX}')
+            print(f'Pre processing profile compared to previous run:\n{diff.to_string(index=False)}')
+
+        self._profiles = []
+        return report
+
+    def _find_previous_report_path(self) -> Optional[str]:
+        reports_names = sorted(
+            file_name for file_name in os.listdir(self._reports_dir)
+            if file_name.endswith(PROFILING_REPORT_JSON_SUFFIX)
+        )
+        if reports_names:
+            return os.path.join(self._reports_dir, reports_names[-1])
+
+    @staticmethod
+    def _diff_reports(report: DataFrame, previous_report_path: str) -> DataFrame:
+        previous_report = pd.DataFrame.from_records(read_json(previous_report_path))
+        merged_reports = report[[STAGE] + PROFILING_DIFF_COLUMNS].merge(
+            right=previous_report[[STAGE] + PROFILING_DIFF_COLUMNS],
+            how='outer',
+            on=STAGE,
+            suffixes=('', PREVIOUS_SUFFIX)
+        )
+
+        for column in PROFILING_DIFF_COLUMNS:
+            previous_column = f'{column}{PREVIOUS_SUFFIX}'
+            merged_reports[f'{column}{DIFF_SUFFIX}'] = merged_reports[column] - merged_reports[previous_column]
+
+        return merged_reports
+
+    def _get_cpu_time(self) -> float:
+        cpu_times = self._process.cpu_times()
+        return cpu_times.user + cpu_times.system
+
+    @staticmethod
+    def _count_rows(data: Any) -> Optional[int]:
+        if isinstance(data, DataFrame):
+            return len(data)
+
+    @staticmethod
+    def _count_bytes(data: Any) -> Optional[int]:
+        if isinstance(data, DataFrame):
+            return int(data.memory_usage(deep=True).sum())
+
+
+class _PeakRSSSampler(Thread):
+    def __init__(self, process: psutil.Process):
+        super().__init__(daemon=True)
+        self._process = process
+        self._start_rss = process.memory_info().rss
+        self._peak_rss = self._start_rss
+        self._stop_event = Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(RSS_SAMPLING_INTERVAL_SECONDS):
+            self._peak_rss = max(self._peak_rss, self._process.memory_info().rss)
+
+    def stop(self) -> int:
+        self._stop_event.set()
+        self.join()
+        self._peak_rss = max(self._peak_rss, self._process.memory_info().rss)
+
+        return self._peak_rss - self._start_rss
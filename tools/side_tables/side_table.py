@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Optional, List, Dict
+
+
+@dataclass
+class SideTable:
+    path: str
+    columns: Optional[List[str]] = None
+    dtypes: Optional[Dict[str, str]] = None
@@ -0,0 +1,47 @@
+import os
+from threading import Lock
+from typing import Dict, Union, Tuple, Optional, List
+
+import pandas as pd
+from pandas import DataFrame
+
+from tools.side_tables.side_table import SideTable
+from utils.file_utils import read_json, get_path_suffix
+
+JSON_SUFFIX = '.json'
+SideTableData = Union[DataFrame, dict, list]
+
+
+class SideTablesRegistry:
+    def __init__(self, side_tables: Dict[str, SideTable]):
+        self._side_tables = side_tables
+        self._loaded_side_tables: Dict[str, Tuple[float, SideTableData]] = {}
+        self._locks = {name: Lock() for name in side_tables}  # Pre processors may request tables concurrently
+
+    def get(self, name: str, columns: Optional[List[str]] = None) -> SideTableData:
+        side_table = self._side_tables[name]
+        modification_time = os.path.getmtime(side_table.path)
+
+        with self._locks[name]:
+            loaded_side_table = self._loaded_side_tables.get(name)
+
+            if loaded_side_table is None or loaded_side_table[0] != modification_time:
+                print(f'Loading side table `{name}` from `{side_table.path}`')
+                loaded_side_table = (modification_time, self._load(side_table))
+                self._loaded_side_tables[name] = loaded_side_table
+
+        data = loaded_side_table[1]
+        if not isinstance(data, DataFrame):  # JSON tables are shared between callers and must not be modified
+            return data
+
+        return data.copy() if columns is None else data[columns].copy()
+
+    def clear(self) -> None:
+        self._loaded_side_tables = {}
+
+    @staticmethod
+    def _load(side_table: SideTable) -> SideTableData:
+        if get_path_suffix(side_table.path) == JSON_SUFFIX:
+            return read_json(side_table.path)
+
+        return pd.read_csv(side_table.path, usecols=side_table.columns, dtype=side_table.dtypes)
@@ -0,0 +1,14 @@
+from aiohttp import ClientSession
+from shazamio import Shazam
+from shazamio.utils import validate_json
+
+from tools.adaptive_aio_pool import raise_for_throttling
+
+
+class ThrottlingAwareShazam(Shazam):
+    @staticmethod
+    async def request(method: str, url: str, *args, **kwargs) -> dict:
+        async with ClientSession() as session:
+            async with session.request(method, url, **kwargs) as response:
+                raise_for_throttling(response)
+                return await validate_json(response, *args)
@@ -1,17 +1,36 @@
+import operator
 import os
-from typing import Union, List
+from datetime import datetime
+from typing import Union, List, Optional, Iterator
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
-from consts.audio_features_consts import MERGED_DATA_DTYPES
-from consts.data_consts import ARTIST_NAME, POPULARITY
-from consts.path_consts import MERGED_DATA_PATH
+from consts.audio_features_consts import MERGED_DATA_DTYPES, MERGED_DATA_COMPACT_DTYPES
+from consts.data_consts import ARTIST_NAME, POPULARITY, SCRAPED_AT, SCRAPED_DATE, STATION, ADDED_AT
+from consts.datetime_consts import SPOTIFY_DATETIME_FORMAT, DATE_FORMAT
+from consts.path_consts import MERGED_DATA_PATH, MERGED_DATA_PARQUET_DIR
+from utils.file_utils import to_partitioned_parquet, read_partitioned_parquet, to_json, read_json, \
+    generate_partitioned_parquet_chunks
+
+MERGED_DATA_CSV_CHUNK_SIZE = 500000
+PARQUET_STORE_MARKER_FILE_NAME = '_merged_data_marker.json'  # Underscore prefixed files are not read as parquet
+FILTER_OPERATORS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda column, values: column.isin(values),
+    'not in': lambda column, values: ~column.isin(values)
+}
 
 
 def groupby_artists_by_desc_popularity() -> DataFrame:
-    data = pd.read_csv(MERGED_DATA_PATH)
-    artists_popularity_data = data[[ARTIST_NAME, POPULARITY]]
+    artists_popularity_data = read_merged_data(columns=[ARTIST_NAME, POPULARITY])
     artists_mean_popularity = artists_popularity_data.groupby(by=ARTIST_NAME).mean()
     artists_mean_popularity.reset_index(level=0, inplace=True)
     artists_mean_popularity.sort_values(by=POPULARITY, ascending=False, inplace=True)
@@ -37,8 +56,151 @@ def extract_column_existing_values(path: str, column_name: Union[str, List[str]]
         return list(existing_data[column_name].itertuples(index=False, name=None))
 
 
-def read_merged_data() -> DataFrame:
-    return pd.read_csv(MERGED_DATA_PATH, dtype=MERGED_DATA_DTYPES)
+def read_merged_data(columns: Optional[List[str]] = None,
+                     stations: Optional[List[str]] = None,
+                     start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None,
+                     filters: Optional[List[tuple]] = None,
+                     compact_dtypes: bool = True) -> DataFrame:
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+
+    rows_filters = list(filters or [])
+    if stations is not None:
+        rows_filters.append((STATION, 'in', stations))
+    if start_date is not None:
+        rows_filters.append((ADDED_AT, '>=', start_date.strftime(SPOTIFY_DATETIME_FORMAT)))
+    if end_date is not None:
+        rows_filters.append((ADDED_AT, '<=', end_date.strftime(SPOTIFY_DATETIME_FORMAT)))
+
+    if _is_merged_data_parquet_store_updated():
+        data = _read_merged_data_parquet(columns, rows_filters, start_date)
+    else:
+        data = _read_merged_data_csv(columns, rows_filters)
+
+    return apply_compact_dtypes(data) if compact_dtypes else data
+
+
+def generate_merged_data_chunks(chunk_size: int) -> Iterator[DataFrame]:
+    yield from pd.read_csv(MERGED_DATA_PATH, dtype=MERGED_DATA_DTYPES, chunksize=chunk_size)
+
+
+def apply_compact_dtypes(data: DataFrame) -> DataFrame:
+    compact_data = data.copy()
+
+    for column, dtype in MERGED_DATA_COMPACT_DTYPES.items():
+        if column in compact_data.columns:
+            try:
+                compact_data[column] = compact_data[column].astype(dtype)
+            except (TypeError, ValueError):
+                print(f'Could not convert column `{column}` to `{dtype}`. Keeping `{compact_data[column].dtype}`')
+
+    return compact_data
+
+
+def _read_merged_data_parquet(columns: Optional[List[str]],
+                              rows_filters: List[tuple],
+                              start_date: Optional[datetime]) -> DataFrame:
+    if start_date is not None:  # Tracks are always added before being scraped, so older partitions can be pruned
+        rows_filters = rows_filters + [(SCRAPED_DATE, '>=', start_date.strftime(DATE_FORMAT))]
+
+    return read_snapshots_parquet(MERGED_DATA_PARQUET_DIR, columns=columns, filters=rows_filters or None)
+
+
+def _read_merged_data_csv(columns: Optional[List[str]], rows_filters: List[tuple]) -> DataFrame:
+    if not rows_filters:
+        return pd.read_csv(MERGED_DATA_PATH, dtype=MERGED_DATA_DTYPES, usecols=columns)
+
+    if columns is None:
+        used_columns = None
+    else:
+        used_columns = list(dict.fromkeys(columns + [column for column, _, _ in rows_filters]))
+
+    chunks = pd.read_csv(
+        MERGED_DATA_PATH,
+        dtype=MERGED_DATA_DTYPES,
+        usecols=used_columns,
+        chunksize=MERGED_DATA_CSV_CHUNK_SIZE
+    )
+    data = pd.concat([chunk[_apply_rows_filters(chunk, rows_filters)] for chunk in chunks], ignore_index=True)
+
+    return data if columns is None else data[columns]
+
+
+def _apply_rows_filters(data: DataFrame, rows_filters: List[tuple]) -> Series:
+    mask = Series(True, index=data.index)
+
+    for column, operator_name, value in rows_filters:
+        mask &= FILTER_OPERATORS[operator_name](data[column], value)
+
+    return mask
+
+
+def mark_merged_data_parquet_store_updated(parquet_dir: str) -> None:
+    # Directory mtimes miss nested partitions writes, so the store records the merged data CSV it is as new as
+    to_json(d={MERGED_DATA_PATH: _fingerprint_file(MERGED_DATA_PATH)}, path=_get_parquet_store_marker_path(parquet_dir))
+
+
+def _is_merged_data_parquet_store_updated() -> bool:
+    marker_path = _get_parquet_store_marker_path(MERGED_DATA_PARQUET_DIR)
+    if not os.path.exists(marker_path):  # Stores without a marker may be partially written
+        return False
+
+    if not os.path.exists(MERGED_DATA_PATH):
+        return True
+
+    return read_json(marker_path).get(MERGED_DATA_PATH) == _fingerprint_file(MERGED_DATA_PATH)
+
+
+def _get_parquet_store_marker_path(parquet_dir: str) -> str:
+    return os.path.join(parquet_dir, PARQUET_STORE_MARKER_FILE_NAME)
+
+
+def _fingerprint_file(path: str) -> Optional[List[int]]:
+    if not os.path.exists(path):
+        return None
+
+    file_stat = os.stat(path)
+    return [file_stat.st_size, file_stat.st_mtime_ns]
+
+
+def to_snapshots_parquet(data: DataFrame, output_dir: str, partition_columns: List[str], mode: str = 'w') -> None:
+    data_with_scraped_date = data.assign(**{SCRAPED_DATE: data[SCRAPED_AT].str.partition(' ')[0]})
+    to_partitioned_parquet(
+        data=data_with_scraped_date,
+        output_dir=output_dir,
+        partition_columns=partition_columns,
+        mode=mode
+    )
+
+
+def read_snapshots_parquet(dir_path: str,
+                           columns: Optional[List[str]] = None,
+                           filters: Optional[List[tuple]] = None) -> DataFrame:
+    data = read_partitioned_parquet(dir_path=dir_path, columns=columns, filters=filters)
+
+    if columns is None or SCRAPED_DATE not in columns:
+        return data.drop(SCRAPED_DATE, axis=1, errors='ignore')
+
+    return data
+
+
+def generate_snapshots_parquet_chunks(dir_path: str, chunk_size: int) -> Iterator[DataFrame]:
+    for chunk in generate_partitioned_parquet_chunks(dir_path=dir_path, chunk_size=chunk_size):
+        yield chunk.drop(SCRAPED_DATE, axis=1, errors='ignore')
+
+
+def get_first_non_na_positions(data: DataFrame) -> np.ndarray:
+    # Position of the first non missing column of each row, or -1 when all columns are missing
+    is_not_na = data.notna().to_numpy()
+    return np.where(is_not_na.any(axis=1), is_not_na.argmax(axis=1), -1)
+
+
+def select_by_positions(data: DataFrame, positions: np.ndarray) -> np.ndarray:
+    values = data.to_numpy(dtype=object)[np.arange(len(data)), positions]
+    values[positions == -1] = np.nan
+
+    return values
 
 
 def is_list_na(value: Union[float, List[str]]) -> bool:
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 
 import pytz
+from pandas import Series
 
 from consts.datetime_consts import DATETIME_FORMAT, DAYS_IN_YEAR
 
@@ -17,3 +18,8 @@ def now_israel_timezone() -> datetime:
 def convert_timedelta_to_years(delta: timedelta) -> int:
     years = delta.days / DAYS_IN_YEAR
     return round(years)
+
+
+def calculate_ages(birth_dates: Series) -> Series:
+    ages_days = (datetime.now() - birth_dates).dt.days
+    return (ages_days / DAYS_IN_YEAR).round()
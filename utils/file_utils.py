@@ -1,13 +1,23 @@
+import hashlib
 import json
 import os
+import shutil
+from functools import partial
 from pathlib import Path
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Iterator
 
-from pandas import DataFrame
+import pandas as pd
+import pyarrow
+import pyarrow.dataset
+from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype
 
 from consts.miscellaneous_consts import JSON_ENCODING, UTF_8_ENCODING
 from tools.csv_appender import CSVAppender
 
+FILE_READ_BLOCK_SIZE = 2 ** 20
+PARQUET_COMPATIBLE_OBJECT_TYPES = ['string', 'boolean', 'integer', 'floating', 'mixed-integer-float', 'empty']
+
 
 def to_json(d: Union[dict, list], path: str) -> None:
     with open(path, 'w', encoding=JSON_ENCODING) as f:
@@ -35,6 +45,64 @@ def append_to_csv(data: DataFrame, output_path: str, escapechar: Optional[str] =
         to_csv(data=data, output_path=output_path)
 
 
+def to_partitioned_parquet(data: DataFrame, output_dir: str, partition_columns: List[str], mode: str = 'w') -> None:
+    if mode == 'w' and os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+
+    compatible_data = stringify_parquet_incompatible_columns(data)
+    compatible_data.to_parquet(output_dir, engine='pyarrow', partition_cols=partition_columns, index=False)
+
+
+def stringify_parquet_incompatible_columns(data: DataFrame) -> DataFrame:
+    incompatible_columns = [
+        column for column in data.select_dtypes(include='object').columns if not _is_parquet_compatible(data[column])
+    ]
+    return data.assign(**{column: _stringify_non_na(data[column]) for column in incompatible_columns})
+
+
+def read_partitioned_parquet(dir_path: str,
+                             columns: Optional[List[str]] = None,
+                             filters: Optional[List[tuple]] = None) -> DataFrame:
+    return pd.read_parquet(dir_path, engine='pyarrow', columns=columns, filters=filters)
+
+
+def generate_partitioned_parquet_chunks(dir_path: str, chunk_size: int) -> Iterator[DataFrame]:
+    # Record batches never span part files, so small batches are combined up to the chunk size
+    dataset = pyarrow.dataset.dataset(dir_path, format='parquet', partitioning='hive')
+    batches = []
+    batches_rows_number = 0
+
+    for batch in dataset.to_batches(batch_size=chunk_size):
+        batches.append(batch)
+        batches_rows_number += batch.num_rows
+
+        if batches_rows_number >= chunk_size:
+            yield pyarrow.Table.from_batches(batches).to_pandas()
+            batches = []
+            batches_rows_number = 0
+
+    if batches:
+        yield pyarrow.Table.from_batches(batches).to_pandas()
+
+
+def _is_parquet_compatible(column: Series) -> bool:
+    return infer_dtype(column, skipna=True) in PARQUET_COMPATIBLE_OBJECT_TYPES
+
+
+def _stringify_non_na(column: Series) -> Series:  # Serializes lists, dicts and mixed values the same way as to_csv
+    return column.where(column.isna(), column.astype(str))
+
+
+def hash_file_content(path: str) -> str:
+    file_hash = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        for block in iter(partial(f.read, FILE_READ_BLOCK_SIZE), b''):
+            file_hash.update(block)
+
+    return file_hash.hexdigest()
+
+
 def load_txt_file_lines(path: str) -> List[str]:
     with open(path, encoding=JSON_ENCODING) as f:
         hebrew_words: str = f.read()
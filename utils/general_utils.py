@@ -7,6 +7,7 @@ from typing import List, Optional, Tuple, Any, Union, Iterator
 
 import numpy as np
 import pandas as pd
+from pandas import Series
 
 from component_factory import ComponentFactory
 from consts.env_consts import IS_REMOTE_RUN
@@ -18,11 +19,19 @@ def chain_dicts(dicts: List[dict]) -> dict:
 
 
 def is_in_hebrew(s: str) -> bool:
+    return are_in_hebrew([s])[0]
+
+
+def are_in_hebrew(texts: List[str]) -> List[bool]:
+    is_hebrew = [False] * len(texts)
+    non_ascii_positions = [i for i, text in enumerate(texts) if not text.isascii()]  # ASCII text is never Hebrew
     language_detector = ComponentFactory.get_language_detector()
-    language_and_confidence = language_detector.detect_language(s)
-    language = language_and_confidence[LANGUAGE]
+    language_records = language_detector.detect_many([texts[i] for i in non_ascii_positions])
+
+    for position, language_record in zip(non_ascii_positions, language_records):
+        is_hebrew[position] = language_record[LANGUAGE] == HEBREW_LANGUAGE_ABBREVIATION
 
-    return language == HEBREW_LANGUAGE_ABBREVIATION
+    return is_hebrew
 
 
 def get_similarity_score(s1: str, s2: str) -> float:
@@ -70,3 +79,8 @@ def binary_search(lst: list, value: Any) -> Tuple[bool, int]:
 
 def stringify_float(flt: float) -> str:
     return np.nan if pd.isna(flt) else str(int(flt))
+
+
+def stringify_floats(column: Series) -> Series:
+    integers = pd.to_numeric(column).astype('Int64')
+    return integers.astype(str).where(integers.notna(), np.nan)
@@ -2,7 +2,9 @@ import re
 from typing import List
 
 import numpy as np
+from pandas import Series
 
+from consts.language_consts import HEBREW_CHAR_REGEX
 from consts.miscellaneous_consts import YEAR_REGEX
 
 
@@ -19,5 +21,12 @@ def extract_year(date: str) -> int:
     return np.nan
 
 
+def extract_years(column: Series) -> Series:
+    unique_values = column.dropna().unique()
+    years = Series(unique_values).astype(str).str.extract(YEAR_REGEX, expand=False).astype(float)
+
+    return column.map(dict(zip(unique_values, years)))
+
+
 def contains_any_hebrew_character(s: str) -> bool:
-    return any("\u0590" <= char <= "\u05EA" for char in s)
+    return HEBREW_CHAR_REGEX.search(s) is not None
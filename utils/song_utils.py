@@ -0,0 +1,45 @@
+import re
+from typing import Optional
+
+from pandas import DataFrame, Series, CategoricalDtype
+from pandas.api.types import union_categoricals
+
+from consts.data_consts import SONG, REMASTER
+
+SONG_SEPARATOR = ' - '
+# The first separated component mentioning a remaster, e.g. `Artist - Song - 2011 Remaster`, and everything after it
+REMASTER_SUFFIX_REGEX = re.compile(rf'{SONG_SEPARATOR}(?:(?!{SONG_SEPARATOR}).)*{REMASTER}.*$', re.IGNORECASE)
+
+
+def build_songs(artists_names: Series, names: Series, normalize_remasters: bool = False) -> Series:
+    songs = artists_names.astype(str) + SONG_SEPARATOR + names.astype(str)
+    if normalize_remasters:
+        songs = remove_remaster_suffixes(songs)
+
+    return songs.astype('category')  # Each distinct song string is stored once, and rows hold its integer code
+
+
+def remove_remaster_suffixes(songs: Series, is_remastered: Optional[Series] = None) -> Series:
+    unique_songs = Series(songs.dropna().unique().astype(str))
+    normalized_songs = dict(zip(unique_songs, unique_songs.str.replace(REMASTER_SUFFIX_REGEX, '', regex=True)))
+    normalized = songs.astype(object).map(normalized_songs).where(songs.notna())
+
+    if is_remastered is None:
+        return normalized
+
+    return normalized.where(is_remastered.fillna(False).astype(bool), songs.astype(object))
+
+
+def merge_on_songs(left: DataFrame, right: DataFrame, how: str = 'left') -> DataFrame:
+    # Both sides share the same categories, so the join compares the songs integer codes
+    songs_categories = union_categoricals(
+        [left[SONG].astype('category'), right[SONG].astype('category')],
+        ignore_order=True
+    ).categories
+    songs_dtype = CategoricalDtype(songs_categories)
+
+    return left.assign(**{SONG: left[SONG].astype(songs_dtype)}).merge(
+        right=right.assign(**{SONG: right[SONG].astype(songs_dtype)}),
+        how=how,
+        on=SONG
+    )